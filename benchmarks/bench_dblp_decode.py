@@ -0,0 +1,130 @@
+# benchmarks/bench_dblp_decode.py
+"""
+Compare streamed and buffered decoding of DBLP search API responses.
+
+Each page is served from memory through httpx.MockTransport in 64 KiB chunks
+and decoded by DBLPSearcher._fetch_page, once with stream_json=True and once
+with stream_json=False. Reports peak traced memory and hits per second.
+
+Run with: uv run python benchmarks/bench_dblp_decode.py [--rounds N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from apaper.platforms.dblp import STREAM_CHUNK_SIZE, DBLPSearcher
+
+SIZES = (100, 500, 1000)
+
+
+def make_payload(count: int) -> bytes:
+    """Build a search API response with count realistic hits"""
+    hits = []
+    for i in range(count):
+        key = f"conf/crypto/Author{i:04d}"
+        hits.append(
+            {
+                "@score": "7",
+                "@id": str(1000000 + i),
+                "info": {
+                    "authors": {
+                        "author": [
+                            {"@pid": f"{i}/{j}", "text": f"Author {i}-{j}"}
+                            for j in range(4)
+                        ]
+                    },
+                    "title": f"Lattice-Based Construction Number {i} Revisited.",
+                    "venue": "CRYPTO",
+                    "pages": "1-30",
+                    "year": str(2000 + i % 25),
+                    "type": "Conference and Workshop Papers",
+                    "access": "closed",
+                    "key": key,
+                    "doi": f"10.1007/978-3-031-{i:05d}-1_1",
+                    "ee": f"https://doi.org/10.1007/978-3-031-{i:05d}-1_1",
+                    "url": f"https://dblp.org/rec/{key}",
+                },
+                "url": f"URL#{1000000 + i}",
+            }
+        )
+    data = {
+        "result": {
+            "query": "lattice*",
+            "status": {"@code": "200", "text": "OK"},
+            "time": {"@unit": "msecs", "text": "12.34"},
+            "completions": {"@total": "1", "c": {"@sc": "9", "text": "lattice"}},
+            "hits": {
+                "@total": str(count),
+                "@computed": str(count),
+                "@sent": str(count),
+                "@first": "0",
+                "hit": hits,
+            },
+        }
+    }
+    return json.dumps(data).encode()
+
+
+def make_searcher(payload: bytes, stream_json: bool) -> DBLPSearcher:
+    """Searcher whose client streams payload from memory"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chunks = (
+            payload[i : i + STREAM_CHUNK_SIZE]
+            for i in range(0, len(payload), STREAM_CHUNK_SIZE)
+        )
+        return httpx.Response(
+            200, headers={"Content-Type": "application/json"}, content=chunks
+        )
+
+    searcher = DBLPSearcher(mirrors=["https://dblp.test"], stream_json=stream_json)
+    searcher.client.close()
+    searcher.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return searcher
+
+
+def measure(searcher: DBLPSearcher, count: int, rounds: int) -> tuple[int, float]:
+    """Peak traced memory of one page and hits decoded per second"""
+    tracemalloc.start()
+    searcher._fetch_page("lattice", 0, count)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        searcher._fetch_page("lattice", 0, count)
+    elapsed = time.perf_counter() - start
+    return peak, count * rounds / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=50, help="pages per timing run")
+    args = parser.parse_args()
+
+    print(f"{'hits':>6} {'mode':>9} {'payload KiB':>12} {'peak KiB':>9} {'hits/s':>10}")
+    for count in SIZES:
+        payload = make_payload(count)
+        for stream_json in (False, True):
+            searcher = make_searcher(payload, stream_json)
+            try:
+                peak, rate = measure(searcher, count, args.rounds)
+            finally:
+                searcher.close()
+            mode = "streamed" if stream_json else "buffered"
+            print(
+                f"{count:>6} {mode:>9} {len(payload) / 1024:>12.0f}"
+                f" {peak / 1024:>9.0f} {rate:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -62,3 +62,30 @@ class Paper:
             "references": self.references,
             "extra": self.extra,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Paper":
+        """Create paper from the dictionary format produced by to_dict"""
+        published_date = data.get("published_date")
+        updated_date = data.get("updated_date")
+        return cls(
+            paper_id=data.get("paper_id", ""),
+            title=data.get("title", ""),
+            authors=list(data.get("authors") or []),
+            abstract=data.get("abstract", ""),
+            doi=data.get("doi", ""),
+            published_date=(
+                datetime.fromisoformat(published_date)
+                if published_date
+                else datetime(1900, 1, 1)
+            ),
+            pdf_url=data.get("pdf_url", ""),
+            url=data.get("url", ""),
+            source=data.get("source", ""),
+            updated_date=datetime.fromisoformat(updated_date) if updated_date else None,
+            categories=list(data.get("categories") or []),
+            keywords=list(data.get("keywords") or []),
+            citations=data.get("citations", 0),
+            references=list(data.get("references") or []),
+            extra=dict(data.get("extra") or {}),
+        )
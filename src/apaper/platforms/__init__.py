@@ -2,12 +2,19 @@
 
 from .base import PaperSource
 from .iacr import IACRSearcher
+from .iacr_mirror import IACRMirror
 from .dblp import DBLPSearcher
+from .dblp_index import DBLPIndex
+from .federated import FederatedResult, FederatedSearcher
 from .google_scholar import GoogleScholarSearcher
 
 __all__ = [
     "PaperSource",
     "IACRSearcher",
+    "IACRMirror",
     "DBLPSearcher",
+    "DBLPIndex",
+    "FederatedResult",
+    "FederatedSearcher",
     "GoogleScholarSearcher",
 ]
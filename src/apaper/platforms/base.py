@@ -1,5 +1,8 @@
 # apaper/platforms/base.py
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import Any
 
 from ..models.paper import Paper
 
@@ -12,6 +15,25 @@ class PaperSource(ABC):
         """Search for papers based on query"""
         raise NotImplementedError
 
+    def iter_search(self, query: str, *args: Any, **kwargs: Any) -> Iterator[Paper]:
+        """
+        Lazily search for papers based on query
+
+        Papers are yielded as soon as they are parsed, and no further network
+        or parse work is done once the consumer stops iterating. Sources
+        without a lazy implementation fall back to search().
+        """
+        yield from self.search(query, *args, **kwargs)
+
+    async def asearch(self, query: str, *args: Any, **kwargs: Any) -> list[Paper]:
+        """
+        Search for papers without blocking the event loop
+
+        Sources without a native async implementation run search() in a
+        worker thread.
+        """
+        return await asyncio.to_thread(self.search, query, *args, **kwargs)
+
     @abstractmethod
     def download_pdf(self, paper_id: str, save_path: str) -> str:
         """Download PDF of a paper"""
@@ -8,19 +8,83 @@ Reference: https://dblp.org/
 Based on: https://github.com/szeider/mcp-dblp
 """
 
+import asyncio
+import json
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
 from typing import Any
 
-import requests
+import httpx
 
 from ..models.paper import Paper
+from ..utils.cache import PersistentCache
+from ..utils.transport import RetryPolicy, create_client
+from .dblp_index import DBLPIndex, parse_person_records, record_to_result
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for all HTTP requests
 REQUEST_TIMEOUT = 10  # seconds
 
+# Official DBLP mirrors, in order of preference
+DBLP_MIRRORS = (
+    "https://dblp.org",
+    "https://dblp.uni-trier.de",
+    "https://dblp.dagstuhl.de",
+)
+
+# Smoothing factor of the per-mirror latency average
+LATENCY_ALPHA = 0.3
+
+# Seconds a failing mirror is skipped (doubled for each further failure)
+MIRROR_COOLDOWN = 30.0
+
+# Maximum number of hits DBLP returns for a single request
+MAX_HITS = 1000
+
+# Number of hits requested per page when paging through results
+PAGE_SIZE = MAX_HITS
+
+# Filtered searches examine at most this many hits per (sub-)query
+FILTER_BUDGET = 5000
+
+# Over-fetch factor for the first page of a filtered search that could not be
+# fully expressed in the DBLP query
+OVERFETCH_FACTOR = 4
+
+# Year ranges up to this many years are pushed into the query as year: terms
+MAX_YEAR_TERMS = 10
+
+# Number of BibTeX entries kept in memory
+BIBTEX_MEMORY_SIZE = 1024
+
+# Default connection pool limits for the shared DBLP client
+MAX_CONNECTIONS = 10
+MAX_KEEPALIVE_CONNECTIONS = 5
+KEEPALIVE_EXPIRY = 30.0  # seconds
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Search API responses are decoded from chunks of this many bytes
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Pages of at least this many hits are decoded from the stream by default;
+# smaller pages decode faster with response.json() and use about as much memory
+STREAM_MIN_HITS = 500
+
 # Headers for DBLP API requests
 HEADERS = {
     "User-Agent": "apaper/1.0 (https://github.com/jiahaoxiang2000/all-in-mcp)",
@@ -28,12 +92,265 @@ HEADERS = {
 }
 
 
+@dataclass
+class MirrorStats:
+    """Health and latency of one DBLP mirror"""
+
+    url: str
+    latency: float | None = None
+    failures: int = 0
+    down_until: float = 0.0
+
+    def record(self, elapsed: float, ok: bool) -> None:
+        """Fold one request into the latency average and health state"""
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency = LATENCY_ALPHA * elapsed + (1 - LATENCY_ALPHA) * self.latency
+        if ok:
+            self.failures = 0
+            self.down_until = 0.0
+        else:
+            cooldown = MIRROR_COOLDOWN * 2 ** min(self.failures, 5)
+            self.failures += 1
+            self.down_until = time.monotonic() + cooldown
+
+
+_HITS_OBJECT = re.compile(r'"hits"\s*:\s*\{')
+_HITS_TOTAL = re.compile(r'"@total"\s*:\s*"?(\d+)')
+_HIT_MEMBER = re.compile(r'"hit"\s*:\s*([\[{])')
+_SEPARATORS = re.compile(r"[\s,]*")
+_DECODER = json.JSONDecoder()
+
+
+class HitStream:
+    """
+    Incrementally decode the hits of a DBLP search API response.
+
+    The response is scanned for the "@total" count of the "hits" object, then
+    the members of its "hit" array are decoded one at a time as text chunks
+    arrive. Only the undecoded tail of the stream and the current hit are
+    held in memory; the rest of the response is never parsed.
+    """
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        """
+        Args:
+            chunks: Text chunks of the JSON response body
+        """
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self._pos = 0
+        self.total = 0
+        self._array = self._read_header()
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping everything already decoded."""
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _read_header(self) -> bool | None:
+        """
+        Read up to the start of the hit list and pick up the total count.
+
+        Returns True for a hit array, False for a single hit object and None
+        when the response has no hits.
+        """
+        while True:
+            hits = _HITS_OBJECT.search(self._buffer)
+            member = hits and _HIT_MEMBER.search(self._buffer, hits.end())
+            if hits and member:
+                total = _HITS_TOTAL.search(self._buffer, hits.end(), member.start())
+                self.total = int(total.group(1)) if total else 0
+                self._pos = member.end() - 1
+                if member.group(1) == "[":
+                    self._pos += 1
+                    return True
+                return False
+            if not self._fill():
+                total = hits and _HITS_TOTAL.search(self._buffer, hits.end())
+                self.total = int(total.group(1)) if total else 0
+                self._buffer = ""
+                return None
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if self._array is None:
+            return
+        while True:
+            separators = _SEPARATORS.match(self._buffer, self._pos)
+            self._pos = separators.end() if separators else self._pos
+            if self._pos >= len(self._buffer):
+                if not self._fill():
+                    raise ValueError("Truncated DBLP response")
+                continue
+            if self._array and self._buffer[self._pos] == "]":
+                return
+            try:
+                hit, self._pos = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The hit continues in the next chunk
+                if not self._fill():
+                    raise
+                continue
+            yield hit
+            if not self._array:
+                return
+
+
 class DBLPSearcher:
     """DBLP (https://dblp.org/) bibliography search and BibTeX export implementation."""
 
-    def __init__(self) -> None:
-        """Initialize the DBLP searcher."""
-        self.bibtex_buffer: dict[str, str] = {}
+    DBLP_BASE_URL = "https://dblp.org"
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        http2: bool | None = None,
+        max_workers: int = 8,
+        bibtex_cache: PersistentCache | None = None,
+        bibtex_memory_size: int = BIBTEX_MEMORY_SIZE,
+        page_size: int = PAGE_SIZE,
+        push_filters: bool = True,
+        filter_budget: int = FILTER_BUDGET,
+        index: DBLPIndex | None = None,
+        listing_cache: PersistentCache | None = None,
+        mirrors: Iterable[str] | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+        stream_json: bool | None = None,
+    ) -> None:
+        """
+        Initialize the DBLP searcher.
+
+        All requests go through one pooled keep-alive client, so a search and
+        the BibTeX fetches that follow it reuse the same connections. Requests
+        are sent to the fastest healthy mirror and fail over to the next one on
+        timeouts, connection errors and 5xx responses.
+
+        Args:
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Use HTTP/2 (default: when the h2 package is installed)
+            max_workers: Maximum number of OR sub-queries or BibTeX entries
+                fetched concurrently
+            bibtex_cache: Optional persistent cache for BibTeX entries
+            bibtex_memory_size: Maximum number of BibTeX entries kept in memory
+            page_size: Hits requested per page when paging (at most 1000)
+            push_filters: Translate year filters into DBLP query terms
+            filter_budget: Maximum number of hits examined per query to fill a
+                filtered result page
+            index: Optional local index built from the dblp.xml dump; searches
+                and BibTeX entries are served from it once it is populated
+            listing_cache: Optional persistent cache for author and venue
+                listings, refreshed incrementally once stale
+            mirrors: Base URLs of the DBLP mirrors to use (default: DBLP_MIRRORS)
+            timeout: Timeout in seconds for a request to a single mirror
+            stream_json: Decode search hits incrementally from the response
+                stream instead of parsing the whole response at once. This
+                lowers peak memory for large pages but decodes fewer hits per
+                second (default: stream pages of STREAM_MIN_HITS or more hits)
+        """
+        self.mirrors = [MirrorStats(url.rstrip("/")) for url in mirrors or DBLP_MIRRORS]
+        self._mirror_lock = threading.Lock()
+        self.timeout = timeout
+        self.stream_json = stream_json
+        self.index = index
+        self.listing_cache = listing_cache
+        self.page_size = min(max(1, page_size), MAX_HITS)
+        self.push_filters = push_filters
+        self.filter_budget = max(1, filter_budget)
+        self.max_workers = max(1, max_workers)
+        self.bibtex_cache = bibtex_cache
+        self.bibtex_memory_size = max(0, bibtex_memory_size)
+        self._bibtex_memory: OrderedDict[str, str] = OrderedDict()
+        self._bibtex_lock = threading.Lock()
+        if http2 is None:
+            http2 = HTTP2_AVAILABLE
+        # Failing over to the next mirror is the retry, so the transport
+        # does not repeat failed requests against the same mirror
+        self.client = create_client(
+            headers=HEADERS,
+            timeout=timeout,
+            retry=RetryPolicy(retries=0),
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and its connections."""
+        self.client.close()
+
+    def _ranked_mirrors(self) -> list[MirrorStats]:
+        """
+        Order the mirrors for the next request.
+
+        Healthy mirrors come first, fastest first. Mirrors without a latency
+        sample yet rank as fastest, so every mirror gets measured once.
+        """
+        now = time.monotonic()
+        with self._mirror_lock:
+            ranked = sorted(
+                enumerate(self.mirrors),
+                key=lambda item: (
+                    item[1].down_until > now,
+                    item[1].latency or 0.0,
+                    item[0],
+                ),
+            )
+        return [mirror for _, mirror in ranked]
+
+    def _request(
+        self, path: str, params: dict[str, Any] | None = None, stream: bool = False
+    ) -> httpx.Response:
+        """
+        GET a DBLP path from the fastest healthy mirror.
+
+        Timeouts, connection errors and 5xx responses fail over to the next
+        mirror. The last 5xx response is returned (or the last error raised)
+        when every mirror failed. With stream=True the body is not read and
+        the caller must close the response.
+        """
+        response = None
+        error: Exception | None = None
+        for mirror in self._ranked_mirrors():
+            start = time.monotonic()
+            try:
+                request = self.client.build_request(
+                    "GET", f"{mirror.url}{path}", params=params
+                )
+                response = self.client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                self._record_mirror(mirror, time.monotonic() - start, ok=False)
+                logger.warning(f"DBLP mirror {mirror.url} failed: {e!r}")
+                error = e
+                continue
+
+            ok = response.status_code < 500
+            self._record_mirror(mirror, time.monotonic() - start, ok=ok)
+            if ok:
+                return response
+            logger.warning(
+                f"DBLP mirror {mirror.url} returned status {response.status_code}"
+            )
+            if stream:
+                response.close()
+
+        if response is None:
+            raise error or RuntimeError("No DBLP mirror configured")
+        return response
+
+    def _record_mirror(self, mirror: MirrorStats, elapsed: float, ok: bool) -> None:
+        """Update the latency and health of a mirror."""
+        with self._mirror_lock:
+            mirror.record(elapsed, ok)
 
     def search(
         self,
@@ -43,6 +360,7 @@ class DBLPSearcher:
         year_to: int | None = None,
         venue_filter: str | None = None,
         include_bibtex: bool = False,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
         """
         Search DBLP for publications.
@@ -54,178 +372,606 @@ class DBLPSearcher:
             year_to: Upper bound for publication year
             venue_filter: Case-insensitive substring filter for venues
             include_bibtex: Whether to include BibTeX entries in results
+            offset: Number of leading results to skip, for paging through results
 
         Returns:
             List of publication dictionaries with title, authors, venue, year, etc.
         """
+        results = self._iter_results(
+            query, max_results, year_from, year_to, venue_filter, max(0, offset)
+        )
+        try:
+            filtered_results = list(islice(results, max_results))
+        finally:
+            results.close()
+
+        # Fetch BibTeX entries if requested
+        if include_bibtex:
+            keys = [r["dblp_key"] for r in filtered_results if r.get("dblp_key")]
+            entries = self.fetch_bibtex_entries(keys)
+            return [
+                {"bibtex": entries[key], "dblp_key": key}
+                for key in keys
+                if entries[key]
+            ]
+
+        return filtered_results
+
+    async def asearch(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:
+        """
+        Search DBLP without blocking the event loop
+
+        Runs search() in a worker thread and takes the same arguments.
+
+        Returns:
+            List of publication dictionaries, as returned by search()
+        """
+        return await asyncio.to_thread(self.search, query, **kwargs)
+
+    def _iter_results(
+        self,
+        query: str,
+        max_results: int | None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        venue_filter: str | None = None,
+        offset: int = 0,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield filtered publications in per-query rank order, skipping offset"""
+        local = self._search_index(
+            query, max_results, year_from, year_to, venue_filter, offset
+        )
+        if local is not None:
+            yield from local
+            return
+
+        filtered = bool(year_from or year_to or venue_filter)
+        if " or " not in query.lower() and not filtered:
+            # Plain queries start paging at the requested offset directly
+            yield from self._iter_publications(query, max_results, offset)
+            return
+
+        limit = None if max_results is None else offset + max_results
+        results = self._iter_matching(query, limit, year_from, year_to, venue_filter)
+        try:
+            yield from islice(results, offset, None)
+        finally:
+            results.close()
+
+    def _search_index(
+        self,
+        query: str,
+        max_results: int | None,
+        year_from: int | None,
+        year_to: int | None,
+        venue_filter: str | None,
+        offset: int,
+    ) -> list[dict[str, Any]] | None:
+        """Search the local index, or return None to search online"""
+        if self.index is None:
+            return None
+        try:
+            if not self.index.is_populated():
+                return None
+            return self.index.search(
+                query,
+                max_results=max_results,
+                year_from=year_from,
+                year_to=year_to,
+                venue_filter=venue_filter,
+                offset=offset,
+            )
+        except Exception as e:
+            logger.warning(f"DBLP index search failed, searching online: {e}")
+            return None
+
+    def _iter_matching(
+        self,
+        query: str,
+        max_results: int | None,
+        year_from: int | None,
+        year_to: int | None,
+        venue_filter: str | None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield publications matching the filters, merging OR sub-queries"""
         query_lower = query.lower()
-        results = []
 
         # Handle OR queries
         if " or " in query_lower:
             subqueries = [q.strip() for q in query_lower.split(" or ") if q.strip()]
             seen = set()
-            for q in subqueries:
-                for pub in self._fetch_publications(q, max_results):
+            for publications in self._iter_subqueries(
+                subqueries, max_results, year_from, year_to, venue_filter
+            ):
+                for pub in publications:
                     identifier = (pub.get("title"), pub.get("year"))
-                    if identifier not in seen:
-                        results.append(pub)
-                        seen.add(identifier)
+                    if identifier in seen:
+                        continue
+                    seen.add(identifier)
+                    yield pub
         else:
-            results = self._fetch_publications(query, max_results)
-
-        # Apply filters
-        filtered_results = []
-        for result in results:
-            # Year filter
-            if year_from or year_to:
-                year = result.get("year")
-                if year:
-                    try:
-                        year = int(year)
-                        if (year_from and year < year_from) or (
-                            year_to and year > year_to
-                        ):
-                            continue
-                    except (ValueError, TypeError):
-                        pass
-
-            # Venue filter
-            if venue_filter:
-                venue = result.get("venue", "")
-                if venue_filter.lower() not in venue.lower():
-                    continue
-
-            filtered_results.append(result)
-
-        filtered_results = filtered_results[:max_results]
+            yield from self._iter_query(
+                query, max_results, year_from, year_to, venue_filter
+            )
 
-        # Fetch BibTeX entries if requested
-        if include_bibtex:
-            bibtex_results = []
-            for result in filtered_results:
-                if "dblp_key" in result and result["dblp_key"]:
-                    bibtex = self.fetch_bibtex_entry(result["dblp_key"])
-                    if bibtex:
-                        bibtex_results.append(
-                            {"bibtex": bibtex, "dblp_key": result["dblp_key"]}
-                        )
-            return bibtex_results
+    def _iter_subqueries(
+        self,
+        subqueries: list[str],
+        max_results: int | None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        venue_filter: str | None = None,
+    ) -> Iterator[Iterable[dict[str, Any]]]:
+        """
+        Run OR sub-queries concurrently and yield their results in query order.
 
-        return filtered_results
+        Results of a sub-query are yielded as soon as it and all earlier ones
+        have finished. Sub-queries that have not started yet are cancelled when
+        the consumer stops early. Without max_results, every sub-query could
+        have any number of hits, so they are paged lazily one after another
+        instead.
+        """
+        filters = (year_from, year_to, venue_filter)
+        if max_results is None:
+            for q in subqueries:
+                publications = self._iter_query(q, None, *filters)
+                try:
+                    yield publications
+                finally:
+                    publications.close()
+            return
+
+        workers = min(self.max_workers, len(subqueries))
+        if workers <= 1:
+            for q in subqueries:
+                yield self._fetch_publications(q, max_results, *filters)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(self._fetch_publications, q, max_results, *filters)
+                for q in subqueries
+            ]
+            for future in futures:
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_query(
+        self,
+        single_query: str,
+        max_results: int | None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        venue_filter: str | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield up to max_results publications of one query that match the filters"""
+        if not (year_from or year_to or venue_filter):
+            yield from self._iter_publications(single_query, max_results)
+            return
+
+        filtered_query, exact = self._push_filters(
+            single_query, year_from, year_to, venue_filter
+        )
+        yield from self._iter_filtered_publications(
+            filtered_query, max_results, year_from, year_to, venue_filter, exact
+        )
+
+    def _push_filters(
+        self,
+        query: str,
+        year_from: int | None,
+        year_to: int | None,
+        venue_filter: str | None,
+    ) -> tuple[str, bool]:
+        """
+        Translate the filters into DBLP query terms where possible.
+
+        Returns:
+            The query with filter terms added, and whether every filter could be
+            expressed in it
+        """
+        if not self.push_filters:
+            return query, False
+
+        terms = [query]
+        exact = True
+
+        # Bounded year ranges become year:YYYY: terms joined with DBLP's | operator
+        if year_from or year_to:
+            upper = year_to or datetime.now().year
+            if year_from and 0 <= upper - year_from < MAX_YEAR_TERMS:
+                terms.append(
+                    "|".join(f"year:{y}:" for y in range(year_from, upper + 1))
+                )
+            else:
+                exact = False
+
+        # DBLP matches venue: terms against the beginning of venue words, which
+        # would drop substring matches ('crypt' in EUROCRYPT) before the local
+        # filter sees them, so venues are only filtered locally
+        if venue_filter:
+            exact = False
+
+        return " ".join(terms), exact
+
+    def _iter_filtered_publications(
+        self,
+        single_query: str,
+        quota: int | None,
+        year_from: int | None,
+        year_to: int | None,
+        venue_filter: str | None,
+        exact: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Page through hits until quota of them match the filters.
+
+        Page sizes adapt to the share of hits that matched so far, and paging
+        stops once the filter budget of examined hits is spent.
+        """
+        if quota is not None and quota <= 0:
+            return
+
+        if quota is None:
+            count = self.page_size
+        else:
+            count = min(self.page_size, quota * (1 if exact else OVERFETCH_FACTOR))
+        offset = examined = matched = 0
+        while True:
+            count = min(count, self.filter_budget - examined)
+            try:
+                total, publications = self._fetch_page(single_query, offset, count)
+            except Exception as e:
+                yield self._error_result(single_query, e)
+                return
+
+            if offset == 0:
+                logger.info(f"Found {total} results for query: {single_query}")
+            for pub in publications:
+                if self._matches_filters(pub, year_from, year_to, venue_filter):
+                    matched += 1
+                    yield pub
+
+            offset += len(publications)
+            examined += len(publications)
+            if (
+                len(publications) < count
+                or offset >= total
+                or examined >= self.filter_budget
+            ):
+                return
+
+            # Size the next page from the observed match rate
+            if quota is None:
+                count = self.page_size
+            else:
+                needed = quota - matched
+                if matched:
+                    count = int(needed * examined / matched * 1.25) + 1
+                else:
+                    count *= OVERFETCH_FACTOR
+                count = min(self.page_size, max(needed, count))
+
+    def _matches_filters(
+        self,
+        result: dict[str, Any],
+        year_from: int | None,
+        year_to: int | None,
+        venue_filter: str | None,
+    ) -> bool:
+        """Apply the year and venue filters to a single result"""
+        # Year filter
+        if year_from or year_to:
+            year = result.get("year")
+            if year:
+                try:
+                    year = int(year)
+                    if (year_from and year < year_from) or (year_to and year > year_to):
+                        return False
+                except (ValueError, TypeError):
+                    pass
+
+        # Venue filter
+        if venue_filter:
+            venue = result.get("venue", "")
+            if venue_filter.lower() not in venue.lower():
+                return False
+
+        return True
 
     def _fetch_publications(
-        self, single_query: str, max_results: int
+        self,
+        single_query: str,
+        max_results: int | None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        venue_filter: str | None = None,
     ) -> list[dict[str, Any]]:
         """Fetch publications for a single query string."""
-        results = []
+        return list(
+            self._iter_query(
+                single_query, max_results, year_from, year_to, venue_filter
+            )
+        )
+
+    def _iter_publications(
+        self, single_query: str, max_results: int | None, offset: int = 0
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream publications for a single query, paging with DBLP's f= offset.
+
+        The next page is requested in the background while the current one is
+        consumed. Paging stops at max_results hits (None for all hits).
+        """
+        if max_results is not None and max_results <= 0:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
         try:
-            url = "https://dblp.org/search/publ/api"
-            params = {"q": single_query, "format": "json", "h": max_results}
-            response = requests.get(
-                url, params=params, headers=HEADERS, timeout=REQUEST_TIMEOUT
+            remaining = max_results
+            count = self._page_count(remaining)
+            future: Future[tuple[int, list[dict[str, Any]]]] | None = executor.submit(
+                self._fetch_page, single_query, offset, count
             )
+            first_page = True
+            while future is not None:
+                try:
+                    total, publications = future.result()
+                except Exception as e:
+                    yield self._error_result(single_query, e)
+                    return
+
+                if first_page:
+                    logger.info(f"Found {total} results for query: {single_query}")
+                    first_page = False
+
+                # Prefetch the next page before handing out this one
+                offset += len(publications)
+                if remaining is not None:
+                    remaining -= len(publications)
+                future = None
+                if (
+                    len(publications) == count
+                    and offset < total
+                    and (remaining is None or remaining > 0)
+                ):
+                    count = self._page_count(remaining)
+                    future = executor.submit(
+                        self._fetch_page, single_query, offset, count
+                    )
+
+                yield from publications
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _error_result(self, single_query: str, error: Exception) -> dict[str, Any]:
+        """Describe a failed request as a result entry"""
+        if isinstance(error, httpx.TimeoutException):
+            logger.error(f"Timeout error searching DBLP after {self.timeout} seconds")
+            return {
+                "title": f"ERROR: Query '{single_query}' timed out after {self.timeout} seconds",
+                "authors": [],
+                "venue": "Error",
+                "year": None,
+                "error": f"Timeout after {self.timeout} seconds",
+            }
+        logger.error(f"Error searching DBLP: {error}")
+        return {
+            "title": f"ERROR: DBLP API error for query '{single_query}': {error!s}",
+            "authors": [],
+            "venue": "Error",
+            "year": None,
+            "error": str(error),
+        }
+
+    def _page_count(self, remaining: int | None) -> int:
+        """Number of hits to request for the next page"""
+        if remaining is None:
+            return self.page_size
+        return min(self.page_size, remaining)
+
+    def _fetch_page(
+        self, single_query: str, offset: int, count: int
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Request one page of hits, returning the total hit count and the page"""
+        params = {"q": single_query, "format": "json", "h": count, "f": offset}
+        stream = self.stream_json
+        if stream is None:
+            stream = count >= STREAM_MIN_HITS
+        response = self._request("/search/publ/api", params, stream=stream)
+        try:
             response.raise_for_status()
+            if stream:
+                hits = HitStream(response.iter_text(STREAM_CHUNK_SIZE))
+                publications = [self._parse_hit(hit) for hit in hits]
+                return hits.total, publications
             data = response.json()
+        finally:
+            response.close()
 
-            hits = data.get("result", {}).get("hits", {})
-            total = int(hits.get("@total", "0"))
-            logger.info(f"Found {total} results for query: {single_query}")
+        hits = data.get("result", {}).get("hits", {})
+        total = int(hits.get("@total", "0"))
+        publications = hits.get("hit", []) if total > 0 else []
+        if not isinstance(publications, list):
+            publications = [publications]
+        return total, [self._parse_hit(pub) for pub in publications]
 
-            if total > 0:
-                publications = hits.get("hit", [])
-                if not isinstance(publications, list):
-                    publications = [publications]
+    def _parse_hit(self, pub: dict[str, Any]) -> dict[str, Any]:
+        """Convert a DBLP search hit into a publication dictionary."""
+        info = pub.get("info", {})
 
-                for pub in publications:
-                    info = pub.get("info", {})
-
-                    # Extract authors
-                    authors = []
-                    authors_data = info.get("authors", {}).get("author", [])
-                    if not isinstance(authors_data, list):
-                        authors_data = [authors_data]
-                    for author in authors_data:
-                        if isinstance(author, dict):
-                            authors.append(author.get("text", ""))
-                        else:
-                            authors.append(str(author))
-
-                    # Extract DBLP key
-                    dblp_url = info.get("url", "")
-                    dblp_key = ""
-                    if dblp_url:
-                        dblp_key = dblp_url.replace("https://dblp.org/rec/", "")
-                    elif "key" in pub:
-                        dblp_key = pub.get("key", "").replace("dblp:", "")
-                    else:
-                        dblp_key = pub.get("@id", "").replace("dblp:", "")
-
-                    result = {
-                        "title": info.get("title", ""),
-                        "authors": authors,
-                        "venue": info.get("venue", ""),
-                        "year": int(info.get("year", 0)) if info.get("year") else None,
-                        "type": info.get("type", ""),
-                        "doi": info.get("doi", ""),
-                        "ee": info.get("ee", ""),
-                        "url": info.get("url", ""),
-                        "dblp_key": dblp_key,
-                    }
-                    results.append(result)
-
-        except requests.exceptions.Timeout:
-            logger.error(
-                f"Timeout error searching DBLP after {REQUEST_TIMEOUT} seconds"
-            )
-            results.append(
-                {
-                    "title": f"ERROR: Query '{single_query}' timed out after {REQUEST_TIMEOUT} seconds",
-                    "authors": [],
-                    "venue": "Error",
-                    "year": None,
-                    "error": f"Timeout after {REQUEST_TIMEOUT} seconds",
-                }
-            )
-        except Exception as e:
-            logger.error(f"Error searching DBLP: {e}")
-            results.append(
-                {
-                    "title": f"ERROR: DBLP API error for query '{single_query}': {str(e)}",
-                    "authors": [],
-                    "venue": "Error",
-                    "year": None,
-                    "error": str(e),
-                }
-            )
+        # Extract authors
+        authors = []
+        authors_data = info.get("authors", {}).get("author", [])
+        if not isinstance(authors_data, list):
+            authors_data = [authors_data]
+        for author in authors_data:
+            if isinstance(author, dict):
+                authors.append(author.get("text", ""))
+            else:
+                authors.append(str(author))
+
+        # Extract DBLP key
+        dblp_url = info.get("url", "")
+        dblp_key = ""
+        if dblp_url:
+            dblp_key = dblp_url.replace("https://dblp.org/rec/", "")
+        elif "key" in pub:
+            dblp_key = pub.get("key", "").replace("dblp:", "")
+        else:
+            dblp_key = pub.get("@id", "").replace("dblp:", "")
 
-        return results
+        return {
+            "title": info.get("title", ""),
+            "authors": authors,
+            "venue": info.get("venue", ""),
+            "year": int(info.get("year", 0)) if info.get("year") else None,
+            "type": info.get("type", ""),
+            "doi": info.get("doi", ""),
+            "ee": info.get("ee", ""),
+            "url": info.get("url", ""),
+            "dblp_key": dblp_key,
+        }
 
     def fetch_bibtex_entry(self, dblp_key: str) -> str:
         """
         Fetch BibTeX entry from DBLP by key.
 
+        Entries are served from the in-memory and persistent BibTeX caches
+        when present.
+
         Args:
             dblp_key: DBLP publication key (e.g., 'conf/nips/VaswaniSPUJGKP17')
 
         Returns:
             BibTeX entry string, or empty string if not found
         """
+        key = self._normalize_key(dblp_key)
+        if not key:
+            logger.warning("Empty or invalid DBLP key provided")
+            return ""
+
+        cached = self._get_cached_bibtex(key)
+        if cached is not None:
+            return cached
+
+        bibtex = self._render_local_bibtex(key)
+        if bibtex:
+            return bibtex
+
+        bibtex = self._download_bibtex(key)
+        if bibtex and not bibtex.startswith("% Error"):
+            self._store_bibtex(key, bibtex)
+        return bibtex
+
+    def fetch_bibtex_entries(self, dblp_keys: Iterable[str]) -> dict[str, str]:
+        """
+        Fetch BibTeX entries for several DBLP keys.
+
+        Cached entries are returned directly and the remaining keys are
+        fetched concurrently.
+
+        Args:
+            dblp_keys: DBLP publication keys
+
+        Returns:
+            Mapping of each given key to its BibTeX entry (empty string if not found)
+        """
+        keys = list(dict.fromkeys(dblp_keys))
+        entries: dict[str, str] = {}
+        missing = []
+        for key in keys:
+            cached = self._get_cached_bibtex(self._normalize_key(key))
+            if cached is not None:
+                entries[key] = cached
+            else:
+                missing.append(key)
+
+        workers = min(self.max_workers, len(missing))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = executor.map(self.fetch_bibtex_entry, missing)
+                entries.update(zip(missing, fetched, strict=True))
+        else:
+            for key in missing:
+                entries[key] = self.fetch_bibtex_entry(key)
+
+        return {key: entries[key] for key in keys}
+
+    def _render_local_bibtex(self, key: str) -> str:
+        """Render a BibTeX entry from the local index, if it has the key."""
+        if self.index is None:
+            return ""
         try:
-            if not dblp_key or dblp_key.isspace():
-                logger.warning("Empty or invalid DBLP key provided")
+            if not self.index.is_populated():
                 return ""
+            return self.index.render_bibtex(key)
+        except Exception as e:
+            logger.warning(f"DBLP index BibTeX lookup failed for {key}: {e}")
+            return ""
+
+    def _normalize_key(self, dblp_key: str) -> str:
+        """Reduce the accepted key spellings to the bare DBLP key."""
+        key = (dblp_key or "").strip()
+        for base_url in [self.DBLP_BASE_URL, *(m.url for m in self.mirrors)]:
+            prefix = f"{base_url}/rec/"
+            if key.startswith(prefix):
+                key = key[len(prefix) :]
+        if key[:5].lower() == "dblp:":
+            key = key[5:]
+        for suffix in (".bib", ".html", ".xml"):
+            if key.endswith(suffix):
+                key = key[: -len(suffix)]
+        return key.strip("/")
 
+    def _get_cached_bibtex(self, key: str) -> str | None:
+        """Return a cached BibTeX entry, promoting disk hits into memory."""
+        if not key:
+            return None
+        with self._bibtex_lock:
+            bibtex = self._bibtex_memory.get(key)
+            if bibtex is not None:
+                self._bibtex_memory.move_to_end(key)
+                return bibtex
+
+        if self.bibtex_cache is not None:
+            entry = self.bibtex_cache.get(key)
+            if entry is not None and self.bibtex_cache.is_fresh(entry):
+                self._remember_bibtex(key, entry.value)
+                return str(entry.value)
+        return None
+
+    def _store_bibtex(self, key: str, bibtex: str) -> None:
+        """Add a BibTeX entry to the memory and persistent caches."""
+        self._remember_bibtex(key, bibtex)
+        if self.bibtex_cache is not None:
+            self.bibtex_cache.set(key, bibtex)
+
+    def _remember_bibtex(self, key: str, bibtex: str) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entries."""
+        if self.bibtex_memory_size == 0:
+            return
+        with self._bibtex_lock:
+            self._bibtex_memory[key] = bibtex
+            self._bibtex_memory.move_to_end(key)
+            while len(self._bibtex_memory) > self.bibtex_memory_size:
+                self._bibtex_memory.popitem(last=False)
+
+    def _download_bibtex(self, dblp_key: str) -> str:
+        """Request the BibTeX entry for a normalized key from DBLP."""
+        try:
             # Try multiple URL formats
-            urls_to_try = [f"https://dblp.org/rec/{dblp_key}.bib"]
+            paths_to_try = [f"/rec/{dblp_key}.bib"]
 
             if ":" in dblp_key:
                 clean_key = dblp_key.replace(":", "/")
-                urls_to_try.append(f"https://dblp.org/rec/{clean_key}.bib")
+                paths_to_try.append(f"/rec/{clean_key}.bib")
 
-            for url in urls_to_try:
-                logger.info(f"Fetching BibTeX from: {url}")
-                response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+            for path in paths_to_try:
+                logger.info(f"Fetching BibTeX from: {path}")
+                response = self._request(path)
 
                 if response.status_code == 200:
                     bibtex = response.text
@@ -236,14 +982,242 @@ class DBLPSearcher:
             logger.warning(f"Failed to fetch BibTeX for key: {dblp_key}")
             return ""
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error(
-                f"Timeout fetching BibTeX for {dblp_key} after {REQUEST_TIMEOUT} seconds"
+                f"Timeout fetching BibTeX for {dblp_key} after {self.timeout} seconds"
             )
             return f"% Error: Timeout fetching BibTeX for {dblp_key}"
         except Exception as e:
-            logger.error(f"Error fetching BibTeX for {dblp_key}: {str(e)}")
-            return f"% Error: {str(e)}"
+            logger.error(f"Error fetching BibTeX for {dblp_key}: {e!s}")
+            return f"% Error: {e!s}"
+
+    def get_author_publications(
+        self,
+        author: str,
+        max_results: int | None = None,
+        offset: int = 0,
+        refresh: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        List the publications of an author from their DBLP profile.
+
+        The first call downloads the complete profile. Later calls are served
+        from the listing cache; once it is stale (or with refresh) only records
+        from the most recent cached year onwards are requested and merged in.
+
+        Args:
+            author: Author name or DBLP person ID (e.g. '57/2385')
+            max_results: Maximum number of publications to return (None for all)
+            offset: Number of leading publications to skip
+            refresh: Check for new publications even if the cache is fresh
+
+        Returns:
+            List of publication dictionaries, newest first
+        """
+        pid = self.resolve_author(author)
+        if not pid:
+            logger.warning(f"No DBLP author found for: {author}")
+            return []
+
+        cache_key = f"author:{pid}"
+        entry = self._get_listing(cache_key, refresh)
+        if entry is not None and entry.get("fresh"):
+            records = entry["records"]
+        else:
+            try:
+                if entry is None or not entry.get("name"):
+                    name, records = self._fetch_author_profile(pid)
+                else:
+                    name = entry["name"]
+                    query = f"author:{name.replace(' ', '_')}:"
+                    records = self._refresh_listing(query, entry["records"])
+            except Exception as e:
+                logger.error(f"Error fetching DBLP author profile {pid}: {e}")
+                return [self._error_result(f"author:{pid}", e)]
+            self._store_listing(cache_key, records, name=name)
+
+        return self._page(records, max_results, offset)
+
+    def get_venue_publications(
+        self,
+        venue: str,
+        year: int | None = None,
+        max_results: int | None = None,
+        offset: int = 0,
+        refresh: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        List the publications of a venue (its table of contents).
+
+        The first call pages through the whole venue stream. Later calls are
+        served from the listing cache; once it is stale (or with refresh) only
+        records from the most recent cached year onwards are requested.
+
+        Args:
+            venue: Venue name or DBLP venue key (e.g. 'conf/crypto', 'journals/joc')
+            year: Only list publications of this year
+            max_results: Maximum number of publications to return (None for all)
+            offset: Number of leading publications to skip
+            refresh: Check for new publications even if the cache is fresh
+
+        Returns:
+            List of publication dictionaries, newest first
+        """
+        venue_key = self.resolve_venue(venue)
+        if not venue_key:
+            logger.warning(f"No DBLP venue found for: {venue}")
+            return []
+
+        cache_key = f"venue:{venue_key}:{year or 'all'}"
+        query = f"stream:streams/{venue_key}:"
+        if year:
+            query += f" year:{year}:"
+        entry = self._get_listing(cache_key, refresh)
+        if entry is not None and entry.get("fresh"):
+            records = entry["records"]
+        else:
+            previous = entry["records"] if entry is not None else []
+            try:
+                records = (
+                    self._refresh_listing(query, previous)
+                    if previous and not year
+                    else self._fetch_listing(query)
+                )
+            except Exception as e:
+                logger.error(f"Error fetching DBLP venue listing {venue_key}: {e}")
+                return [self._error_result(query, e)]
+            self._store_listing(cache_key, records)
+
+        return self._page(records, max_results, offset)
+
+    def resolve_author(self, author: str) -> str:
+        """
+        Resolve an author name to a DBLP person ID.
+
+        Person IDs (e.g. '57/2385') are returned unchanged. Names are looked
+        up with the author search API, preferring an exact name match.
+        """
+        author = author.strip()
+        if re.fullmatch(r"[\w-]+/[\w-]+", author):
+            return author
+        return self._resolve("author", author, "/pid/")
+
+    def resolve_venue(self, venue: str) -> str:
+        """
+        Resolve a venue name to a DBLP venue key such as 'conf/crypto'.
+
+        Venue keys are returned unchanged. Names are looked up with the venue
+        search API, preferring an exact name or acronym match.
+        """
+        venue = venue.strip().strip("/")
+        if re.fullmatch(r"(conf|journals|series|books|reference)/[\w-]+", venue):
+            return venue
+        return self._resolve("venue", venue, "/db/")
+
+    def _resolve(self, kind: str, name: str, marker: str) -> str:
+        """Look a name up with the author or venue search API."""
+        if not name:
+            return ""
+        cache_key = f"{kind}-id:{name.lower()}"
+        if self.listing_cache is not None:
+            entry = self.listing_cache.get(cache_key)
+            if entry is not None:
+                return str(entry.value)
+
+        try:
+            response = self._request(
+                f"/search/{kind}/api", params={"q": name, "format": "json", "h": 10}
+            )
+            response.raise_for_status()
+            hits = response.json().get("result", {}).get("hits", {}).get("hit", [])
+        except Exception as e:
+            logger.error(f"Error resolving DBLP {kind} {name}: {e}")
+            return ""
+        if not isinstance(hits, list):
+            hits = [hits]
+
+        resolved = ""
+        for hit in hits:
+            info = hit.get("info", {})
+            url = info.get("url", "")
+            if marker not in url:
+                continue
+            identifier = url.split(marker, 1)[1].strip("/")
+            labels = {info.get(kind, ""), info.get("acronym", "")}
+            if name.lower() in {label.lower() for label in labels if label}:
+                resolved = identifier
+                break
+            resolved = resolved or identifier
+
+        if resolved and self.listing_cache is not None:
+            self.listing_cache.set(cache_key, resolved)
+        return resolved
+
+    def _fetch_author_profile(self, pid: str) -> tuple[str, list[dict[str, Any]]]:
+        """Download an author's complete profile from the person API."""
+        response = self._request(f"/pid/{pid}.xml")
+        response.raise_for_status()
+        name, records = parse_person_records(response.content)
+        return name, self._sort_listing([record_to_result(r) for r in records])
+
+    def _fetch_listing(self, query: str) -> list[dict[str, Any]]:
+        """Page through every hit of a search query."""
+        results = []
+        for result in self._iter_publications(query, None):
+            if result.get("error"):
+                raise RuntimeError(result["error"])
+            results.append(result)
+        return self._sort_listing(results)
+
+    def _refresh_listing(
+        self, query: str, records: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Fetch records from the newest cached year onwards and merge them in."""
+        years = [r["year"] for r in records if r.get("year")]
+        if not years:
+            return self._fetch_listing(query)
+
+        since = max(years)
+        until = max(since, datetime.now().year)
+        year_terms = "|".join(f"year:{y}:" for y in range(since, until + 1))
+        new_records = self._fetch_listing(f"{query} {year_terms}")
+        logger.info(
+            f"Refreshed DBLP listing {query}: {len(new_records)} records since {since}"
+        )
+
+        merged = {r["dblp_key"]: r for r in records}
+        merged.update((r["dblp_key"], r) for r in new_records)
+        return self._sort_listing(list(merged.values()))
+
+    def _get_listing(self, cache_key: str, refresh: bool) -> dict[str, Any] | None:
+        """Return a cached listing, marking whether it can be served as is."""
+        if self.listing_cache is None:
+            return None
+        entry = self.listing_cache.get(cache_key)
+        if entry is None:
+            return None
+        listing = dict(entry.value)
+        listing["fresh"] = not refresh and self.listing_cache.is_fresh(entry)
+        return listing
+
+    def _store_listing(
+        self, cache_key: str, records: list[dict[str, Any]], **extra: Any
+    ) -> None:
+        """Save a listing to the listing cache."""
+        if self.listing_cache is not None:
+            self.listing_cache.set(cache_key, {"records": records, **extra})
+
+    def _sort_listing(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Order a listing newest first, keeping the source order within a year."""
+        return sorted(records, key=lambda r: -(r.get("year") or 0))
+
+    def _page(
+        self, records: list[dict[str, Any]], max_results: int | None, offset: int
+    ) -> list[dict[str, Any]]:
+        """Slice one page out of a listing."""
+        offset = max(0, offset)
+        end = None if max_results is None else offset + max_results
+        return records[offset:end]
 
     def search_to_papers(
         self,
@@ -268,8 +1242,6 @@ class DBLPSearcher:
         Returns:
             List of Paper objects
         """
-        from datetime import datetime
-
         results = self.search(
             query,
             max_results=max_results,
@@ -278,34 +1250,67 @@ class DBLPSearcher:
             venue_filter=venue_filter,
             include_bibtex=False,
         )
+        return [self._result_to_paper(r) for r in results if not r.get("error")]
 
-        papers = []
-        for result in results:
-            if result.get("error"):
-                continue
+    def iter_search(
+        self,
+        query: str,
+        max_results: int | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        venue_filter: str | None = None,
+        offset: int = 0,
+    ) -> Iterator[Paper]:
+        """
+        Lazily search DBLP and yield results as Paper objects.
 
-            year = result.get("year")
-            published_date = datetime(year, 1, 1) if year else datetime(1900, 1, 1)
-
-            paper = Paper(
-                paper_id=result.get("dblp_key", ""),
-                title=result.get("title", ""),
-                authors=result.get("authors", []),
-                abstract="",  # DBLP doesn't provide abstracts
-                url=result.get("url", ""),
-                pdf_url=result.get("ee", ""),  # Electronic edition URL
-                published_date=published_date,
-                updated_date=None,
-                source="dblp",
-                categories=[result.get("type", "")] if result.get("type") else [],
-                keywords=[],
-                doi=result.get("doi", ""),
-                citations=0,
-                extra={
-                    "venue": result.get("venue", ""),
-                    "dblp_key": result.get("dblp_key", ""),
-                },
-            )
-            papers.append(paper)
+        Hits are fetched page by page, with the next page requested while the
+        current one is consumed. The sub-queries of an OR query run
+        concurrently, and work not yet started is cancelled when the iterator
+        is closed.
 
-        return papers
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to yield (None for all results)
+            year_from: Lower bound for publication year
+            year_to: Upper bound for publication year
+            venue_filter: Case-insensitive substring filter for venues
+            offset: Number of leading results to skip
+
+        Yields:
+            Paper objects in result order
+        """
+        results = self._iter_results(
+            query, max_results, year_from, year_to, venue_filter, max(0, offset)
+        )
+        try:
+            for result in islice(results, max_results):
+                if not result.get("error"):
+                    yield self._result_to_paper(result)
+        finally:
+            results.close()
+
+    def _result_to_paper(self, result: dict[str, Any]) -> Paper:
+        """Convert a publication dictionary into a Paper."""
+        year = result.get("year")
+        published_date = datetime(year, 1, 1) if year else datetime(1900, 1, 1)
+
+        return Paper(
+            paper_id=result.get("dblp_key", ""),
+            title=result.get("title", ""),
+            authors=result.get("authors", []),
+            abstract="",  # DBLP doesn't provide abstracts
+            url=result.get("url", ""),
+            pdf_url=result.get("ee", ""),  # Electronic edition URL
+            published_date=published_date,
+            updated_date=None,
+            source="dblp",
+            categories=[result.get("type", "")] if result.get("type") else [],
+            keywords=[],
+            doi=result.get("doi", ""),
+            citations=0,
+            extra={
+                "venue": result.get("venue", ""),
+                "dblp_key": result.get("dblp_key", ""),
+            },
+        )
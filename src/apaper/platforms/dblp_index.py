@@ -0,0 +1,577 @@
+# apaper/platforms/dblp_index.py
+"""Offline index of the DBLP bibliography built from the dblp.xml dump.
+
+The dump (https://dblp.org/xml/dblp.xml.gz) is stream-parsed with element
+clearing, so memory stays bounded regardless of its size. Records are stored
+in a local SQLite database with an FTS5 index over titles, authors and venues
+and regular indexes on author, venue and year. The index answers searches and renders BibTeX
+entries without contacting dblp.org.
+
+Usage:
+    python -m apaper.platforms.dblp_index DUMP [--db PATH]
+"""
+
+import argparse
+import gzip
+import html.entities
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, cast
+
+from ..utils.cache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Record elements of the dump and the publication type DBLP reports for them
+RECORD_TYPES = {
+    "article": "Journal Articles",
+    "inproceedings": "Conference and Workshop Papers",
+    "proceedings": "Editorship",
+    "book": "Books and Theses",
+    "incollection": "Parts in Books or Collections",
+    "phdthesis": "Books and Theses",
+    "mastersthesis": "Books and Theses",
+}
+
+# Fields kept for BibTeX rendering, in output order
+BIBTEX_FIELDS = (
+    "journal",
+    "booktitle",
+    "volume",
+    "number",
+    "pages",
+    "publisher",
+    "series",
+    "school",
+    "isbn",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publications (
+    key TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    title TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    editors TEXT NOT NULL,
+    venue TEXT NOT NULL,
+    year INTEGER,
+    ee TEXT NOT NULL,
+    doi TEXT NOT NULL,
+    fields TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS publication_authors (
+    author TEXT NOT NULL,
+    key TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS publications_fts USING fts5(
+    key UNINDEXED, title, authors, venue
+);
+CREATE TABLE IF NOT EXISTS index_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Secondary indexes are created after the bulk load
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS publications_year ON publications (year);
+CREATE INDEX IF NOT EXISTS publications_venue ON publications (venue COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS publication_authors_author
+    ON publication_authors (author COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS publication_authors_key ON publication_authors (key);
+"""
+
+_OR_PATTERN = re.compile(r"\s+or\s+", re.IGNORECASE)
+
+# Columns of the full-text table, older indexes only covered titles
+_FTS_COLUMNS = ["key", "title", "authors", "venue"]
+
+
+class DBLPIndex:
+    """Local searchable copy of the DBLP bibliography"""
+
+    DBLP_BASE_URL = "https://dblp.org"
+    BATCH_SIZE = 5000
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Initialize the index
+
+        Args:
+            path: SQLite file path (default: <cache dir>/dblp_index.sqlite3)
+        """
+        self.path = Path(path) if path else default_cache_dir() / "dblp_index.sqlite3"
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._upgrade_fts(conn)
+            self._conn = conn
+        return self._conn
+
+    def _upgrade_fts(self, conn: sqlite3.Connection) -> None:
+        """Rebuild a title-only full-text table with author and venue columns"""
+        columns = [
+            row[1] for row in conn.execute("PRAGMA table_info(publications_fts)")
+        ]
+        if columns == _FTS_COLUMNS:
+            return
+        logger.info("Rebuilding DBLP full-text index with author and venue columns")
+        with conn:
+            conn.execute("DROP TABLE publications_fts")
+            conn.executescript(_SCHEMA)
+            rows = conn.execute(
+                "SELECT key, title, authors, editors, venue FROM publications"
+            )
+            conn.executemany(
+                "INSERT INTO publications_fts VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        key,
+                        title,
+                        _fts_names(json.loads(authors) or json.loads(editors)),
+                        venue,
+                    )
+                    for key, title, authors, editors, venue in rows
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = (
+                self._connect().execute("SELECT COUNT(*) FROM publications").fetchone()
+            )
+        return int(row[0])
+
+    def is_populated(self) -> bool:
+        """Whether the index holds any records (missing databases are not created)"""
+        if self._conn is None and not self.path.exists():
+            return False
+        with self._lock:
+            row = (
+                self._connect().execute("SELECT 1 FROM publications LIMIT 1").fetchone()
+            )
+        return row is not None
+
+    # Ingestion
+
+    def build(self, dump_path: str | os.PathLike) -> int:
+        """
+        Build the index from a dblp.xml or dblp.xml.gz dump
+
+        The new index is written next to the current one and swapped in once
+        complete, so searches keep working during a rebuild.
+
+        Args:
+            dump_path: Path of the dump
+
+        Returns:
+            int: Number of records indexed
+        """
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+        conn = sqlite3.connect(str(tmp_path))
+        try:
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.executescript(_SCHEMA)
+
+            count = 0
+            batch: list[dict[str, Any]] = []
+            with _open_dump(dump_path) as dump:
+                for record in iter_records(dump):
+                    batch.append(record)
+                    if len(batch) >= self.BATCH_SIZE:
+                        count += self._insert(conn, batch)
+                        batch = []
+                        logger.info(f"Indexed {count} DBLP records")
+            count += self._insert(conn, batch)
+
+            logger.info("Creating DBLP index lookups")
+            conn.executescript(_INDEXES)
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO index_state VALUES ('built_at', ?)",
+                    (datetime.now().isoformat(timespec="seconds"),),
+                )
+        finally:
+            conn.close()
+
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            os.replace(tmp_path, self.path)
+        logger.info(f"DBLP index built: {count} records in {self.path}")
+        return count
+
+    def _insert(self, conn: sqlite3.Connection, records: list[dict[str, Any]]) -> int:
+        """Write one batch of parsed records in a single transaction"""
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO publications VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        r["key"],
+                        r["type"],
+                        r["title"],
+                        json.dumps(r["authors"]),
+                        json.dumps(r["editors"]),
+                        r["venue"],
+                        r["year"],
+                        r["ee"],
+                        r["doi"],
+                        json.dumps(r["fields"]),
+                    )
+                    for r in records
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO publication_authors VALUES (?, ?)",
+                [
+                    (author, r["key"])
+                    for r in records
+                    for author in r["authors"] or r["editors"]
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO publications_fts VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        r["key"],
+                        r["title"],
+                        _fts_names(r["authors"] or r["editors"]),
+                        r["venue"],
+                    )
+                    for r in records
+                ],
+            )
+        return len(records)
+
+    # Searching
+
+    def _match_expression(self, query: str) -> str:
+        """Turn a query into an FTS5 expression (all terms of any OR branch)"""
+        branches = []
+        for branch in _OR_PATTERN.split(query):
+            terms = [t for t in re.findall(r"\w+", branch) if t.lower() != "and"]
+            if terms:
+                branches.append("(" + " ".join(f'"{t}"' for t in terms) + ")")
+        return " OR ".join(branches)
+
+    def search(
+        self,
+        query: str,
+        max_results: int | None = 10,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        venue_filter: str | None = None,
+        offset: int = 0,
+        author: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search the local index
+
+        Args:
+            query: Search query string matched against titles, authors and
+                venues ('or' separates alternatives, all terms of an
+                alternative must match)
+            max_results: Maximum number of results to return (None for all)
+            year_from: Lower bound for publication year
+            year_to: Upper bound for publication year
+            venue_filter: Case-insensitive substring filter for venues
+            offset: Number of leading results to skip
+            author: Exact author name (case-insensitive)
+
+        Returns:
+            List of publication dictionaries in the DBLPSearcher result format,
+            ordered by relevance (newest first for empty queries)
+        """
+        conditions = []
+        args: list[Any] = []
+        if year_from:
+            conditions.append("p.year >= ?")
+            args.append(year_from)
+        if year_to:
+            conditions.append("p.year <= ?")
+            args.append(year_to)
+        if venue_filter:
+            conditions.append("p.venue LIKE ? ESCAPE '\\'")
+            args.append(f"%{_escape_like(venue_filter)}%")
+        if author:
+            conditions.append(
+                "p.key IN (SELECT key FROM publication_authors "
+                "WHERE author = ? COLLATE NOCASE)"
+            )
+            args.append(author)
+
+        expression = self._match_expression(query)
+        if expression:
+            sql = (
+                "SELECT p.* FROM publications_fts f "
+                "JOIN publications p ON p.key = f.key "
+                "WHERE publications_fts MATCH ?"
+            )
+            args.insert(0, expression)
+            order = "ORDER BY f.rank, p.year DESC"
+        else:
+            sql = "SELECT p.* FROM publications p WHERE 1"
+            order = "ORDER BY p.year DESC, p.key"
+        for condition in conditions:
+            sql += f" AND {condition}"
+        sql += f" {order} LIMIT ? OFFSET ?"
+        args.extend([-1 if max_results is None else max_results, max(0, offset)])
+
+        with self._lock:
+            rows = self._connect().execute(sql, args).fetchall()
+        return [self._row_to_result(row) for row in rows]
+
+    def get(self, dblp_key: str) -> dict[str, Any] | None:
+        """Return the stored record for a DBLP key"""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT * FROM publications WHERE key = ?", (dblp_key,))
+                .fetchone()
+            )
+        return self._row_to_record(row) if row else None
+
+    def _row_to_record(self, row: tuple) -> dict[str, Any]:
+        """Convert a publications table row into a record dictionary"""
+        key, type_, title, authors, editors, venue, year, ee, doi, fields = row
+        return {
+            "key": key,
+            "type": type_,
+            "title": title,
+            "authors": json.loads(authors),
+            "editors": json.loads(editors),
+            "venue": venue,
+            "year": year,
+            "ee": ee,
+            "doi": doi,
+            "fields": json.loads(fields),
+        }
+
+    def _row_to_result(self, row: tuple) -> dict[str, Any]:
+        """Convert a publications table row into a DBLPSearcher result"""
+        return record_to_result(self._row_to_record(row))
+
+    # BibTeX
+
+    def render_bibtex(self, dblp_key: str) -> str:
+        """
+        Render the BibTeX entry of a record in DBLP's layout
+
+        Returns:
+            BibTeX entry string, or empty string if the key is not indexed
+        """
+        record = self.get(dblp_key)
+        if record is None:
+            return ""
+
+        fields: list[tuple[str, str]] = []
+        if record["authors"]:
+            fields.append(("author", _join_names(record["authors"])))
+        if record["editors"]:
+            fields.append(("editor", _join_names(record["editors"])))
+        fields.append(("title", record["title"].rstrip(".")))
+        for name in BIBTEX_FIELDS:
+            value = record["fields"].get(name)
+            if value:
+                fields.append((name, value))
+        if record["year"]:
+            fields.append(("year", str(record["year"])))
+        if record["ee"]:
+            fields.append(("url", record["ee"]))
+        if record["doi"]:
+            fields.append(("doi", record["doi"]))
+        fields.append(("biburl", f"{self.DBLP_BASE_URL}/rec/{dblp_key}.bib"))
+        fields.append(
+            ("bibsource", "dblp computer science bibliography, https://dblp.org")
+        )
+
+        lines = [f"@{record['type']}{{DBLP:{dblp_key},"]
+        for name, value in fields:
+            lines.append(f"  {name:<12} = {{{value}}},")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+
+def record_to_result(record: dict[str, Any]) -> dict[str, Any]:
+    """Convert a parsed dump record into the DBLPSearcher result format"""
+    return {
+        "title": record["title"],
+        "authors": record["authors"] or record["editors"],
+        "venue": record["venue"],
+        "year": record["year"],
+        "type": RECORD_TYPES.get(record["type"], ""),
+        "doi": record["doi"],
+        "ee": record["ee"],
+        "url": f"{DBLPIndex.DBLP_BASE_URL}/rec/{record['key']}",
+        "dblp_key": record["key"],
+    }
+
+
+def parse_person_records(xml: bytes) -> tuple[str, list[dict[str, Any]]]:
+    """
+    Parse a DBLP person page (https://dblp.org/pid/<pid>.xml)
+
+    Returns:
+        The person's name and their publication records
+    """
+    root = ET.fromstring(xml, parser=_entity_parser())
+    records = []
+    for elem in root.iter():
+        if elem.tag in RECORD_TYPES:
+            record = _parse_record(elem)
+            if record is not None:
+                records.append(record)
+    return root.get("name", ""), records
+
+
+def _fts_names(names: list[str]) -> str:
+    """Join names into the text of the full-text authors column"""
+    return "; ".join(names)
+
+
+def _escape_like(text: str) -> str:
+    """Escape the LIKE wildcards of a literal substring"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _join_names(names: list[str]) -> str:
+    """Join names with BibTeX 'and', one name per line as DBLP does"""
+    return " and\n                  ".join(names)
+
+
+def _open_dump(dump_path: str | os.PathLike) -> IO[bytes]:
+    """Open a dump file, transparently decompressing .gz files"""
+    if os.fspath(dump_path).endswith(".gz"):
+        return cast(IO[bytes], gzip.open(dump_path, "rb"))
+    return open(dump_path, "rb")
+
+
+def _entity_parser() -> ET.XMLParser:
+    """XML parser that resolves the HTML character entities used by dblp.dtd"""
+    parser = ET.XMLParser()
+    parser.entity.update(
+        {name: chr(code) for name, code in html.entities.name2codepoint.items()}
+    )
+    return parser
+
+
+def iter_records(dump: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """
+    Stream publication records out of a dblp.xml dump
+
+    Every record element is cleared after it has been read and detached from
+    the root, so memory use does not grow with the size of the dump.
+
+    Yields:
+        Record dictionaries with key, type, title, authors, editors, venue,
+        year, ee, doi and the BibTeX fields
+    """
+    root = None
+    for event, elem in ET.iterparse(
+        dump, events=("start", "end"), parser=_entity_parser()
+    ):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
+        if elem.tag not in RECORD_TYPES or root is None:
+            continue
+
+        record = _parse_record(elem)
+        elem.clear()
+        root.clear()
+        if record is not None:
+            yield record
+
+
+def _parse_record(elem: ET.Element) -> dict[str, Any] | None:
+    """Extract the stored fields from one record element"""
+    key = elem.get("key", "")
+    if not key:
+        return None
+
+    authors = []
+    editors = []
+    fields: dict[str, str] = {}
+    ee = ""
+    title = ""
+    year = None
+    for child in elem:
+        text = " ".join("".join(child.itertext()).split())
+        if not text:
+            continue
+        tag = child.tag
+        if tag == "author":
+            authors.append(text)
+        elif tag == "editor":
+            editors.append(text)
+        elif tag == "title":
+            title = text
+        elif tag == "year":
+            year = int(text) if text.isdigit() else None
+        elif tag == "ee":
+            ee = ee or text
+        elif tag in BIBTEX_FIELDS and tag not in fields:
+            fields[tag] = text
+
+    doi = ""
+    if ee.startswith("https://doi.org/"):
+        doi = ee[len("https://doi.org/") :]
+
+    return {
+        "key": key,
+        "type": elem.tag,
+        "title": title,
+        "authors": authors,
+        "editors": editors,
+        "venue": fields.get("journal") or fields.get("booktitle") or "",
+        "year": year,
+        "ee": ee,
+        "doi": doi,
+        "fields": fields,
+    }
+
+
+def main() -> None:
+    """Build the local DBLP index from a dblp.xml dump"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dump", help="path of dblp.xml or dblp.xml.gz")
+    parser.add_argument("--db", help="SQLite file for the index")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    index = DBLPIndex(args.db)
+    count = index.build(args.dump)
+    print(f"{count} records indexed in {index.path}")
+
+
+if __name__ == "__main__":
+    main()
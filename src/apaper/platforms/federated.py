@@ -0,0 +1,195 @@
+# apaper/platforms/federated.py
+"""Concurrent search over several paper sources.
+
+Every source is queried in a worker thread of its own pool and waited for
+until its own deadline. Sources that miss the deadline or fail are reported as missing, and
+the results of the others are merged into one ranked list: duplicates (same
+DOI or title) are combined and papers are ordered by reciprocal rank fusion,
+so a paper ranked high by several sources comes first.
+"""
+
+import logging
+import re
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field, replace
+
+from ..models.paper import Paper
+
+logger = logging.getLogger(__name__)
+
+# Signature of a source: (query, max_results, year_from, year_to) -> papers
+SourceSearch = Callable[[str, int, int | None, int | None], list[Paper]]
+
+# Default seconds each source may take
+DEFAULT_DEADLINE = 20.0
+
+# Rank fusion constant; larger values flatten the advantage of top ranks
+RRF_K = 60
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+@dataclass
+class FederatedResult:
+    """Merged papers plus the sources that did not answer"""
+
+    papers: list[Paper]
+    counts: dict[str, int] = field(default_factory=dict)
+    missing: dict[str, str] = field(default_factory=dict)
+
+
+class FederatedSearcher:
+    """Query several paper sources concurrently and merge their results"""
+
+    def __init__(
+        self,
+        sources: dict[str, SourceSearch],
+        deadlines: dict[str, float] | None = None,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize the federated searcher
+
+        Args:
+            sources: Source name -> search function, in tie-break order
+            deadlines: Source name -> seconds to wait for it
+                (default: DEFAULT_DEADLINE)
+            max_workers: Threads per source; a source that missed its deadline
+                keeps its thread until it returns, so each source gets its own
+                pool and its stragglers cannot starve the other sources
+        """
+        self.sources = dict(sources)
+        self.deadlines = dict(deadlines or {})
+        self.executors = {
+            name: ThreadPoolExecutor(
+                max_workers=max(1, max_workers), thread_name_prefix=f"federated-{name}"
+            )
+            for name in self.sources
+        }
+
+    def close(self) -> None:
+        """Stop the worker threads without waiting for running searches"""
+        for executor in self.executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        year_from: int | None = None,
+        year_to: int | None = None,
+    ) -> FederatedResult:
+        """
+        Search all sources at once
+
+        Args:
+            query: Search query string
+            max_results: Results requested from each source and returned overall
+            year_from: Earliest publication year (optional)
+            year_to: Latest publication year (optional)
+
+        Returns:
+            FederatedResult with the merged papers, the number of results per
+            source and the reason each missing source gave no results
+        """
+        start = time.monotonic()
+        futures = {
+            name: self.executors[name].submit(
+                search, query, max_results, year_from, year_to
+            )
+            for name, search in self.sources.items()
+        }
+
+        results: dict[str, list[Paper]] = {}
+        missing: dict[str, str] = {}
+        for name in sorted(futures, key=self._deadline):
+            deadline = self._deadline(name)
+            remaining = max(0.0, start + deadline - time.monotonic())
+            try:
+                results[name] = futures[name].result(timeout=remaining)
+            except FutureTimeoutError:
+                logger.warning(f"{name} did not answer within {deadline:g} seconds")
+                missing[name] = f"timed out after {deadline:g} seconds"
+            except Exception as e:
+                logger.error(f"{name} search failed: {e}")
+                missing[name] = f"failed: {e}"
+
+        return FederatedResult(
+            papers=merge_ranked(results, list(self.sources), max_results),
+            counts={name: len(papers) for name, papers in results.items()},
+            missing={name: missing[name] for name in self.sources if name in missing},
+        )
+
+    def _deadline(self, name: str) -> float:
+        return self.deadlines.get(name, DEFAULT_DEADLINE)
+
+
+def dedup_key(paper: Paper) -> str:
+    """Papers with the same DOI, or else the same title, are one paper"""
+    if paper.doi:
+        return f"doi:{paper.doi.lower()}"
+    return _title_key(paper)
+
+
+def _title_key(paper: Paper) -> str:
+    return f"title:{_NON_ALNUM.sub(' ', paper.title.lower()).strip()}"
+
+
+def merge_ranked(
+    results: dict[str, list[Paper]], order: list[str], max_results: int
+) -> list[Paper]:
+    """
+    Merge per-source result lists into one ranked list
+
+    Each paper scores the sum of 1 / (RRF_K + rank) over the sources that
+    returned it. Duplicates are folded into the record of the first source
+    in order that returned the paper, completed with fields the others had;
+    extra["sources"] lists every source that returned it.
+
+    Args:
+        results: Source name -> papers in that source's rank order
+        order: Source names in tie-break order
+        max_results: Maximum number of merged papers returned
+    """
+    merged: dict[str, Paper] = {}
+    scores: dict[str, float] = {}
+    best: dict[str, tuple[int, int]] = {}
+    titles: dict[str, str] = {}
+
+    for source_index, name in enumerate(order):
+        for rank, paper in enumerate(results.get(name, [])):
+            # Match on the title too, so records with and without a DOI merge
+            title_key = _title_key(paper)
+            key = titles.get(title_key) or dedup_key(paper)
+            if key not in merged:
+                merged[key] = replace(
+                    paper, extra={**(paper.extra or {}), "sources": [name]}
+                )
+                titles[title_key] = key
+                scores[key] = 0.0
+                best[key] = (rank, source_index)
+            else:
+                merged[key] = _combine(merged[key], paper, name)
+            scores[key] += 1.0 / (RRF_K + rank + 1)
+
+    ranked = sorted(merged, key=lambda key: (-scores[key], best[key]))
+    return [merged[key] for key in ranked[:max_results]]
+
+
+def _combine(paper: Paper, duplicate: Paper, source: str) -> Paper:
+    """Fill empty fields of paper from a duplicate found by another source"""
+    extra = dict(paper.extra or {})
+    if source not in extra["sources"]:
+        extra["sources"] = [*extra["sources"], source]
+    return replace(
+        paper,
+        extra=extra,
+        doi=paper.doi or duplicate.doi,
+        abstract=paper.abstract or duplicate.abstract,
+        pdf_url=paper.pdf_url or duplicate.pdf_url,
+        url=paper.url or duplicate.url,
+        citations=max(paper.citations, duplicate.citations),
+    )
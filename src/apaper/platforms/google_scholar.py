@@ -1,18 +1,56 @@
 # all_in_mcp/academic_platforms/google_scholar.py
+import asyncio
+import hashlib
 import logging
 import random
-import time
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
 from datetime import datetime
-from typing import Optional
+from typing import Any
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from ..models.paper import Paper
+from ..utils.cache import CacheEntry, PersistentCache
+from ..utils.html import check_backend, has_class, parse_only
+from ..utils.rate_limit import TokenBucket
+from ..utils.transport import RetryPolicy, create_async_client, create_client
 from .base import PaperSource
 
 logger = logging.getLogger(__name__)
 
+# Shared by every searcher in the process: one request per 2 s on average,
+# with up to 3 requests banked while idle
+SCHOLAR_RATE_LIMITER = TokenBucket(rate=0.5, capacity=3)
+
+# Seconds an empty result list is served before Scholar is asked again
+NEGATIVE_CACHE_TTL = 600.0
+
+# Seconds past its TTL a result list is still served while it is refreshed
+MAX_STALE = 7 * 86400.0
+
+# Maximum number of background refreshes running at once
+MAX_REFRESH_THREADS = 4
+
+# Number of seen Scholar records kept in memory for lookups by ID
+RECORD_MEMORY_SIZE = 4096
+
+# Scholar cluster ID in "Cited by" and "All N versions" links
+CLUSTER_ID_RE = re.compile(r"[?&](?:cites|cluster)=(\d+)")
+
+# Seconds a Scholar request may take
+REQUEST_TIMEOUT = 30.0
+
+# Throttling responses are handled by the rate limiter, so the transport only
+# retries requests that failed at the connection level
+SCHOLAR_RETRY = RetryPolicy(statuses=frozenset())
+
+# Markers of Google's "unusual traffic" CAPTCHA interstitial
+CAPTCHA_MARKERS = ("gs_captcha", "/sorry/", "unusual traffic")
+
 
 class GoogleScholarSearcher(PaperSource):
     """Google Scholar paper search implementation"""
@@ -25,27 +63,125 @@ class GoogleScholarSearcher(PaperSource):
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:89.0) Gecko/20100101 Firefox/89.0",
     ]
+    # Elements the fast backend builds from result pages
+    RESULT_STRAINER = SoupStrainer("div", class_="gs_ri")
+
+    def __init__(
+        self,
+        html_backend: str = "full",
+        rate_limiter: TokenBucket | None = None,
+        max_retries: int = 2,
+        max_wait: float = 60.0,
+        cache: PersistentCache | None = None,
+        negative_ttl: float = NEGATIVE_CACHE_TTL,
+        max_stale: float = MAX_STALE,
+        max_refreshes: int = MAX_REFRESH_THREADS,
+        record_index: PersistentCache | None = None,
+        record_memory_size: int = RECORD_MEMORY_SIZE,
+        citation_cache: PersistentCache | None = None,
+    ):
+        """
+        Initialize Google Scholar searcher
 
-    def __init__(self):
-        """Initialize Google Scholar searcher"""
+        Args:
+            html_backend: "full" (complete parse tree) or "fast" (strained,
+                single-pass extraction); both return identical papers
+            rate_limiter: Token bucket pacing requests (default: the
+                process-wide SCHOLAR_RATE_LIMITER)
+            max_retries: Retries of a page after a 429 or CAPTCHA response
+            max_wait: Give up on a page rather than wait longer than this
+                many seconds for the rate limiter
+            cache: Optional persistent cache for search results; stale
+                entries are served immediately and refreshed in the background
+            negative_ttl: Seconds an empty result list stays fresh; stale
+                empty lists are searched again rather than served
+            max_stale: Seconds past the cache TTL a stale result list is still
+                served; older entries are searched again
+            max_refreshes: Maximum number of background refreshes at a time
+            record_index: Optional persistent index of seen records by paper ID
+            record_memory_size: Maximum number of seen records kept in memory
+            citation_cache: Optional persistent cache of cited-by edges, so
+                overlapping citation expansions reuse fetched listings
+        """
+        self.html_backend = check_backend(html_backend)
+        self.rate_limiter = rate_limiter or SCHOLAR_RATE_LIMITER
+        self.max_retries = max(0, max_retries)
+        self.max_wait = max_wait
+        self.cache = cache
+        self.negative_ttl = negative_ttl
+        self.max_stale = max_stale
+        self.max_refreshes = max(1, max_refreshes)
+        self._refreshing: dict[str, threading.Thread] = {}
+        self._refresh_lock = threading.Lock()
+        self.record_index = record_index
+        self.record_memory_size = max(0, record_memory_size)
+        self._records: OrderedDict[str, Paper] = OrderedDict()
+        self._records_lock = threading.Lock()
+        self.citation_cache = citation_cache
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_closer: asyncio.Task | None = None
+        self._async_closers: set[asyncio.Task] = set()
         self._setup_session()
 
-    def _setup_session(self):
+    def _setup_session(self) -> None:
         """Initialize session with random user agent"""
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": random.choice(self.BROWSERS),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
+        self.headers = {
+            "User-Agent": random.choice(self.BROWSERS),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate",
+            "DNT": "1",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+        }
+        # Result pages are cached by the result cache, not the HTTP cache
+        self.session = create_client(
+            headers=self.headers,
+            timeout=REQUEST_TIMEOUT,
+            retry=SCHOLAR_RETRY,
+            cache=False,
         )
 
-    def _extract_year(self, text: str) -> Optional[int]:
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """AsyncClient for the running event loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            # A client's connections belong to the loop that opened them, so
+            # each loop gets its own client, closed when that loop shuts down
+            client = create_async_client(
+                headers=self.headers,
+                timeout=REQUEST_TIMEOUT,
+                retry=SCHOLAR_RETRY,
+                cache=False,
+            )
+            closer = loop.create_task(self._close_on_shutdown(client))
+            self._async_closers.add(closer)
+            closer.add_done_callback(self._async_closers.discard)
+            self._async_client = client
+            self._async_loop = loop
+            self._async_closer = closer
+        return self._async_client
+
+    async def _close_on_shutdown(self, client: httpx.AsyncClient) -> None:
+        """Close client once cancelled, at the latest when its loop shuts down"""
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close the async client of the running event loop"""
+        closer = self._async_closer
+        if closer is None or self._async_loop is not asyncio.get_running_loop():
+            return
+        self._async_client = None
+        self._async_loop = None
+        self._async_closer = None
+        closer.cancel()
+        await asyncio.gather(closer, return_exceptions=True)
+
+    def _extract_year(self, text: str) -> int | None:
         """Extract publication year from text"""
         words = text.replace(",", " ").replace("-", " ").split()
         for word in words:
@@ -53,7 +189,7 @@ class GoogleScholarSearcher(PaperSource):
                 return int(word)
         return None
 
-    def _extract_citations(self, item) -> int:
+    def _extract_citations(self, item: Tag) -> int:
         """Extract citation count from paper item"""
         try:
             citation_elem = item.find("div", class_="gs_fl")
@@ -70,7 +206,17 @@ class GoogleScholarSearcher(PaperSource):
         except Exception:
             return 0
 
-    def _parse_paper(self, item) -> Optional[Paper]:
+    def _extract_cluster_id(self, item: Tag) -> str | None:
+        """Extract the Scholar cluster ID from the links below a result"""
+        links_elem = item.find("div", class_="gs_fl")
+        if links_elem:
+            for link in links_elem.find_all("a", href=True):
+                match = CLUSTER_ID_RE.search(str(link["href"]))
+                if match:
+                    return match.group(1)
+        return None
+
+    def _parse_paper(self, item: Tag) -> Paper | None:
         """Parse a single paper entry from HTML"""
         try:
             # Extract main paper elements
@@ -81,65 +227,346 @@ class GoogleScholarSearcher(PaperSource):
             if not title_elem or not info_elem:
                 return None
 
-            # Process title and URL
-            title_text = title_elem.get_text(strip=True)
-            # Remove common prefixes
-            title = (
-                title_text.replace("[PDF]", "")
-                .replace("[HTML]", "")
-                .replace("[BOOK]", "")
-                .strip()
+            return self._build_paper(
+                title_elem,
+                link=title_elem.find("a", href=True),
+                info_elem=info_elem,
+                abstract_elem=abstract_elem,
+                citations=self._extract_citations(item),
+                cluster_id=self._extract_cluster_id(item),
             )
+        except Exception as e:
+            logger.warning(f"Failed to parse paper: {e}")
+            return None
 
-            link = title_elem.find("a", href=True)
-            url = link["href"] if link else ""
-
-            # Process author and publication info
-            info_text = info_elem.get_text()
-            info_parts = info_text.split(" - ")
-
-            # Extract authors (usually the first part before the first dash)
-            authors_text = info_parts[0] if info_parts else ""
-            authors = [a.strip() for a in authors_text.split(",") if a.strip()]
-
-            # Extract year from the info text
-            year = self._extract_year(info_text)
-
-            # Extract abstract
-            abstract = abstract_elem.get_text(strip=True) if abstract_elem else ""
-
-            # Extract citations
-            citations = self._extract_citations(item)
-
-            # Generate a paper ID based on the URL or title
-            paper_id = f"gs_{abs(hash(url if url else title))}"
-
-            # Create paper object
-            return Paper(
-                paper_id=paper_id,
-                title=title,
-                authors=authors,
-                abstract=abstract,
-                url=url,
-                pdf_url="",  # Google Scholar doesn't provide direct PDF links
-                published_date=datetime(year, 1, 1) if year else datetime.now(),
-                updated_date=None,
-                source="google_scholar",
-                categories=[],
-                keywords=[],
-                doi="",
+    def _parse_paper_fast(self, item: Tag) -> Paper | None:
+        """Parse a single paper entry in one walk over its tags"""
+        try:
+            title_elem = info_elem = abstract_elem = link = None
+            links_elem = cluster_id = None
+            citations = 0
+            seen_citations = False
+
+            for tag in item.find_all(True):
+                name = tag.name
+                if name == "a":
+                    if (
+                        link is None
+                        and title_elem is not None
+                        and tag.get("href")
+                        and title_elem in tag.parents
+                    ):
+                        link = tag
+                    elif (
+                        not seen_citations
+                        and links_elem is not None
+                        and tag.string
+                        and "Cited by" in tag.string
+                        and links_elem in tag.parents
+                    ):
+                        seen_citations = True
+                        citation_num = "".join(filter(str.isdigit, tag.get_text()))
+                        citations = int(citation_num) if citation_num else 0
+                    if (
+                        cluster_id is None
+                        and links_elem is not None
+                        and tag.get("href")
+                        and links_elem in tag.parents
+                    ):
+                        match = CLUSTER_ID_RE.search(str(tag["href"]))
+                        cluster_id = match.group(1) if match else None
+                elif name == "h3":
+                    if title_elem is None and has_class(tag, "gs_rt"):
+                        title_elem = tag
+                elif name == "div":
+                    if info_elem is None and has_class(tag, "gs_a"):
+                        info_elem = tag
+                    elif abstract_elem is None and has_class(tag, "gs_rs"):
+                        abstract_elem = tag
+                    elif links_elem is None and has_class(tag, "gs_fl"):
+                        links_elem = tag
+
+            if not title_elem or not info_elem:
+                return None
+
+            return self._build_paper(
+                title_elem,
+                link=link,
+                info_elem=info_elem,
+                abstract_elem=abstract_elem,
                 citations=citations,
-                references=[],
-                extra={"info_text": info_text},
+                cluster_id=cluster_id,
             )
         except Exception as e:
             logger.warning(f"Failed to parse paper: {e}")
             return None
 
-    def search(self, query: str, max_results: int = 10, **kwargs) -> list[Paper]:
+    def _build_paper(
+        self,
+        title_elem: Tag,
+        link: Tag | None,
+        info_elem: Tag,
+        abstract_elem: Tag | None,
+        citations: int,
+        cluster_id: str | None = None,
+    ) -> Paper:
+        """Create a Paper from the elements of a result entry"""
+        # Process title and URL
+        title_text = title_elem.get_text(strip=True)
+        # Remove common prefixes
+        title = (
+            title_text.replace("[PDF]", "")
+            .replace("[HTML]", "")
+            .replace("[BOOK]", "")
+            .strip()
+        )
+
+        url = str(link["href"]) if link else ""
+
+        # Process author and publication info
+        info_text = info_elem.get_text()
+        info_parts = info_text.split(" - ")
+
+        # Extract authors (usually the first part before the first dash)
+        authors_text = info_parts[0] if info_parts else ""
+        authors = [a.strip() for a in authors_text.split(",") if a.strip()]
+
+        # Extract year from the info text
+        year = self._extract_year(info_text)
+
+        # Extract abstract
+        abstract = abstract_elem.get_text(strip=True) if abstract_elem else ""
+
+        paper_id = self._paper_id(cluster_id, url, title)
+        extra = {"info_text": info_text}
+        if cluster_id:
+            extra["cluster_id"] = cluster_id
+
+        # Create paper object
+        return Paper(
+            paper_id=paper_id,
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            url=url,
+            pdf_url="",  # Google Scholar doesn't provide direct PDF links
+            published_date=datetime(year, 1, 1) if year else datetime.now(),
+            updated_date=None,
+            source="google_scholar",
+            categories=[],
+            keywords=[],
+            doi="",
+            citations=citations,
+            references=[],
+            extra=extra,
+        )
+
+    def _paper_id(self, cluster_id: str | None, url: str, title: str) -> str:
+        """
+        Stable paper ID: the Scholar cluster ID when known, otherwise a
+        digest of the URL (or the normalized title for entries without one)
+        """
+        if cluster_id:
+            return f"gs_{cluster_id}"
+        content = url or " ".join(title.lower().split())
+        return f"gs_{hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]}"
+
+    def get_paper(self, paper_id: str) -> Paper | None:
+        """
+        Look up a previously seen search result by its paper ID
+
+        Args:
+            paper_id: ID of a paper returned by an earlier search
+
+        Returns:
+            The latest record seen for the ID, or None if it is unknown
+        """
+        with self._records_lock:
+            paper = self._records.get(paper_id)
+            if paper is not None:
+                self._records.move_to_end(paper_id)
+                return paper
+
+        if self.record_index is not None:
+            entry = self.record_index.get(paper_id)
+            if entry is not None:
+                paper = Paper.from_dict(entry.value)
+                self._remember([paper], persist=False)
+                return paper
+        return None
+
+    def cluster_id(self, paper_id: str) -> str | None:
+        """
+        Resolve a paper ID, bare cluster ID or cites/cluster URL to a cluster ID
+
+        Returns:
+            The Scholar cluster ID, or None for results without one
+        """
+        paper_id = paper_id.strip()
+        if paper_id.startswith("gs_") and paper_id[3:].isdigit():
+            return paper_id[3:]
+        if paper_id.isdigit():
+            return paper_id
+        match = CLUSTER_ID_RE.search(paper_id)
+        if match:
+            return match.group(1)
+        paper = self.get_paper(paper_id)
+        return (paper.extra or {}).get("cluster_id") if paper else None
+
+    def get_citing_papers(
+        self, paper_id: str, max_results: int = 10, refresh: bool = False
+    ) -> list[Paper]:
+        """
+        List the papers citing a Scholar result ("Cited by" listing)
+
+        Listings are served from the citation cache when a fresh entry with at
+        least max_results papers (or the complete listing) is stored.
+
+        Args:
+            paper_id: Paper ID, cluster ID or cites link of the cited paper
+            max_results: Maximum number of citing papers to return
+            refresh: Ignore cached edges and fetch the listing again
+
+        Returns:
+            Citing papers in Scholar's order (empty without a cluster ID)
+        """
+        cluster_id = self.cluster_id(paper_id)
+        if not cluster_id:
+            logger.warning(f"No Scholar cluster ID known for {paper_id}")
+            return []
+
+        if self.citation_cache is not None and not refresh:
+            entry = self.citation_cache.get(cluster_id)
+            if (
+                entry is not None
+                and self.citation_cache.is_fresh(entry)
+                and self._covers(entry, max_results)
+            ):
+                papers = [
+                    Paper.from_dict(paper)
+                    for paper in entry.value["papers"][:max_results]
+                ]
+                self._remember(papers, persist=False)
+                return papers
+
+        outcome = {"failed": False}
+        papers = list(
+            self._iter_papers("", max_results, None, None, outcome, cites=cluster_id)
+        )
+        if self.citation_cache is not None and not outcome["failed"]:
+            self.citation_cache.set(
+                cluster_id,
+                {
+                    "papers": [paper.to_dict() for paper in papers],
+                    "max_results": max_results,
+                    "exhausted": len(papers) < max_results,
+                },
+            )
+        return papers
+
+    def expand_citations(
+        self,
+        seeds: Iterable[str],
+        depth: int = 1,
+        fan_out: int = 10,
+        max_papers: int = 100,
+    ) -> dict:
+        """
+        Crawl the cited-by graph breadth-first from one or more seed papers
+
+        Every listing request goes through the shared rate limiter, and
+        listings already in the citation cache cost no request at all.
+
+        Args:
+            seeds: Paper IDs, cluster IDs or cites links to start from
+            depth: Number of cited-by levels to follow
+            fan_out: Maximum number of citing papers fetched per paper
+            max_papers: Stop expanding once this many citing papers were found
+
+        Returns:
+            Dict with "seeds" (paper IDs), "papers" (paper ID -> Paper),
+            "edges" ((citing ID, cited ID) pairs) and "truncated" (whether
+            max_papers cut the crawl short)
+        """
+        frontier = []
+        for seed in seeds:
+            cluster_id = self.cluster_id(seed)
+            if cluster_id and f"gs_{cluster_id}" not in frontier:
+                frontier.append(f"gs_{cluster_id}")
+        seed_ids = list(frontier)
+        visited = set(frontier)
+        papers: dict[str, Paper] = {}
+        edges: list[tuple[str, str]] = []
+        truncated = False
+
+        for _ in range(max(0, depth)):
+            next_frontier = []
+            for cited in frontier:
+                if len(papers) >= max_papers:
+                    truncated = True
+                    break
+                for paper in self.get_citing_papers(cited, fan_out):
+                    # The budget counts papers, so stop at the first new one
+                    # past it rather than after the whole listing
+                    if paper.paper_id not in papers and len(papers) >= max_papers:
+                        truncated = True
+                        break
+                    edges.append((paper.paper_id, cited))
+                    papers.setdefault(paper.paper_id, paper)
+                    if paper.paper_id not in visited and (paper.extra or {}).get(
+                        "cluster_id"
+                    ):
+                        visited.add(paper.paper_id)
+                        next_frontier.append(paper.paper_id)
+                if truncated:
+                    break
+            if truncated:
+                break
+            frontier = next_frontier
+
+        return {
+            "seeds": seed_ids,
+            "papers": papers,
+            "edges": edges,
+            "truncated": truncated,
+        }
+
+    def _remember(self, papers: Iterable[Paper], persist: bool = True) -> None:
+        """Add search results to the lookup index"""
+        papers = list(papers)
+        with self._records_lock:
+            for paper in papers:
+                self._records[paper.paper_id] = paper
+                self._records.move_to_end(paper.paper_id)
+            while len(self._records) > self.record_memory_size:
+                self._records.popitem(last=False)
+        if persist and self.record_index is not None:
+            self.record_index.set_many(
+                {paper.paper_id: paper.to_dict() for paper in papers}
+            )
+
+    def _iter_results(self, html: str) -> Iterator[Paper | None]:
+        """Yield the parsed paper (or None) for each result entry of a page"""
+        if self.html_backend == "fast":
+            soup = parse_only(html, self.RESULT_STRAINER)
+            for item in soup.find_all("div", class_="gs_ri"):
+                yield self._parse_paper_fast(item)
+            return
+
+        soup = BeautifulSoup(html, "html.parser")
+        for item in soup.find_all("div", class_="gs_ri"):
+            yield self._parse_paper(item)
+
+    def search(self, query: str, max_results: int = 10, **kwargs: Any) -> list[Paper]:
         """
         Search Google Scholar for papers
 
+        With a result cache, repeated searches are answered from it: a
+        cached result list for the same query and years serves any smaller
+        max_results, and stale entries are refreshed in the background.
+        Entries more than max_stale past their TTL and stale empty result
+        lists are searched again instead.
+
         Args:
             query: Search query string
             max_results: Maximum number of results to return
@@ -148,66 +575,414 @@ class GoogleScholarSearcher(PaperSource):
         Returns:
             List of Paper objects
         """
-        papers = []
-        start = 0
-        results_per_page = min(10, max_results)
+        if self.cache is None:
+            return list(self.iter_search(query, max_results=max_results, **kwargs))
+
+        year_low = kwargs.get("year_low")
+        year_high = kwargs.get("year_high")
+        key = self._cache_key(query, year_low, year_high)
+        papers = self._cached(key, query, max_results, year_low, year_high)
+        if papers is not None:
+            return papers
+
+        return self._search_and_store(key, query, max_results, year_low, year_high)
+
+    async def asearch(
+        self, query: str, max_results: int = 10, **kwargs: Any
+    ) -> list[Paper]:
+        """
+        Search Google Scholar without blocking the event loop
 
-        # Extract additional parameters
+        Same results and caching as search(), but pages are fetched with an
+        httpx.AsyncClient and rate-limit waits use asyncio.sleep, so
+        concurrent searches overlap.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+            **kwargs: Additional search parameters (e.g., year_low, year_high)
+
+        Returns:
+            List of Paper objects
+        """
         year_low = kwargs.get("year_low")
         year_high = kwargs.get("year_high")
+        if self.cache is None:
+            return [
+                paper
+                async for paper in self._aiter_papers(
+                    query, max_results, year_low, year_high
+                )
+            ]
+
+        # The result cache and record index are SQLite-backed, so they are
+        # read and written in worker threads
+        key = self._cache_key(query, year_low, year_high)
+        papers = await asyncio.to_thread(
+            self._cached, key, query, max_results, year_low, year_high
+        )
+        if papers is not None:
+            return papers
+
+        outcome = {"failed": False}
+        papers = [
+            paper
+            async for paper in self._aiter_papers(
+                query, max_results, year_low, year_high, outcome
+            )
+        ]
+        await asyncio.to_thread(self._store, key, papers, max_results, outcome)
+        return papers
+
+    def _cached(
+        self,
+        key: str,
+        query: str,
+        max_results: int,
+        year_low: int | None,
+        year_high: int | None,
+    ) -> list[Paper] | None:
+        """Papers from the result cache, or None if it cannot answer"""
+        cache = self.cache
+        if cache is None:
+            return None
+        entry = cache.get(key)
+        if entry is None or not self._covers(entry, max_results):
+            return None
+        if not self._is_fresh(entry):
+            # A refresh that keeps failing must not serve the entry forever
+            if not entry.value["papers"] or (entry.age >= cache.ttl + self.max_stale):
+                return None
+            self._refresh_in_background(
+                key, query, entry.value["max_results"], year_low, year_high
+            )
+        papers = [
+            Paper.from_dict(paper) for paper in entry.value["papers"][:max_results]
+        ]
+        self._remember(papers, persist=False)
+        return papers
+
+    def _cache_key(
+        self, query: str, year_low: int | None, year_high: int | None
+    ) -> str:
+        """Canonical cache key: normalized query plus year range"""
+        terms = " ".join(query.lower().split())
+        return f"{terms}|{year_low or ''}|{year_high or ''}"
+
+    def _covers(self, entry: CacheEntry, max_results: int) -> bool:
+        """Whether a cached result list answers a search for max_results"""
+        return bool(
+            entry.value["max_results"] >= max_results or entry.value["exhausted"]
+        )
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        """Empty result lists go stale after the shorter negative TTL"""
+        cache = self.cache
+        if cache is None:
+            return False
+        if not entry.value["papers"]:
+            return entry.age < min(self.negative_ttl, cache.ttl)
+        return cache.is_fresh(entry)
+
+    def _search_and_store(
+        self,
+        key: str,
+        query: str,
+        max_results: int,
+        year_low: int | None,
+        year_high: int | None,
+    ) -> list[Paper]:
+        """Search Scholar and cache the results unless a request failed"""
+        outcome = {"failed": False}
+        papers = list(
+            self._iter_papers(query, max_results, year_low, year_high, outcome)
+        )
+        self._store(key, papers, max_results, outcome)
+        return papers
+
+    def _store(
+        self, key: str, papers: list[Paper], max_results: int, outcome: dict
+    ) -> None:
+        """Cache a result list unless one of its requests failed"""
+        if self.cache is not None and not outcome["failed"]:
+            self.cache.set(
+                key,
+                {
+                    "papers": [paper.to_dict() for paper in papers],
+                    "max_results": max_results,
+                    "exhausted": len(papers) < max_results,
+                },
+            )
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        query: str,
+        max_results: int,
+        year_low: int | None,
+        year_high: int | None,
+    ) -> None:
+        """
+        Re-run a cached search in a daemon thread, once per key at a time
+
+        At most max_refreshes run at once; further stale entries are served
+        without a refresh until a slot frees up.
+        """
 
-        while len(papers) < max_results:
+        def refresh() -> None:
             try:
-                # Construct search parameters
-                params = {
-                    "q": query,
-                    "start": start,
-                    "hl": "en",
-                    "as_sdt": "0,5",  # Include articles and citations
-                    "num": results_per_page,
-                }
-
-                # Add year filters if provided
-                if year_low:
-                    params["as_ylo"] = year_low
-                if year_high:
-                    params["as_yhi"] = year_high
-
-                # Make request with random delay to avoid rate limiting
-                time.sleep(random.uniform(1.0, 3.0))
-                response = self.session.get(self.SCHOLAR_URL, params=params, timeout=30)
-
-                if response.status_code != 200:
-                    logger.error(f"Search failed with status {response.status_code}")
-                    break
+                self._search_and_store(key, query, max_results, year_low, year_high)
+            except Exception as e:
+                logger.warning(f"Background refresh of '{query}' failed: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.pop(key, None)
+
+        with self._refresh_lock:
+            if key in self._refreshing or len(self._refreshing) >= self.max_refreshes:
+                return
+            thread = threading.Thread(target=refresh, daemon=True)
+            self._refreshing[key] = thread
+        thread.start()
+
+    def iter_search(
+        self, query: str, max_results: int | None = None, **kwargs: Any
+    ) -> Iterator[Paper]:
+        """
+        Lazily search Google Scholar for papers
 
-                # Parse results
-                soup = BeautifulSoup(response.text, "html.parser")
-                results = soup.find_all("div", class_="gs_ri")
+        Result pages are requested one at a time as the consumer iterates;
+        closing the generator stops further requests.
 
-                if not results:
-                    logger.info("No more results found")
-                    break
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to yield (None for all)
+            **kwargs: Additional search parameters (e.g., year_low, year_high)
 
-                # Process each result
-                for item in results:
-                    if len(papers) >= max_results:
-                        break
+        Yields:
+            Paper objects in result order
+        """
+        yield from self._iter_papers(
+            query, max_results, kwargs.get("year_low"), kwargs.get("year_high")
+        )
 
-                    paper = self._parse_paper(item)
-                    if paper:
-                        papers.append(paper)
+    def _iter_papers(
+        self,
+        query: str,
+        max_results: int | None,
+        year_low: int | None,
+        year_high: int | None,
+        outcome: dict | None = None,
+        cites: str | None = None,
+    ) -> Iterator[Paper]:
+        """
+        Page through results; outcome["failed"] is set if a request failed
 
-                start += results_per_page
+        With cites, the papers citing that Scholar cluster are listed instead.
+        """
+        count = 0
+        start = 0
+        results_per_page = min(10, max_results) if max_results else 10
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Network error during search: {e}")
+        while max_results is None or count < max_results:
+            html = self._fetch_page(
+                query, start, results_per_page, year_low, year_high, cites
+            )
+            if html is None:
+                if outcome is not None:
+                    outcome["failed"] = True
                 break
-            except Exception as e:
-                logger.error(f"Search error: {e}")
+
+            papers, entries = self._parse_page(html)
+            for paper in papers:
+                yield paper
+                count += 1
+                if max_results is not None and count >= max_results:
+                    return
+
+            # A short page is the last one; skip the request for an empty page
+            if entries < results_per_page:
+                logger.info("No more results found")
                 break
 
-        return papers[:max_results]
+            start += results_per_page
+
+    async def _aiter_papers(
+        self,
+        query: str,
+        max_results: int | None,
+        year_low: int | None,
+        year_high: int | None,
+        outcome: dict | None = None,
+    ) -> AsyncIterator[Paper]:
+        """
+        Async counterpart of _iter_papers
+
+        Pages are parsed and their records stored in a worker thread.
+        """
+        count = 0
+        start = 0
+        results_per_page = min(10, max_results) if max_results else 10
+
+        while max_results is None or count < max_results:
+            html = await self._afetch_page(
+                query, start, results_per_page, year_low, year_high
+            )
+            if html is None:
+                if outcome is not None:
+                    outcome["failed"] = True
+                break
+
+            papers, entries = await asyncio.to_thread(self._parse_page, html)
+            for paper in papers:
+                yield paper
+                count += 1
+                if max_results is not None and count >= max_results:
+                    return
+
+            if entries < results_per_page:
+                logger.info("No more results found")
+                break
+
+            start += results_per_page
+
+    def _parse_page(self, html: str) -> tuple[list[Paper], int]:
+        """
+        Parse a result page and add its papers to the lookup index
+
+        Returns:
+            The papers on the page and its number of result entries
+        """
+        results = list(self._iter_results(html))
+        papers = [paper for paper in results if paper]
+        self._remember(papers)
+        return papers, len(results)
+
+    def _search_params(
+        self,
+        query: str,
+        start: int,
+        results_per_page: int,
+        year_low: int | None,
+        year_high: int | None,
+        cites: str | None = None,
+    ) -> dict:
+        """Query string of one result page"""
+        params = {
+            "q": query,
+            "start": start,
+            "hl": "en",
+            "as_sdt": "0,5",  # Include articles and citations
+            "num": results_per_page,
+        }
+        if cites:
+            params["cites"] = cites
+            if not query:
+                del params["q"]
+
+        # Add year filters if provided
+        if year_low:
+            params["as_ylo"] = year_low
+        if year_high:
+            params["as_yhi"] = year_high
+        return params
+
+    def _fetch_page(
+        self,
+        query: str,
+        start: int,
+        results_per_page: int,
+        year_low: int | None,
+        year_high: int | None,
+        cites: str | None = None,
+    ) -> str | None:
+        """Fetch one result page, returning its HTML or None on failure"""
+        try:
+            params = self._search_params(
+                query, start, results_per_page, year_low, year_high, cites
+            )
+            for _ in range(self.max_retries + 1):
+                if not self.rate_limiter.acquire(timeout=self.max_wait):
+                    logger.error("Google Scholar is rate limited, giving up")
+                    return None
+                response = self.session.get(self.SCHOLAR_URL, params=params)
+                retry, html = self._read_page(response)
+                if not retry:
+                    return html
+
+            logger.error("Google Scholar kept throttling requests, giving up")
+
+        except httpx.HTTPError as e:
+            logger.error(f"Network error during search: {e}")
+        except Exception as e:
+            logger.error(f"Search error: {e}")
+        return None
+
+    async def _afetch_page(
+        self,
+        query: str,
+        start: int,
+        results_per_page: int,
+        year_low: int | None,
+        year_high: int | None,
+    ) -> str | None:
+        """Async counterpart of _fetch_page"""
+        try:
+            params = self._search_params(
+                query, start, results_per_page, year_low, year_high
+            )
+            client = self._get_async_client()
+            for _ in range(self.max_retries + 1):
+                if not await self.rate_limiter.acquire_async(timeout=self.max_wait):
+                    logger.error("Google Scholar is rate limited, giving up")
+                    return None
+                response = await client.get(self.SCHOLAR_URL, params=params)
+                retry, html = self._read_page(response)
+                if not retry:
+                    return html
+
+            logger.error("Google Scholar kept throttling requests, giving up")
+
+        except httpx.HTTPError as e:
+            logger.error(f"Network error during search: {e}")
+        except Exception as e:
+            logger.error(f"Search error: {e}")
+        return None
+
+    def _read_page(self, response: httpx.Response) -> tuple[bool, str | None]:
+        """
+        Check a result page response and update the rate limiter
+
+        Returns:
+            (retry, html): retry is True after a throttling response; otherwise
+            html is the page, or None if the request failed
+        """
+        if self._is_throttled(response):
+            self.rate_limiter.penalize(self._retry_after(response))
+            return True, None
+
+        if response.status_code != 200:
+            logger.error(f"Search failed with status {response.status_code}")
+            return False, None
+
+        self.rate_limiter.reward()
+        return False, response.text
+
+    def _is_throttled(self, response: httpx.Response) -> bool:
+        """Whether Scholar answered with a rate limit or CAPTCHA page"""
+        if response.status_code == 429:
+            return True
+        if response.status_code not in (200, 302, 403, 503):
+            return False
+        text = f"{response.url} {response.text[:4096]}"
+        return any(marker in text for marker in CAPTCHA_MARKERS)
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        """Seconds requested by a Retry-After header, if any"""
+        try:
+            return float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return None
 
     def download_pdf(self, paper_id: str, save_path: str) -> str:
         """
@@ -1,15 +1,27 @@
 # apaper/platforms/iacr.py
+import hashlib
 import logging
 import os
 import random
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import ClassVar
+from typing import Any, ClassVar
+from urllib.parse import urlsplit
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from ..models.paper import Paper
+from ..utils.cache import PersistentCache
+from ..utils.html import check_backend, has_class, parse_only
+from ..utils.pdf_store import PDFStore
+from ..utils.transport import create_client
 from .base import PaperSource
+from .iacr_mirror import IACRMirror
 
 logger = logging.getLogger(__name__)
 
@@ -24,19 +36,61 @@ class IACRSearcher(PaperSource):
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
     ]
+    REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+    DOWNLOAD_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+    CHUNK_SIZE = 64 * 1024
+    # Mirrors not synced within this many seconds are bypassed for live search
+    MIRROR_MAX_AGE = 7 * 86400
+    # Elements the fast backend builds from search and paper pages
+    SEARCH_STRAINER = SoupStrainer("div", class_="mb-4")
+    DETAIL_STRAINER = SoupStrainer(["h3", "p", "dt", "dd"])
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        cache: PersistentCache | None = None,
+        mirror: IACRMirror | None = None,
+        html_backend: str = "full",
+        max_per_host: int = 4,
+        pdf_store: PDFStore | None = None,
+        mirror_max_age: float | None = MIRROR_MAX_AGE,
+    ):
+        """
+        Initialize IACR searcher
 
-    def __init__(self):
+        Args:
+            max_workers: Maximum number of paper detail pages fetched in parallel
+            cache: Optional persistent cache for parsed paper details
+            mirror: Optional offline mirror answering searches once populated
+            html_backend: "full" (complete parse tree) or "fast" (strained,
+                single-pass extraction); both return identical papers
+            max_per_host: Maximum number of concurrent PDF downloads per host
+            pdf_store: Optional content-addressed store deduplicating PDF downloads
+            mirror_max_age: Seconds after its last sync the mirror is still used
+                for searches (None to always use a populated mirror)
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max(1, max_per_host)
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        # Per-paper download locks and the number of callers holding or awaiting them
+        self._download_locks: dict[str, tuple[threading.Lock, int]] = {}
+        self.pdf_store = pdf_store
+        self.cache = cache
+        self.mirror = mirror
+        self.mirror_max_age = mirror_max_age
+        self.html_backend = check_backend(html_backend)
         self._setup_session()
 
     def _setup_session(self):
         """Initialize session with random user agent"""
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
+        self.session = create_client(
+            headers={
                 "User-Agent": random.choice(self.BROWSERS),
                 "Accept": "text/html,application/xhtml+xml",
                 "Accept-Language": "en-US,en;q=0.9",
-            }
+            },
+            timeout=self.REQUEST_TIMEOUT,
         )
 
     def _parse_date(self, date_str: str) -> datetime | None:
@@ -47,6 +101,16 @@ class IACRSearcher(PaperSource):
             logger.warning(f"Could not parse date: {date_str}")
             return None
 
+    def _extract_paper_id(self, item: Tag) -> str | None:
+        """Extract the paper ID (e.g., "2025/1014") from a search result entry"""
+        header_div = item.find("div", class_="d-flex")
+        if not header_div:
+            return None
+        paper_link = header_div.find("a", class_="paperlink")
+        if not paper_link:
+            return None
+        return paper_link.get_text(strip=True)
+
     def _parse_paper(self, item, fetch_details: bool = True) -> Paper | None:
         """Parse single paper entry from IACR HTML and optionally fetch detailed info"""
         try:
@@ -74,71 +138,164 @@ class IACRSearcher(PaperSource):
                     )
 
             # Fallback: parse from search results if detailed fetch fails or is disabled
-            paper_url = self.IACR_BASE_URL + paper_link["href"]
-
-            # Get PDF URL
+            # Get PDF URL and last updated date
             pdf_link = header_div.find("a", href=True, string="(PDF)")
-            pdf_url = self.IACR_BASE_URL + pdf_link["href"] if pdf_link else ""
-
-            # Get last updated date
             last_updated_elem = header_div.find("small", class_="ms-auto")
-            updated_date = None
-            if last_updated_elem:
-                date_text = last_updated_elem.get_text(strip=True)
-                if "Last updated:" in date_text:
-                    date_str = date_text.replace("Last updated:", "").strip()
-                    updated_date = self._parse_date(date_str)
 
             # Get content from the second div
             content_div = item.find("div", class_="ms-md-4")
             if not content_div:
                 return None
 
-            # Extract title
-            title_elem = content_div.find("strong")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # Extract authors
-            authors_elem = content_div.find("span", class_="fst-italic")
-            authors = []
-            if authors_elem:
-                authors_text = authors_elem.get_text(strip=True)
-                authors = [author.strip() for author in authors_text.split(",")]
-
-            # Extract category
-            category_elem = content_div.find("small", class_="badge")
-            categories = []
-            if category_elem:
-                category_text = category_elem.get_text(strip=True)
-                categories = [category_text]
-
-            # Extract abstract
-            abstract_elem = content_div.find("p", class_="search-abstract")
-            abstract = abstract_elem.get_text(strip=True) if abstract_elem else ""
-
-            # Create paper object with search result data
-            published_date = updated_date if updated_date else datetime(1900, 1, 1)
-
-            return Paper(
-                paper_id=paper_id,
-                title=title,
-                authors=authors,
-                abstract=abstract,
-                url=paper_url,
-                pdf_url=pdf_url,
-                published_date=published_date,
-                updated_date=updated_date,
-                source="iacr",
-                categories=categories,
-                keywords=[],
-                doi="",
-                citations=0,
+            return self._build_search_paper(
+                paper_id,
+                href=str(paper_link["href"]),
+                pdf_href=str(pdf_link["href"]) if pdf_link else None,
+                updated_elem=last_updated_elem,
+                title_elem=content_div.find("strong"),
+                authors_elem=content_div.find("span", class_="fst-italic"),
+                category_elem=content_div.find("small", class_="badge"),
+                abstract_elem=content_div.find("p", class_="search-abstract"),
             )
 
         except Exception as e:
             logger.warning(f"Failed to parse IACR paper: {e}")
             return None
 
+    def _build_search_paper(
+        self,
+        paper_id: str,
+        href: str,
+        pdf_href: str | None,
+        updated_elem: Tag | None,
+        title_elem: Tag | None,
+        authors_elem: Tag | None,
+        category_elem: Tag | None,
+        abstract_elem: Tag | None,
+    ) -> Paper:
+        """Create a Paper from the elements of a search result entry"""
+        paper_url = self.IACR_BASE_URL + href
+        pdf_url = self.IACR_BASE_URL + pdf_href if pdf_href else ""
+
+        # Get last updated date
+        updated_date = None
+        if updated_elem:
+            date_text = updated_elem.get_text(strip=True)
+            if "Last updated:" in date_text:
+                date_str = date_text.replace("Last updated:", "").strip()
+                updated_date = self._parse_date(date_str)
+
+        # Extract title
+        title = title_elem.get_text(strip=True) if title_elem else ""
+
+        # Extract authors
+        authors = []
+        if authors_elem:
+            authors_text = authors_elem.get_text(strip=True)
+            authors = [author.strip() for author in authors_text.split(",")]
+
+        # Extract category
+        categories = []
+        if category_elem:
+            categories = [category_elem.get_text(strip=True)]
+
+        # Extract abstract
+        abstract = abstract_elem.get_text(strip=True) if abstract_elem else ""
+
+        # Create paper object with search result data
+        published_date = updated_date if updated_date else datetime(1900, 1, 1)
+
+        return Paper(
+            paper_id=paper_id,
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            url=paper_url,
+            pdf_url=pdf_url,
+            published_date=published_date,
+            updated_date=updated_date,
+            source="iacr",
+            categories=categories,
+            keywords=[],
+            doi="",
+            citations=0,
+        )
+
+    def _parse_search_row_fast(self, item: Tag) -> tuple[str | None, Paper | None]:
+        """Extract paper ID and search-row paper in a single walk over the entry"""
+        try:
+            header = content = paper_link = pdf_link = updated_elem = None
+            title_elem = authors_elem = category_elem = abstract_elem = None
+
+            # The header div precedes the content div, so each tag can be
+            # attributed to one of them by document order alone
+            for tag in item.find_all(True):
+                name = tag.name
+                if name == "div":
+                    if header is None and has_class(tag, "d-flex"):
+                        header = tag
+                    elif content is None and has_class(tag, "ms-md-4"):
+                        content = tag
+                elif content is not None:
+                    if name == "strong":
+                        title_elem = title_elem or tag
+                    elif name == "span" and has_class(tag, "fst-italic"):
+                        authors_elem = authors_elem or tag
+                    elif name == "small" and has_class(tag, "badge"):
+                        category_elem = category_elem or tag
+                    elif name == "p" and has_class(tag, "search-abstract"):
+                        abstract_elem = abstract_elem or tag
+                elif header is not None:
+                    if name == "a":
+                        if paper_link is None and has_class(tag, "paperlink"):
+                            paper_link = tag
+                        elif (
+                            pdf_link is None
+                            and tag.get("href")
+                            and tag.string == "(PDF)"
+                        ):
+                            pdf_link = tag
+                    elif name == "small" and has_class(tag, "ms-auto"):
+                        updated_elem = updated_elem or tag
+
+            if paper_link is None:
+                return None, None
+            paper_id = paper_link.get_text(strip=True)
+            if content is None:
+                return paper_id, None
+
+            return paper_id, self._build_search_paper(
+                paper_id,
+                href=str(paper_link["href"]),
+                pdf_href=str(pdf_link["href"]) if pdf_link else None,
+                updated_elem=updated_elem,
+                title_elem=title_elem,
+                authors_elem=authors_elem,
+                category_elem=category_elem,
+                abstract_elem=abstract_elem,
+            )
+
+        except Exception as e:
+            logger.warning(f"Failed to parse IACR paper: {e}")
+            return None, None
+
+    def _iter_search_results(self, html: str) -> Iterator[tuple[str, Paper | None]]:
+        """Yield (paper_id, search-row paper) for each result entry, in page order"""
+        if self.html_backend == "fast":
+            soup = parse_only(html, self.SEARCH_STRAINER)
+            for item in soup.find_all("div", class_="mb-4"):
+                paper_id, paper = self._parse_search_row_fast(item)
+                if paper_id:
+                    yield paper_id, paper
+            return
+
+        # Find all paper entries - they are divs with class "mb-4"
+        soup = BeautifulSoup(html, "html.parser")
+        for item in soup.find_all("div", class_="mb-4"):
+            paper_id = self._extract_paper_id(item)
+            if paper_id:
+                yield paper_id, self._parse_paper(item, fetch_details=False)
+
     def search(
         self,
         query: str,
@@ -150,6 +307,10 @@ class IACRSearcher(PaperSource):
         """
         Search IACR ePrint Archive
 
+        Searches are answered from the offline mirror when one is configured,
+        populated and synced within mirror_max_age; otherwise eprint.iacr.org
+        is queried live.
+
         Args:
             query: Search query string
             max_results: Maximum number of results to return
@@ -160,7 +321,67 @@ class IACRSearcher(PaperSource):
         Returns:
             List[Paper]: List of paper objects
         """
-        papers = []
+        return list(
+            self.iter_search(
+                query,
+                max_results=max_results,
+                fetch_details=fetch_details,
+                year_min=year_min,
+                year_max=year_max,
+            )
+        )
+
+    def iter_search(
+        self,
+        query: str,
+        max_results: int | None = None,
+        fetch_details: bool = True,
+        year_min: int | None = None,
+        year_max: int | None = None,
+    ) -> Iterator[Paper]:
+        """
+        Lazily search IACR ePrint Archive
+
+        Result entries are parsed only as they are consumed. With
+        fetch_details, detail pages are fetched in parallel at most
+        ``max_workers`` entries ahead of the consumer, and no further
+        pages are requested once the generator is closed.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to yield (None for all)
+            fetch_details: Whether to fetch detailed information for each paper
+            year_min: Minimum publication year (revised after)
+            year_max: Maximum publication year (revised before)
+
+        Yields:
+            Paper: Papers in result order
+        """
+        if max_results is not None and max_results <= 0:
+            return
+
+        if self.mirror is not None:
+            try:
+                mirrored = (
+                    self.mirror.search(
+                        query,
+                        max_results=max_results,
+                        year_min=year_min,
+                        year_max=year_max,
+                    )
+                    if self._mirror_is_current(self.mirror)
+                    else None
+                )
+            except Exception as e:
+                logger.warning(f"IACR mirror search failed, searching online: {e}")
+                mirrored = None
+            if mirrored is not None:
+                if fetch_details:
+                    hits = ((paper.paper_id, paper) for paper in mirrored)
+                    yield from self._iter_with_details(hits, max_results)
+                else:
+                    yield from mirrored
+                return
 
         try:
             # Construct search parameters
@@ -175,42 +396,101 @@ class IACRSearcher(PaperSource):
 
             if response.status_code != 200:
                 logger.error(f"IACR search failed with status {response.status_code}")
-                return papers
-
-            # Parse results
-            soup = BeautifulSoup(response.text, "html.parser")
+                return
 
-            # Find all paper entries - they are divs with class "mb-4"
-            results = soup.find_all("div", class_="mb-4")
-
-            if not results:
+            rows = self._iter_search_results(response.text)
+            if fetch_details:
+                yield from self._iter_with_details(rows, max_results)
+                return
+
+            count = 0
+            for _paper_id, row_paper in rows:
+                if row_paper:
+                    yield row_paper
+                    count += 1
+                    if max_results is not None and count >= max_results:
+                        return
+            if count == 0:
                 logger.info("No results found for the query")
-                return papers
-
-            # Process each result
-            for i, item in enumerate(results):
-                if len(papers) >= max_results:
-                    break
-
-                logger.info(
-                    f"Processing paper {i + 1}/{min(len(results), max_results)}"
-                )
-                paper = self._parse_paper(item, fetch_details=fetch_details)
-                if paper:
-                    papers.append(paper)
 
         except Exception as e:
             logger.error(f"IACR search error: {e}")
 
-        return papers[:max_results]
-
-    def download_pdf(self, paper_id: str, save_path: str) -> str:
+    def _mirror_is_current(self, mirror: IACRMirror) -> bool:
+        """Whether the mirror is populated and was synced within mirror_max_age"""
+        if not mirror.is_populated():
+            return False
+        if self.mirror_max_age is None:
+            return True
+        synced = mirror.last_synced
+        if synced is None or (
+            (datetime.now() - synced).total_seconds() > self.mirror_max_age
+        ):
+            logger.info("IACR mirror is out of date, searching online")
+            return False
+        return True
+
+    def _iter_with_details(
+        self, rows: Iterator[tuple[str, Paper | None]], limit: int | None
+    ) -> Iterator[Paper]:
+        """Yield detailed papers for rows, fetching a bounded window ahead in parallel"""
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="iacr-details"
+        )
+        pending: deque[tuple[str, Paper | None, Future]] = deque()
+        yielded = 0
+        try:
+            while True:
+                # Keep the window full, but never request more than still needed,
+                # so an entry that fails to parse is replaced by the next one
+                while len(pending) < self.max_workers and (
+                    limit is None or yielded + len(pending) < limit
+                ):
+                    row = next(rows, None)
+                    if row is None:
+                        break
+                    paper_id, row_paper = row
+                    future = executor.submit(self.get_paper_details, paper_id)
+                    pending.append((paper_id, row_paper, future))
+
+                if not pending:
+                    if yielded == 0:
+                        logger.info("No results found for the query")
+                    return
+
+                paper_id, row_paper, future = pending.popleft()
+                paper = future.result()
+                if paper is None:
+                    logger.warning(
+                        f"Could not fetch details for {paper_id}, falling back to search result parsing"
+                    )
+                    paper = row_paper
+                if paper is not None:
+                    yielded += 1
+                    yield paper
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def download_pdf(
+        self,
+        paper_id: str,
+        save_path: str,
+        expected_size: int | None = None,
+        sha256: str | None = None,
+    ) -> str:
         """
         Download PDF from IACR ePrint Archive
 
+        The PDF is streamed in chunks to a ".part" file that is renamed into
+        place once complete. If a previous download was interrupted, the
+        partial file is resumed with an HTTP Range request. With a PDF store,
+        papers already stored are linked into save_path without any request.
+
         Args:
             paper_id: IACR paper ID (e.g., "2025/1014")
             save_path: Path to save the PDF
+            expected_size: Optional expected file size in bytes
+            sha256: Optional expected SHA-256 hex digest of the file
 
         Returns:
             str: Path to downloaded file or error message
@@ -218,25 +498,186 @@ class IACRSearcher(PaperSource):
         try:
             os.makedirs(save_path, exist_ok=True)
             pdf_url = f"{self.IACR_BASE_URL}/{paper_id}.pdf"
+            filename = f"{save_path}/iacr_{paper_id.replace('/', '_')}.pdf"
+            store_key = f"iacr:{paper_id}"
+
+            with self._download_lock(store_key):
+                if self.pdf_store is not None:
+                    blob = self.pdf_store.get(store_key, sha256=sha256)
+                    if blob is not None and (
+                        expected_size is None or blob.stat().st_size == expected_size
+                    ):
+                        logger.info(f"Using stored PDF for {paper_id}")
+                        self.pdf_store.link(blob, filename)
+                        return filename
+                    partial = os.fspath(self.pdf_store.partial_path(store_key))
+                else:
+                    partial = f"{filename}.part"
 
-            response = self.session.get(pdf_url)
-
-            if response.status_code == 200:
-                filename = f"{save_path}/iacr_{paper_id.replace('/', '_')}.pdf"
-                with open(filename, "wb") as f:
-                    f.write(response.content)
-                return filename
-            else:
-                return f"Failed to download PDF: HTTP {response.status_code}"
+                return self._stream_pdf(
+                    paper_id, pdf_url, partial, filename, expected_size, sha256
+                )
 
         except Exception as e:
             logger.error(f"PDF download error: {e}")
             return f"Error downloading PDF: {e}"
 
+    def _stream_pdf(
+        self,
+        paper_id: str,
+        pdf_url: str,
+        partial: str,
+        filename: str,
+        expected_size: int | None,
+        sha256: str | None,
+    ) -> str:
+        """Stream pdf_url into partial, verify it and move it to filename"""
+        while True:
+            offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+            # PDFs are kept by the PDF store, not the in-memory response cache
+            headers = {"Cache-Control": "no-store"}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            digest = hashlib.sha256() if sha256 else None
+
+            with (
+                self._host_slot(pdf_url),
+                self.session.stream(
+                    "GET", pdf_url, headers=headers, timeout=self.DOWNLOAD_TIMEOUT
+                ) as response,
+            ):
+                if response.status_code == 416 and offset:
+                    # The partial file does not match the remote file any more;
+                    # start over once the host slot and response are released
+                    os.remove(partial)
+                    continue
+
+                if response.status_code == 206 and offset:
+                    logger.info(f"Resuming download of {paper_id} at byte {offset}")
+                    mode = "ab"
+                    if digest:
+                        with open(partial, "rb") as f:
+                            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                                digest.update(chunk)
+                elif response.status_code == 200:
+                    mode = "wb"
+                    offset = 0
+                else:
+                    return f"Failed to download PDF: HTTP {response.status_code}"
+
+                total = self._content_total(response, offset)
+                with open(partial, mode) as f:
+                    for chunk in response.iter_bytes(chunk_size=self.CHUNK_SIZE):
+                        f.write(chunk)
+                        if digest:
+                            digest.update(chunk)
+            break
+
+        size = os.path.getsize(partial)
+        if total is not None and size < total:
+            # Keep the partial file so the next attempt can resume it
+            return (
+                f"Error downloading PDF: incomplete download ({size} of {total} bytes)"
+            )
+
+        if (expected_size is not None and size != expected_size) or (
+            digest and digest.hexdigest().lower() != (sha256 or "").lower()
+        ):
+            os.remove(partial)
+            return f"Error downloading PDF: size or checksum mismatch for {paper_id}"
+
+        if self.pdf_store is not None:
+            blob = self.pdf_store.add(f"iacr:{paper_id}", partial)
+            self.pdf_store.link(blob, filename)
+        else:
+            os.replace(partial, filename)
+        return filename
+
+    def download_pdfs(
+        self, paper_ids: list[str], save_path: str, max_workers: int = 16
+    ) -> list[dict[str, Any]]:
+        """
+        Download several PDFs concurrently
+
+        Downloads run in a thread pool; the number of simultaneous requests to
+        one host is additionally capped by ``max_per_host``.
+
+        Args:
+            paper_ids: IACR paper IDs (duplicates are downloaded once)
+            save_path: Directory to save the PDFs
+            max_workers: Maximum number of downloads in flight
+
+        Returns:
+            List of {"paper_id", "success", "path", "error"} dicts in input order
+        """
+        unique_ids = list(
+            dict.fromkeys(pid.strip() for pid in paper_ids if pid.strip())
+        )
+        if not unique_ids:
+            return []
+
+        def download(paper_id: str) -> dict[str, Any]:
+            result = self.download_pdf(paper_id, save_path)
+            failed = result.startswith(("Error", "Failed"))
+            return {
+                "paper_id": paper_id,
+                "success": not failed,
+                "path": None if failed else result,
+                "error": result if failed else None,
+            }
+
+        workers = max(1, min(max_workers, len(unique_ids)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="iacr-downloads"
+        ) as executor:
+            return list(executor.map(download, unique_ids))
+
+    @contextmanager
+    def _download_lock(self, key: str) -> Iterator[None]:
+        """Serialize downloads of the same paper, dropping the lock once unused"""
+        with self._host_slots_lock:
+            lock, users = self._download_locks.get(key, (threading.Lock(), 0))
+            self._download_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._host_slots_lock:
+                lock, users = self._download_locks[key]
+                if users == 1:
+                    del self._download_locks[key]
+                else:
+                    self._download_locks[key] = (lock, users - 1)
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore limiting concurrent downloads from the host of url"""
+        host = urlsplit(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def _content_total(self, response: httpx.Response, offset: int) -> int | None:
+        """Total file size announced by the server, if any"""
+        content_range = response.headers.get("Content-Range", "")
+        if "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            if total.isdigit():
+                return int(total)
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit():
+            return offset + int(length)
+        return None
+
     def get_paper_details(self, paper_id: str) -> Paper | None:
         """
         Fetch detailed information for a specific IACR paper
 
+        When a cache is configured, fresh entries are returned without any
+        network access and stale entries are revalidated with a conditional GET.
+
         Args:
             paper_id: IACR paper ID (e.g., "2009/101") or full URL
 
@@ -254,8 +695,19 @@ class IACRSearcher(PaperSource):
             else:
                 paper_url = f"{self.IACR_BASE_URL}/{paper_id}"
 
-            # Make request
-            response = self.session.get(paper_url)
+            cache = self.cache
+            cached = cache.get(paper_id) if cache is not None else None
+            if cached and cache is not None and cache.is_fresh(cached):
+                return Paper.from_dict(cached.value)
+
+            # Make request, revalidating the cached copy if there is one
+            headers = cached.validators() if cached else {}
+            response = self.session.get(paper_url, headers=headers)
+
+            if response.status_code == 304 and cached and cache is not None:
+                logger.info(f"Cached details for {paper_id} are still valid")
+                cache.touch(paper_id)
+                return Paper.from_dict(cached.value)
 
             if response.status_code != 200:
                 logger.error(
@@ -263,108 +715,218 @@ class IACRSearcher(PaperSource):
                 )
                 return None
 
-            # Parse the page
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract title from h3 element
-            title = ""
-            title_elem = soup.find("h3", class_="mb-3")
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-
-            # Extract authors from the italic paragraph
-            authors = []
-            author_elem = soup.find("p", class_="fst-italic")
-            if author_elem:
-                author_text = author_elem.get_text(strip=True)
-                # Split by " and " to get individual authors
-                authors = [
-                    author.strip()
-                    for author in author_text.replace(" and ", ",").split(",")
-                ]
-
-            # Extract abstract using multiple strategies
-            abstract = ""
-
-            # Look for paragraph with white-space: pre-wrap style (current method)
-            abstract_p = soup.find("p", style="white-space: pre-wrap;")
-            if abstract_p:
-                abstract = abstract_p.get_text(strip=True)
-
-            # Extract metadata using a simpler, safer approach
-            publication_info = ""
-            keywords = []
-            history_entries = []
-            last_updated = None
-
-            # Extract publication info
-            page_text = soup.get_text()
-            lines = page_text.split("\n")
-
-            # Find publication info
-            for i, line in enumerate(lines):
-                if "Publication info" in line and i + 1 < len(lines):
-                    publication_info = lines[i + 1].strip()
-                    break
+            paper = self._parse_paper_details(response.text, paper_id, paper_url)
+            if self.cache is not None:
+                self.cache.set(
+                    paper_id,
+                    paper.to_dict(),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+            return paper
 
-            # Find keywords using CSS selector for keyword badges
-            try:
-                keyword_elements = soup.select("a.badge.bg-secondary.keyword")
-                keywords = [elem.get_text(strip=True) for elem in keyword_elements]
-            except Exception:
-                keywords = []
-
-            # Find history entries
-            history_found = False
-            for _i, line in enumerate(lines):
-                if "History" in line and ":" not in line:
-                    history_found = True
-                    continue
-                elif (
-                    history_found
-                    and ":" in line
-                    and not line.strip().startswith("Short URL")
-                ):
-                    history_entries.append(line.strip())
-                    # Try to extract the last updated date from the first history entry
-                    if not last_updated:
-                        date_str = line.split(":")[0].strip()
-                        try:
-                            last_updated = datetime.strptime(date_str, "%Y-%m-%d")
-                        except ValueError:
-                            pass
-                elif history_found and (
-                    line.strip().startswith("Short URL")
-                    or line.strip().startswith("License")
-                ):
-                    break
+        except Exception as e:
+            logger.error(f"Error fetching paper details for {paper_id}: {e}")
+            return None
 
-            # Combine history entries
-            history = "; ".join(history_entries) if history_entries else ""
+    def _parse_paper_details(self, html: str, paper_id: str, paper_url: str) -> Paper:
+        """Parse an ePrint paper page into a Paper"""
+        if self.html_backend == "fast":
+            return self._parse_paper_details_fast(html, paper_id, paper_url)
+
+        soup = BeautifulSoup(html, "html.parser")
+
+        # Extract title from h3 element
+        title = ""
+        title_elem = soup.find("h3", class_="mb-3")
+        if title_elem:
+            title = title_elem.get_text(strip=True)
+
+        # Extract authors from the italic paragraph
+        authors = []
+        author_elem = soup.find("p", class_="fst-italic")
+        if author_elem:
+            author_text = author_elem.get_text(strip=True)
+            # Split by " and " to get individual authors
+            authors = [
+                author.strip()
+                for author in author_text.replace(" and ", ",").split(",")
+            ]
+
+        # Extract abstract using multiple strategies
+        abstract = ""
+
+        # Look for paragraph with white-space: pre-wrap style (current method)
+        abstract_p = soup.find("p", style="white-space: pre-wrap;")
+        if abstract_p:
+            abstract = abstract_p.get_text(strip=True)
+
+        # Extract metadata using a simpler, safer approach
+        publication_info = ""
+        keywords = []
+        history_entries = []
+        last_updated = None
+
+        # Extract publication info
+        page_text = soup.get_text()
+        lines = page_text.split("\n")
+
+        # Find publication info
+        for i, line in enumerate(lines):
+            if "Publication info" in line and i + 1 < len(lines):
+                publication_info = lines[i + 1].strip()
+                break
+
+        # Find keywords using CSS selector for keyword badges
+        try:
+            keyword_elements = soup.select("a.badge.bg-secondary.keyword")
+            keywords = [elem.get_text(strip=True) for elem in keyword_elements]
+        except Exception:
+            keywords = []
 
-            # Construct PDF URL
-            pdf_url = f"{self.IACR_BASE_URL}/{paper_id}.pdf"
+        # Find history entries
+        history_found = False
+        for _i, line in enumerate(lines):
+            if "History" in line and ":" not in line:
+                history_found = True
+                continue
+            elif (
+                history_found
+                and ":" in line
+                and not line.strip().startswith("Short URL")
+            ):
+                history_entries.append(line.strip())
+                # Try to extract the last updated date from the first history entry
+                if not last_updated:
+                    date_str = line.split(":")[0].strip()
+                    try:
+                        last_updated = datetime.strptime(date_str, "%Y-%m-%d")
+                    except ValueError:
+                        pass
+            elif history_found and (
+                line.strip().startswith("Short URL")
+                or line.strip().startswith("License")
+            ):
+                break
+
+        return self._build_detail_paper(
+            paper_id,
+            paper_url,
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            keywords=keywords,
+            publication_info=publication_info,
+            history_entries=history_entries,
+            last_updated=last_updated,
+        )
 
-            # Use last updated date or current date as published date
-            published_date = last_updated if last_updated else datetime.now()
-
-            return Paper(
-                paper_id=paper_id,
-                title=title,
-                authors=authors,
-                abstract=abstract,
-                url=paper_url,
-                pdf_url=pdf_url,
-                published_date=published_date,
-                updated_date=last_updated,
-                source="iacr",
-                categories=[],
-                keywords=keywords,
-                doi="",
-                citations=0,
-                extra={"publication_info": publication_info, "history": history},
-            )
+    def _parse_paper_details_fast(
+        self, html: str, paper_id: str, paper_url: str
+    ) -> Paper:
+        """Parse an ePrint paper page with a strained tree in a single pass"""
+        soup = parse_only(html, self.DETAIL_STRAINER)
+
+        title = ""
+        authors: list[str] = []
+        abstract = ""
+        keywords = []
+        publication_info = ""
+        history_entries: list[str] = []
+        last_updated = None
+        seen_title = seen_authors = seen_abstract = False
+        term = None
+
+        for tag in soup.find_all(True):
+            name = tag.name
+            if name == "h3":
+                if not seen_title and has_class(tag, "mb-3"):
+                    seen_title = True
+                    title = tag.get_text(strip=True)
+            elif name == "p":
+                if not seen_authors and has_class(tag, "fst-italic"):
+                    seen_authors = True
+                    author_text = tag.get_text(strip=True)
+                    authors = [
+                        author.strip()
+                        for author in author_text.replace(" and ", ",").split(",")
+                    ]
+                elif not seen_abstract and tag.get("style") == "white-space: pre-wrap;":
+                    seen_abstract = True
+                    abstract = tag.get_text(strip=True)
+            elif name == "a":
+                classes = tag.get("class") or ()
+                if (
+                    "keyword" in classes
+                    and "badge" in classes
+                    and "bg-secondary" in classes
+                ):
+                    keywords.append(tag.get_text(strip=True))
+            elif name == "dt":
+                term = tag.get_text(strip=True)
+            elif name == "dd" and term:
+                if term == "Publication info" and not publication_info:
+                    publication_info = tag.get_text().split("\n")[0].strip()
+                elif term == "History":
+                    for line in tag.get_text().split("\n"):
+                        if ":" not in line:
+                            continue
+                        history_entries.append(line.strip())
+                        if not last_updated:
+                            date_str = line.split(":")[0].strip()
+                            try:
+                                last_updated = datetime.strptime(date_str, "%Y-%m-%d")
+                            except ValueError:
+                                pass
+                term = None
+
+        return self._build_detail_paper(
+            paper_id,
+            paper_url,
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            keywords=keywords,
+            publication_info=publication_info,
+            history_entries=history_entries,
+            last_updated=last_updated,
+        )
 
-        except Exception as e:
-            logger.error(f"Error fetching paper details for {paper_id}: {e}")
-            return None
+    def _build_detail_paper(
+        self,
+        paper_id: str,
+        paper_url: str,
+        title: str,
+        authors: list[str],
+        abstract: str,
+        keywords: list[str],
+        publication_info: str,
+        history_entries: list[str],
+        last_updated: datetime | None,
+    ) -> Paper:
+        """Create a Paper from the fields of an ePrint paper page"""
+        # Combine history entries
+        history = "; ".join(history_entries) if history_entries else ""
+
+        # Construct PDF URL
+        pdf_url = f"{self.IACR_BASE_URL}/{paper_id}.pdf"
+
+        # Use last updated date or current date as published date
+        published_date = last_updated if last_updated else datetime.now()
+
+        return Paper(
+            paper_id=paper_id,
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            url=paper_url,
+            pdf_url=pdf_url,
+            published_date=published_date,
+            updated_date=last_updated,
+            source="iacr",
+            categories=[],
+            keywords=keywords,
+            doi="",
+            citations=0,
+            extra={"publication_info": publication_info, "history": history},
+        )
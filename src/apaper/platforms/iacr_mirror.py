@@ -0,0 +1,417 @@
+# apaper/platforms/iacr_mirror.py
+"""Offline mirror of the IACR ePrint Archive metadata.
+
+The mirror harvests paper metadata through the ePrint OAI-PMH interface
+(Dublin Core records) into a local SQLite database with an FTS5 index over
+titles, authors, abstracts and keywords. Later harvests are incremental: only
+records changed since the last datestamp are requested again.
+
+Usage:
+    python -m apaper.platforms.iacr_mirror [--db PATH] [--full]
+"""
+
+import argparse
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+from ..models.paper import Paper
+from ..utils.cache import default_cache_dir
+from ..utils.transport import RetryPolicy, create_client
+
+logger = logging.getLogger(__name__)
+
+# XML namespaces used by OAI-PMH Dublin Core responses
+NAMESPACES = {
+    "oai": "http://www.openarchives.org/OAI/2.0/",
+    "oai_dc": "http://www.openarchives.org/OAI/2.0/oai_dc/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    paper_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    abstract TEXT NOT NULL,
+    keywords TEXT NOT NULL,
+    published TEXT,
+    updated TEXT,
+    datestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS papers_updated ON papers (updated);
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    paper_id UNINDEXED, title, authors, abstract, keywords
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+class IACRMirror:
+    """Local full-text index of IACR ePrint metadata harvested over OAI-PMH"""
+
+    OAI_URL = "https://eprint.iacr.org/oai"
+    IACR_BASE_URL = "https://eprint.iacr.org"
+    REQUEST_TIMEOUT = 60  # seconds
+    MAX_RETRIES = 5
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        oai_url: str | None = None,
+        session: httpx.Client | None = None,
+    ):
+        """
+        Initialize the mirror
+
+        Args:
+            path: SQLite file path (default: <cache dir>/iacr_mirror.sqlite3)
+            oai_url: OAI-PMH endpoint to harvest from
+            session: HTTP session used for harvesting
+        """
+        self.path = Path(path) if path else default_cache_dir() / "iacr_mirror.sqlite3"
+        self.oai_url = oai_url or self.OAI_URL
+        # 503 is OAI-PMH flow control with long Retry-After delays; _fetch_page
+        # waits those out itself
+        self.session = session or create_client(
+            timeout=self.REQUEST_TIMEOUT,
+            retry=RetryPolicy(statuses=frozenset({502, 504})),
+            cache=False,
+        )
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connect().execute("SELECT COUNT(*) FROM papers").fetchone()
+        return int(row[0])
+
+    def is_populated(self) -> bool:
+        """Whether the mirror holds any papers (missing databases are not created)"""
+        if self._conn is None and not self.path.exists():
+            return False
+        with self._lock:
+            row = self._connect().execute("SELECT 1 FROM papers LIMIT 1").fetchone()
+        return row is not None
+
+    @property
+    def last_datestamp(self) -> str | None:
+        """OAI datestamp of the most recent harvested record"""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT value FROM sync_state WHERE name = 'datestamp'")
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    @property
+    def last_synced(self) -> datetime | None:
+        """Local time at which the last harvest completed"""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT value FROM sync_state WHERE name = 'synced_at'")
+                .fetchone()
+            )
+        return datetime.fromisoformat(row[0]) if row else None
+
+    # Harvesting
+
+    def sync(self, full: bool = False) -> int:
+        """
+        Harvest new and updated records into the local index
+
+        Args:
+            full: Ignore the stored datestamp and harvest the whole archive
+
+        Returns:
+            int: Number of records added, updated or deleted
+        """
+        params = {"verb": "ListRecords", "metadataPrefix": "oai_dc"}
+        since = None if full else self.last_datestamp
+        if since:
+            params["from"] = since
+            logger.info(f"Harvesting IACR records changed since {since}")
+        else:
+            logger.info("Harvesting the full IACR ePrint archive")
+
+        changed = 0
+        newest = since
+        while True:
+            root = self._fetch_page(params)
+
+            error = root.find("oai:error", NAMESPACES)
+            if error is not None:
+                if error.get("code") == "noRecordsMatch":
+                    break
+                raise RuntimeError(
+                    f"OAI-PMH error {error.get('code')}: {(error.text or '').strip()}"
+                )
+
+            list_records = root.find("oai:ListRecords", NAMESPACES)
+            if list_records is None:
+                break
+
+            upserts = []
+            deletions = []
+            for record in list_records.findall("oai:record", NAMESPACES):
+                header = record.find("oai:header", NAMESPACES)
+                if header is None:
+                    continue
+                paper_id = self._paper_id(
+                    header.findtext("oai:identifier", "", NAMESPACES)
+                )
+                datestamp = header.findtext("oai:datestamp", "", NAMESPACES).strip()
+                if not paper_id:
+                    continue
+                if datestamp and (newest is None or datestamp > newest):
+                    newest = datestamp
+
+                if header.get("status") == "deleted":
+                    deletions.append(paper_id)
+                else:
+                    upserts.append(self._parse_record(record, paper_id, datestamp))
+
+            # Pages are not ordered by datestamp, so the newest datestamp is only
+            # saved with the last page; an interrupted harvest starts over from
+            # the previous one instead of skipping older unharvested records
+            token = list_records.findtext("oai:resumptionToken", "", NAMESPACES)
+            token = token.strip() if token else ""
+            self._store(upserts, deletions, None if token else newest)
+            changed += len(upserts) + len(deletions)
+
+            if not token:
+                break
+            params = {"verb": "ListRecords", "resumptionToken": token}
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES ('synced_at', ?)",
+                    (datetime.now().isoformat(timespec="seconds"),),
+                )
+        logger.info(f"IACR mirror sync finished: {changed} records changed")
+        return changed
+
+    def _fetch_page(self, params: dict[str, str]) -> ET.Element:
+        """Fetch one OAI-PMH page, honouring 503 Retry-After flow control"""
+        for _attempt in range(self.MAX_RETRIES):
+            response = self.session.get(
+                self.oai_url, params=params, timeout=self.REQUEST_TIMEOUT
+            )
+            if response.status_code == 503:
+                delay = response.headers.get("Retry-After", "10")
+                wait = min(int(delay), 120) if delay.isdigit() else 10
+                logger.info(f"OAI endpoint busy, retrying in {wait}s")
+                time.sleep(wait)
+                continue
+            response.raise_for_status()
+            return ET.fromstring(response.content)
+        raise RuntimeError(f"OAI endpoint unavailable after {self.MAX_RETRIES} tries")
+
+    def _paper_id(self, identifier: str) -> str:
+        """Convert an OAI identifier (oai:eprint.iacr.org:2025/1014) to a paper ID"""
+        identifier = identifier.strip()
+        if identifier.startswith("oai:"):
+            identifier = identifier.rsplit(":", 1)[-1]
+        return identifier
+
+    def _parse_record(self, record: ET.Element, paper_id: str, datestamp: str) -> tuple:
+        """Extract the stored columns from a Dublin Core record"""
+        metadata = record.find("oai:metadata/oai_dc:dc", NAMESPACES)
+
+        def values(tag: str) -> list[str]:
+            if metadata is None:
+                return []
+            return [
+                " ".join(elem.text.split())
+                for elem in metadata.findall(f"dc:{tag}", NAMESPACES)
+                if elem.text and elem.text.strip()
+            ]
+
+        titles = values("title")
+        descriptions = values("description")
+        dates = sorted(
+            match.group(0)
+            for value in values("date")
+            if (match := _DATE_PATTERN.search(value))
+        )
+        published = dates[0] if dates else None
+        updated = dates[-1] if dates else None
+        if datestamp and _DATE_PATTERN.match(datestamp):
+            updated = max(updated or "", datestamp[:10])
+
+        return (
+            paper_id,
+            titles[0] if titles else "",
+            json.dumps(values("creator")),
+            descriptions[0] if descriptions else "",
+            json.dumps(values("subject")),
+            published,
+            updated,
+            datestamp,
+        )
+
+    def _store(
+        self, upserts: list[tuple], deletions: list[str], newest: str | None
+    ) -> None:
+        """Write one harvested page in a single transaction"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                ids = [(row[0],) for row in upserts] + [(pid,) for pid in deletions]
+                conn.executemany("DELETE FROM papers WHERE paper_id = ?", ids)
+                conn.executemany("DELETE FROM papers_fts WHERE paper_id = ?", ids)
+                conn.executemany(
+                    "INSERT INTO papers VALUES (?, ?, ?, ?, ?, ?, ?, ?)", upserts
+                )
+                conn.executemany(
+                    "INSERT INTO papers_fts VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            row[0],
+                            row[1],
+                            " ".join(json.loads(row[2])),
+                            row[3],
+                            " ".join(json.loads(row[4])),
+                        )
+                        for row in upserts
+                    ],
+                )
+                if newest:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO sync_state VALUES ('datestamp', ?)",
+                        (newest,),
+                    )
+
+    # Searching
+
+    def _match_expression(self, query: str) -> str:
+        """Turn a free-text query into an FTS5 expression matching all terms"""
+        terms = re.findall(r"\w+", query)
+        return " ".join(f'"{term}"' for term in terms)
+
+    def search(
+        self,
+        query: str,
+        max_results: int | None = 10,
+        year_min: int | None = None,
+        year_max: int | None = None,
+    ) -> list[Paper]:
+        """
+        Search the local index
+
+        Args:
+            query: Search query string (all terms must match)
+            max_results: Maximum number of results to return (None for all)
+            year_min: Minimum year of the last revision
+            year_max: Maximum year of the last revision
+
+        Returns:
+            List[Paper]: Papers ordered by relevance (newest first for empty queries)
+        """
+        conditions = []
+        args: list[str | int] = []
+        if year_min:
+            conditions.append("p.updated >= ?")
+            args.append(f"{year_min}-01-01")
+        if year_max:
+            conditions.append("p.updated < ?")
+            args.append(f"{year_max + 1}-01-01")
+
+        expression = self._match_expression(query)
+        if expression:
+            sql = (
+                "SELECT p.* FROM papers_fts f JOIN papers p ON p.paper_id = f.paper_id "
+                "WHERE papers_fts MATCH ?"
+            )
+            args.insert(0, expression)
+            order = "ORDER BY f.rank"
+        else:
+            sql = "SELECT p.* FROM papers p WHERE 1"
+            order = "ORDER BY p.updated DESC"
+        for condition in conditions:
+            sql += f" AND {condition}"
+        sql += f" {order} LIMIT ?"
+        args.append(-1 if max_results is None else max_results)
+
+        with self._lock:
+            rows = self._connect().execute(sql, args).fetchall()
+        return [self._row_to_paper(row) for row in rows]
+
+    def _row_to_paper(self, row: tuple) -> Paper:
+        """Convert a papers table row into a Paper"""
+        paper_id, title, authors, abstract, keywords, published, updated, _ = row
+        updated_date = datetime.strptime(updated, "%Y-%m-%d") if updated else None
+        published_date = (
+            datetime.strptime(published, "%Y-%m-%d")
+            if published
+            else updated_date or datetime(1900, 1, 1)
+        )
+        return Paper(
+            paper_id=paper_id,
+            title=title,
+            authors=json.loads(authors),
+            abstract=abstract,
+            url=f"{self.IACR_BASE_URL}/{paper_id}",
+            pdf_url=f"{self.IACR_BASE_URL}/{paper_id}.pdf",
+            published_date=published_date,
+            updated_date=updated_date,
+            source="iacr",
+            categories=[],
+            keywords=json.loads(keywords),
+            doi="",
+            citations=0,
+            extra={"mirror": True},
+        )
+
+
+def main() -> None:
+    """Harvest the IACR ePrint Archive into the local mirror"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", help="SQLite file for the mirror")
+    parser.add_argument(
+        "--full", action="store_true", help="re-harvest the whole archive"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    mirror = IACRMirror(args.db)
+    changed = mirror.sync(full=args.full)
+    print(f"{changed} records changed, {len(mirror)} papers in {mirror.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,20 @@
 # apaper/server.py
-"""FastMCP-based academic paper research server."""
+"""FastMCP-based academic paper research server.
 
+Tool handlers are coroutines: Google Scholar searches run on an async HTTP
+client and blocking searcher calls run in worker threads, so concurrent tool
+calls overlap instead of queuing behind a slow upstream.
+
+Every tool answers in Markdown by default; output_format="json" returns the
+same results as JSON built from Paper.to_dict, for clients that process them
+further.
+"""
+
+import asyncio
+import json
 import sys
 from pathlib import Path
+from typing import Any
 
 # Add the parent directory to path for absolute imports
 current_dir = Path(__file__).parent
@@ -11,27 +23,119 @@ sys.path.insert(0, str(parent_dir))
 
 from fastmcp import FastMCP
 from apaper.platforms import (
+    IACRMirror,
     IACRSearcher,
+    DBLPIndex,
     DBLPSearcher,
+    FederatedSearcher,
     GoogleScholarSearcher,
 )
+from apaper.utils import PDFStore, PersistentCache
 
 # Initialize FastMCP server
 mcp = FastMCP("apaper")
 
 # Initialize searchers
-iacr_searcher = IACRSearcher()
-dblp_searcher = DBLPSearcher()
-google_scholar_searcher = GoogleScholarSearcher()
+iacr_searcher = IACRSearcher(
+    cache=PersistentCache(namespace="iacr_papers"),
+    mirror=IACRMirror(),
+    html_backend="fast",
+    pdf_store=PDFStore(),
+)
+dblp_searcher = DBLPSearcher(
+    bibtex_cache=PersistentCache(namespace="dblp_bibtex", ttl=30 * 86400),
+    index=DBLPIndex(),
+    listing_cache=PersistentCache(namespace="dblp_listings", ttl=7 * 86400),
+)
+google_scholar_searcher = GoogleScholarSearcher(
+    html_backend="fast",
+    cache=PersistentCache(namespace="scholar_results", ttl=86400),
+    record_index=PersistentCache(namespace="scholar_records", ttl=30 * 86400),
+    citation_cache=PersistentCache(namespace="scholar_citations", ttl=30 * 86400),
+)
+
+SOURCE_NAMES = {
+    "iacr": "IACR ePrint",
+    "dblp": "DBLP",
+    "google_scholar": "Google Scholar",
+}
+federated_searcher = FederatedSearcher(
+    {
+        "iacr": lambda query, max_results, year_from, year_to: iacr_searcher.search(
+            query,
+            max_results=max_results,
+            fetch_details=False,
+            year_min=year_from,
+            year_max=year_to,
+        ),
+        "dblp": lambda query, max_results, year_from, year_to: (
+            dblp_searcher.search_to_papers(
+                query, max_results=max_results, year_from=year_from, year_to=year_to
+            )
+        ),
+        "google_scholar": lambda query, max_results, year_from, year_to: (
+            google_scholar_searcher.search(
+                query, max_results=max_results, year_low=year_from, year_high=year_to
+            )
+        ),
+    },
+    deadlines={"iacr": 15.0, "dblp": 10.0, "google_scholar": 20.0},
+)
+
+# Values of the output_format parameter of every tool
+OUTPUT_FORMATS = ("markdown", "json")
+
+
+def _format_error(output_format: str) -> str | None:
+    """Error message for an unsupported output_format, if it is one"""
+    if output_format in OUTPUT_FORMATS:
+        return None
+    return f"Error: Unknown output_format '{output_format}'. Use 'markdown' or 'json'."
+
+
+def _to_json(payload: dict) -> str:
+    """Serialize a structured tool result"""
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _error(message: str, output_format: str) -> str:
+    """An error message in the requested output format"""
+    if output_format == "json":
+        return _to_json({"error": message})
+    return message
+
+
+def _year_range_msg(year_from: int | str | None, year_to: int | str | None) -> str:
+    """' in year range (from-to)' if a year bound was given, else ''"""
+    if not (year_from or year_to):
+        return ""
+    return f" in year range ({year_from or 'earliest'}-{year_to or 'latest'})"
+
+
+def _next_cursor(results: list, offset: int, max_results: int) -> str | None:
+    """Cursor of the next page if this one was full"""
+    if len(results) >= max_results:
+        return str(offset + max_results)
+    return None
+
+
+def _next_page_msg(cursor: str | None) -> str:
+    if cursor is None:
+        return ""
+    return (
+        f"More results may be available. Use cursor='{cursor}' "
+        "to fetch the next page.\n"
+    )
 
 
 @mcp.tool()
-def search_iacr_papers(
+async def search_iacr_papers(
     query: str,
     max_results: int = 10,
     fetch_details: bool = True,
     year_min: int | str | None = None,
     year_max: int | str | None = None,
+    output_format: str = "markdown",
 ) -> str:
     """
     Search academic papers from IACR ePrint Archive
@@ -42,7 +146,10 @@ def search_iacr_papers(
         fetch_details: Whether to fetch detailed information for each paper (default: True)
         year_min: Minimum publication year (revised after)
         year_max: Maximum publication year (revised before)
+        output_format: 'markdown' (default) or 'json' for machine-readable paper records
     """
+    if error := _format_error(output_format):
+        return error
     try:
         # Convert string parameters to integers if needed
         year_min_int = None
@@ -54,7 +161,7 @@ def search_iacr_papers(
         if year_max is not None:
             year_max_int = int(year_max)
 
-        papers = iacr_searcher.search(
+        papers = await iacr_searcher.asearch(
             query,
             max_results=max_results,
             fetch_details=fetch_details,
@@ -62,72 +169,131 @@ def search_iacr_papers(
             year_max=year_max_int,
         )
 
+        if output_format == "json":
+            return _to_json(
+                {
+                    "query": query,
+                    "year_min": year_min_int,
+                    "year_max": year_max_int,
+                    "count": len(papers),
+                    "papers": [paper.to_dict() for paper in papers],
+                }
+            )
+
+        year_filter_msg = _year_range_msg(year_min, year_max)
         if not papers:
-            year_filter_msg = ""
-            if year_min or year_max:
-                year_range = f" ({year_min or 'earliest'}-{year_max or 'latest'})"
-                year_filter_msg = f" in year range{year_range}"
             return f"No papers found for query: {query}{year_filter_msg}"
 
         # Format the results
-        year_filter_msg = ""
-        if year_min or year_max:
-            year_range = f" ({year_min or 'earliest'}-{year_max or 'latest'})"
-            year_filter_msg = f" in year range{year_range}"
-
-        result_text = (
+        lines = [
             f"Found {len(papers)} IACR papers for query '{query}'{year_filter_msg}:\n\n"
-        )
-
+        ]
         for i, paper in enumerate(papers, 1):
-            result_text += f"{i}. **{paper.title}**\n"
-            result_text += f"   - Paper ID: {paper.paper_id}\n"
-            result_text += f"   - Authors: {', '.join(paper.authors)}\n"
-            result_text += f"   - URL: {paper.url}\n"
-            result_text += f"   - PDF: {paper.pdf_url}\n"
+            lines.append(f"{i}. **{paper.title}**\n")
+            lines.append(f"   - Paper ID: {paper.paper_id}\n")
+            lines.append(f"   - Authors: {', '.join(paper.authors)}\n")
+            lines.append(f"   - URL: {paper.url}\n")
+            lines.append(f"   - PDF: {paper.pdf_url}\n")
             if paper.categories:
-                result_text += f"   - Categories: {', '.join(paper.categories)}\n"
+                lines.append(f"   - Categories: {', '.join(paper.categories)}\n")
             if paper.keywords:
-                result_text += f"   - Keywords: {', '.join(paper.keywords)}\n"
+                lines.append(f"   - Keywords: {', '.join(paper.keywords)}\n")
             if paper.abstract:
-                result_text += f"   - Abstract: {paper.abstract}\n"
-            result_text += "\n"
+                lines.append(f"   - Abstract: {paper.abstract}\n")
+            lines.append("\n")
 
-        return result_text
-    except ValueError as e:
-        return f"Error: Invalid year format. Please provide valid integers for year_min and year_max."
+        return "".join(lines)
+    except ValueError:
+        return _error(
+            "Error: Invalid year format. Please provide valid integers for year_min and year_max.",
+            output_format,
+        )
     except Exception as e:
-        return f"Error searching IACR papers: {str(e)}"
+        return _error(f"Error searching IACR papers: {e!s}", output_format)
 
 
 @mcp.tool()
-def download_iacr_paper(paper_id: str, save_path: str = "./downloads") -> str:
+async def download_iacr_paper(
+    paper_id: str, save_path: str = "./downloads", output_format: str = "markdown"
+) -> str:
     """
     Download PDF of an IACR ePrint paper
 
     Args:
         paper_id: IACR paper ID (e.g., '2009/101')
         save_path: Directory to save the PDF (default: './downloads')
+        output_format: 'markdown' (default) or 'json'
     """
+    if error := _format_error(output_format):
+        return error
     try:
-        result = iacr_searcher.download_pdf(paper_id, save_path)
+        result = await asyncio.to_thread(
+            iacr_searcher.download_pdf, paper_id, save_path
+        )
 
-        if result.startswith(("Error", "Failed")):
+        failed = result.startswith(("Error", "Failed"))
+        if output_format == "json":
+            outcome = {"error": result} if failed else {"path": result}
+            return _to_json({"paper_id": paper_id, "success": not failed, **outcome})
+        if failed:
             return f"Download failed: {result}"
         else:
             return f"PDF downloaded successfully to: {result}"
     except Exception as e:
-        return f"Error downloading IACR paper: {str(e)}"
+        return _error(f"Error downloading IACR paper: {e!s}", output_format)
 
 
 @mcp.tool()
-def search_dblp_papers(
+async def download_iacr_papers(
+    paper_ids: list[str],
+    save_path: str = "./downloads",
+    output_format: str = "markdown",
+) -> str:
+    """
+    Download PDFs of several IACR ePrint papers concurrently
+
+    Args:
+        paper_ids: List of IACR paper IDs (e.g., ['2009/101', '2025/1014'])
+        save_path: Directory to save the PDFs (default: './downloads')
+        output_format: 'markdown' (default) or 'json'
+    """
+    if error := _format_error(output_format):
+        return error
+    try:
+        results = await asyncio.to_thread(
+            iacr_searcher.download_pdfs, paper_ids, save_path
+        )
+        succeeded = sum(1 for result in results if result["success"])
+        if output_format == "json":
+            return _to_json(
+                {"save_path": save_path, "succeeded": succeeded, "results": results}
+            )
+        if not results:
+            return "No paper IDs given"
+
+        lines = [
+            f"Downloaded {succeeded} of {len(results)} IACR papers to {save_path}:\n\n"
+        ]
+        for result in results:
+            if result["success"]:
+                lines.append(f"- {result['paper_id']}: {result['path']}\n")
+            else:
+                lines.append(f"- {result['paper_id']}: FAILED ({result['error']})\n")
+        return "".join(lines)
+    except Exception as e:
+        return _error(f"Error downloading IACR papers: {e!s}", output_format)
+
+
+@mcp.tool()
+async def search_dblp_papers(
     query: str,
     max_results: int = 10,
     year_from: int | str | None = None,
     year_to: int | str | None = None,
     venue_filter: str | None = None,
     include_bibtex: bool = False,
+    cursor: str | None = None,
+    output_format: str = "markdown",
 ) -> str:
     """
     Search DBLP computer science bibliography database for papers
@@ -139,7 +305,21 @@ def search_dblp_papers(
         year_to: Upper bound for publication year (optional)
         venue_filter: Case-insensitive substring filter for venues (e.g., 'ICLR', 'NeurIPS')
         include_bibtex: Whether to include BibTeX entries in results (default: False)
+        cursor: Cursor from a previous response to fetch the next page (optional)
+        output_format: 'markdown' (default) or 'json' for machine-readable records
     """
+    if error := _format_error(output_format):
+        return error
+    offset = 0
+    if cursor:
+        try:
+            offset = max(0, int(cursor))
+        except ValueError:
+            return _error(
+                f"Error: Invalid cursor '{cursor}'. Use the cursor from a previous response.",
+                output_format,
+            )
+
     try:
         # Convert string parameters to integers if needed
         year_from_int = None
@@ -151,26 +331,29 @@ def search_dblp_papers(
         if year_to is not None:
             year_to_int = int(year_to)
 
-        results = dblp_searcher.search(
+        results = await dblp_searcher.asearch(
             query,
             max_results=max_results,
             year_from=year_from_int,
             year_to=year_to_int,
             venue_filter=venue_filter,
             include_bibtex=include_bibtex,
+            offset=offset,
         )
-
-        if not results:
-            filter_msg = ""
-            filters = []
-            if year_from or year_to:
-                year_range = f"({year_from or 'earliest'}-{year_to or 'latest'})"
-                filters.append(f"year range {year_range}")
-            if venue_filter:
-                filters.append(f"venue '{venue_filter}'")
-            if filters:
-                filter_msg = f" with filters: {', '.join(filters)}"
-            return f"No papers found for query: {query}{filter_msg}"
+        next_cursor = _next_cursor(results, offset, max_results)
+
+        if output_format == "json":
+            return _to_json(
+                {
+                    "query": query,
+                    "year_from": year_from_int,
+                    "year_to": year_to_int,
+                    "venue_filter": venue_filter,
+                    "count": len(results),
+                    "results": results,
+                    "next_cursor": next_cursor,
+                }
+            )
 
         filter_msg = ""
         filters = []
@@ -182,45 +365,198 @@ def search_dblp_papers(
         if filters:
             filter_msg = f" with filters: {', '.join(filters)}"
 
+        if not results:
+            return f"No papers found for query: {query}{filter_msg}"
+
         # If include_bibtex is True, results only contain BibTeX entries
         if include_bibtex:
-            result_text = f"Found {len(results)} DBLP BibTeX entries for query '{query}'{filter_msg}:\n\n"
+            lines = [
+                f"Found {len(results)} DBLP BibTeX entries for query '{query}'{filter_msg}:\n\n"
+            ]
             for i, result in enumerate(results, 1):
-                result_text += f"{i}. DBLP Key: {result.get('dblp_key', 'Unknown')}\n"
-                result_text += f"```bibtex\n{result.get('bibtex', '')}\n```\n\n"
-            return result_text
+                lines.append(f"{i}. DBLP Key: {result.get('dblp_key', 'Unknown')}\n")
+                lines.append(f"```bibtex\n{result.get('bibtex', '')}\n```\n\n")
+            lines.append(_next_page_msg(next_cursor))
+            return "".join(lines)
 
         # Otherwise, return full paper metadata
-        result_text = (
+        lines = [
             f"Found {len(results)} DBLP papers for query '{query}'{filter_msg}:\n\n"
-        )
+        ]
         for i, result in enumerate(results, 1):
-            result_text += f"{i}. **{result.get('title', 'Untitled')}**\n"
-            result_text += f"   - DBLP Key: {result.get('dblp_key', '')}\n"
-            result_text += f"   - Authors: {', '.join(result.get('authors', []))}\n"
+            lines.append(f"{i}. **{result.get('title', 'Untitled')}**\n")
+            lines.append(f"   - DBLP Key: {result.get('dblp_key', '')}\n")
+            lines.append(f"   - Authors: {', '.join(result.get('authors', []))}\n")
             if result.get("venue"):
-                result_text += f"   - Venue: {result['venue']}\n"
+                lines.append(f"   - Venue: {result['venue']}\n")
             if result.get("year"):
-                result_text += f"   - Year: {result['year']}\n"
+                lines.append(f"   - Year: {result['year']}\n")
             if result.get("doi"):
-                result_text += f"   - DOI: {result['doi']}\n"
+                lines.append(f"   - DOI: {result['doi']}\n")
             if result.get("url"):
-                result_text += f"   - URL: {result['url']}\n"
-            result_text += "\n"
+                lines.append(f"   - URL: {result['url']}\n")
+            lines.append("\n")
+        lines.append(_next_page_msg(next_cursor))
+        return "".join(lines)
+    except ValueError:
+        return _error(
+            "Error: Invalid year format. Please provide valid integers for year_from and year_to.",
+            output_format,
+        )
+    except Exception as e:
+        return _error(f"Error searching DBLP: {e!s}", output_format)
+
+
+def _format_dblp_listing(
+    heading: str,
+    results: list[dict],
+    offset: int,
+    max_results: int,
+    output_format: str = "markdown",
+    **fields: Any,
+) -> str:
+    """Render an author or venue listing page as Markdown or JSON"""
+    next_cursor = _next_cursor(results, offset, max_results)
+    if output_format == "json":
+        return _to_json(
+            {
+                **fields,
+                "offset": offset,
+                "count": len(results),
+                "results": results,
+                "next_cursor": next_cursor,
+            }
+        )
+
+    lines = [f"{heading}:\n\n"]
+    for i, result in enumerate(results, offset + 1):
+        lines.append(f"{i}. **{result.get('title', 'Untitled')}**\n")
+        lines.append(f"   - DBLP Key: {result.get('dblp_key', '')}\n")
+        lines.append(f"   - Authors: {', '.join(result.get('authors', []))}\n")
+        if result.get("venue"):
+            lines.append(f"   - Venue: {result['venue']}\n")
+        if result.get("year"):
+            lines.append(f"   - Year: {result['year']}\n")
+        if result.get("doi"):
+            lines.append(f"   - DOI: {result['doi']}\n")
+        lines.append("\n")
+    lines.append(_next_page_msg(next_cursor))
+    return "".join(lines)
 
-        return result_text
+
+@mcp.tool()
+async def get_dblp_author_publications(
+    author: str,
+    max_results: int = 50,
+    cursor: str | None = None,
+    output_format: str = "markdown",
+) -> str:
+    """
+    List all publications of an author from their DBLP profile
+
+    Args:
+        author: Author name or DBLP person ID (e.g., '57/2385')
+        max_results: Maximum number of publications to return (default: 50)
+        cursor: Cursor from a previous response to fetch the next page (optional)
+        output_format: 'markdown' (default) or 'json' for machine-readable records
+    """
+    if error := _format_error(output_format):
+        return error
+    try:
+        offset = max(0, int(cursor)) if cursor else 0
+        results = await asyncio.to_thread(
+            dblp_searcher.get_author_publications,
+            author,
+            max_results=max_results,
+            offset=offset,
+        )
+        if results and results[0].get("error"):
+            return _error(
+                f"Error fetching DBLP author profile: {results[0]['error']}",
+                output_format,
+            )
+        if not results and output_format != "json":
+            return f"No DBLP publications found for author: {author}"
+        return _format_dblp_listing(
+            f"DBLP publications of {author}",
+            results,
+            offset,
+            max_results,
+            output_format,
+            author=author,
+        )
+    except ValueError:
+        return _error(
+            f"Error: Invalid cursor '{cursor}'. Use the cursor from a previous response.",
+            output_format,
+        )
+    except Exception as e:
+        return _error(f"Error fetching DBLP author profile: {e!s}", output_format)
+
+
+@mcp.tool()
+async def get_dblp_venue_publications(
+    venue: str,
+    year: int | str | None = None,
+    max_results: int = 50,
+    cursor: str | None = None,
+    output_format: str = "markdown",
+) -> str:
+    """
+    List the publications of a venue (table of contents) from DBLP
+
+    Args:
+        venue: Venue name or DBLP venue key (e.g., 'CRYPTO', 'conf/crypto', 'journals/joc')
+        year: Only list publications of this year (optional)
+        max_results: Maximum number of publications to return (default: 50)
+        cursor: Cursor from a previous response to fetch the next page (optional)
+        output_format: 'markdown' (default) or 'json' for machine-readable records
+    """
+    if error := _format_error(output_format):
+        return error
+    try:
+        year_int = int(year) if year is not None else None
+        offset = max(0, int(cursor)) if cursor else 0
+        results = await asyncio.to_thread(
+            dblp_searcher.get_venue_publications,
+            venue,
+            year=year_int,
+            max_results=max_results,
+            offset=offset,
+        )
+        year_msg = f" ({year_int})" if year_int else ""
+        if results and results[0].get("error"):
+            return _error(
+                f"Error fetching DBLP venue listing: {results[0]['error']}",
+                output_format,
+            )
+        if not results and output_format != "json":
+            return f"No DBLP publications found for venue: {venue}{year_msg}"
+        return _format_dblp_listing(
+            f"DBLP publications of {venue}{year_msg}",
+            results,
+            offset,
+            max_results,
+            output_format,
+            venue=venue,
+            year=year_int,
+        )
     except ValueError:
-        return "Error: Invalid year format. Please provide valid integers for year_from and year_to."
+        return _error(
+            "Error: Invalid year or cursor. Please provide integers for year and the cursor from a previous response.",
+            output_format,
+        )
     except Exception as e:
-        return f"Error searching DBLP: {str(e)}"
+        return _error(f"Error fetching DBLP venue listing: {e!s}", output_format)
 
 
 @mcp.tool()
-def search_google_scholar_papers(
+async def search_google_scholar_papers(
     query: str,
     max_results: int = 10,
     year_low: int | str | None = None,
     year_high: int | str | None = None,
+    output_format: str = "markdown",
 ) -> str:
     """
     Search academic papers from Google Scholar
@@ -230,7 +566,10 @@ def search_google_scholar_papers(
         max_results: Maximum number of papers to return (default: 10)
         year_low: Minimum publication year (optional)
         year_high: Maximum publication year (optional)
+        output_format: 'markdown' (default) or 'json' for machine-readable paper records
     """
+    if error := _format_error(output_format):
+        return error
     try:
         # Convert string parameters to integers if needed
         year_low_int = None
@@ -242,35 +581,41 @@ def search_google_scholar_papers(
         if year_high is not None:
             year_high_int = int(year_high)
 
-        papers = google_scholar_searcher.search(
+        papers = await google_scholar_searcher.asearch(
             query,
             max_results=max_results,
             year_low=year_low_int,
             year_high=year_high_int,
         )
 
+        if output_format == "json":
+            return _to_json(
+                {
+                    "query": query,
+                    "year_low": year_low_int,
+                    "year_high": year_high_int,
+                    "count": len(papers),
+                    "papers": [paper.to_dict() for paper in papers],
+                }
+            )
+
+        year_filter_msg = _year_range_msg(year_low, year_high)
         if not papers:
-            year_filter_msg = ""
-            if year_low or year_high:
-                year_range = f" ({year_low or 'earliest'}-{year_high or 'latest'})"
-                year_filter_msg = f" in year range{year_range}"
             return f"No papers found for query: {query}{year_filter_msg}"
 
-        year_filter_msg = ""
-        if year_low or year_high:
-            year_range = f" ({year_low or 'earliest'}-{year_high or 'latest'})"
-            year_filter_msg = f" in year range{year_range}"
-
-        result_text = f"Found {len(papers)} Google Scholar papers for query '{query}'{year_filter_msg}:\n\n"
+        lines = [
+            f"Found {len(papers)} Google Scholar papers for query '{query}'{year_filter_msg}:\n\n"
+        ]
         for i, paper in enumerate(papers, 1):
-            result_text += f"{i}. **{paper.title}**\n"
-            result_text += f"   - Authors: {', '.join(paper.authors)}\n"
+            lines.append(f"{i}. **{paper.title}**\n")
+            lines.append(f"   - Paper ID: {paper.paper_id}\n")
+            lines.append(f"   - Authors: {', '.join(paper.authors)}\n")
             if paper.citations > 0:
-                result_text += f"   - Citations: {paper.citations}\n"
+                lines.append(f"   - Citations: {paper.citations}\n")
             if paper.published_date and paper.published_date.year > 1900:
-                result_text += f"   - Year: {paper.published_date.year}\n"
+                lines.append(f"   - Year: {paper.published_date.year}\n")
             if paper.url:
-                result_text += f"   - URL: {paper.url}\n"
+                lines.append(f"   - URL: {paper.url}\n")
             if paper.abstract:
                 # Truncate abstract for readability
                 abstract_preview = (
@@ -278,14 +623,191 @@ def search_google_scholar_papers(
                     if len(paper.abstract) > 300
                     else paper.abstract
                 )
-                result_text += f"   - Abstract: {abstract_preview}\n"
-            result_text += "\n"
+                lines.append(f"   - Abstract: {abstract_preview}\n")
+            lines.append("\n")
+
+        return "".join(lines)
+    except ValueError:
+        return _error(
+            "Error: Invalid year format. Please provide valid integers for year_low and year_high.",
+            output_format,
+        )
+    except Exception as e:
+        return _error(f"Error searching Google Scholar: {e!s}", output_format)
+
+
+@mcp.tool()
+async def expand_google_scholar_citations(
+    paper_ids: list[str],
+    depth: int = 1,
+    fan_out: int = 10,
+    max_papers: int = 50,
+    output_format: str = "markdown",
+) -> str:
+    """
+    Follow Google Scholar "Cited by" links from seed papers
+
+    Args:
+        paper_ids: Google Scholar paper IDs (e.g., 'gs_2960712678066186980') to start from
+        depth: Number of cited-by levels to follow (default: 1)
+        fan_out: Maximum citing papers fetched per paper (default: 10)
+        max_papers: Stop expanding once this many citing papers were found (default: 50)
+        output_format: 'markdown' (default) or 'json' for the papers and citation edges
+    """
+    if error := _format_error(output_format):
+        return error
+    try:
+        graph = await asyncio.to_thread(
+            google_scholar_searcher.expand_citations,
+            paper_ids,
+            depth=depth,
+            fan_out=fan_out,
+            max_papers=max_papers,
+        )
+        if not graph["seeds"]:
+            return _error(
+                "No Google Scholar cluster ID found for the given papers. "
+                "Use paper IDs returned by search_google_scholar_papers.",
+                output_format,
+            )
+
+        cites: dict[str, list[str]] = {}
+        for citing, cited in graph["edges"]:
+            cites.setdefault(citing, []).append(cited)
+
+        if output_format == "json":
+            return _to_json(
+                {
+                    "seeds": graph["seeds"],
+                    "depth": depth,
+                    "count": len(graph["papers"]),
+                    "papers": [
+                        {**paper.to_dict(), "cites": cites.get(paper.paper_id, [])}
+                        for paper in graph["papers"].values()
+                    ],
+                    "edges": [list(edge) for edge in graph["edges"]],
+                    "truncated": graph["truncated"],
+                }
+            )
+
+        if not graph["papers"]:
+            return f"No citing papers found for: {', '.join(graph['seeds'])}"
+
+        lines = [
+            f"Found {len(graph['papers'])} papers citing {', '.join(graph['seeds'])} "
+            f"({len(graph['edges'])} citation edges, depth {depth}):\n\n"
+        ]
+        for i, paper in enumerate(graph["papers"].values(), 1):
+            lines.append(f"{i}. **{paper.title}**\n")
+            lines.append(f"   - Paper ID: {paper.paper_id}\n")
+            lines.append(f"   - Authors: {', '.join(paper.authors)}\n")
+            if paper.citations > 0:
+                lines.append(f"   - Citations: {paper.citations}\n")
+            if paper.published_date and paper.published_date.year > 1900:
+                lines.append(f"   - Year: {paper.published_date.year}\n")
+            lines.append(f"   - Cites: {', '.join(cites.get(paper.paper_id, []))}\n")
+            lines.append("\n")
+        if graph["truncated"]:
+            lines.append(
+                f"Stopped after {max_papers} papers. Increase max_papers to "
+                "expand further.\n"
+            )
+        return "".join(lines)
+    except Exception as e:
+        return _error(f"Error expanding Google Scholar citations: {e!s}", output_format)
+
+
+@mcp.tool()
+async def search_all_papers(
+    query: str,
+    max_results: int = 10,
+    year_from: int | str | None = None,
+    year_to: int | str | None = None,
+    output_format: str = "markdown",
+) -> str:
+    """
+    Search IACR ePrint, DBLP and Google Scholar at once and merge the results
+
+    Args:
+        query: Search query string (e.g., 'zero knowledge proofs')
+        max_results: Maximum number of merged papers to return (default: 10)
+        year_from: Earliest publication year (optional)
+        year_to: Latest publication year (optional)
+        output_format: 'markdown' (default) or 'json' for machine-readable paper records
+    """
+    if error := _format_error(output_format):
+        return error
+    try:
+        year_from_int = int(year_from) if year_from is not None else None
+        year_to_int = int(year_to) if year_to is not None else None
+    except ValueError:
+        return _error(
+            "Error: Invalid year format. Please provide valid integers for year_from and year_to.",
+            output_format,
+        )
+
+    try:
+        result = await asyncio.to_thread(
+            federated_searcher.search,
+            query,
+            max_results=max_results,
+            year_from=year_from_int,
+            year_to=year_to_int,
+        )
+
+        if output_format == "json":
+            return _to_json(
+                {
+                    "query": query,
+                    "year_from": year_from_int,
+                    "year_to": year_to_int,
+                    "counts": result.counts,
+                    "missing": result.missing,
+                    "count": len(result.papers),
+                    "papers": [paper.to_dict() for paper in result.papers],
+                }
+            )
+
+        missing_msg = ""
+        if result.missing:
+            missing = [
+                f"{SOURCE_NAMES.get(name, name)} ({reason})"
+                for name, reason in result.missing.items()
+            ]
+            missing_msg = f"Missing sources: {', '.join(missing)}\n"
+
+        if not result.papers:
+            return f"No papers found for query: {query}\n{missing_msg}"
+
+        counts = ", ".join(
+            f"{SOURCE_NAMES.get(name, name)}: {count}"
+            for name, count in result.counts.items()
+        )
+        lines = [
+            f"Found {len(result.papers)} papers for query '{query}' ({counts}):\n"
+            f"{missing_msg}\n"
+        ]
+        for i, paper in enumerate(result.papers, 1):
+            sources = [
+                SOURCE_NAMES.get(s, s) for s in (paper.extra or {}).get("sources", [])
+            ]
+            lines.append(f"{i}. **{paper.title}**\n")
+            lines.append(f"   - Sources: {', '.join(sources)}\n")
+            lines.append(f"   - Paper ID: {paper.paper_id}\n")
+            lines.append(f"   - Authors: {', '.join(paper.authors)}\n")
+            if paper.published_date and paper.published_date.year > 1900:
+                lines.append(f"   - Year: {paper.published_date.year}\n")
+            if paper.citations > 0:
+                lines.append(f"   - Citations: {paper.citations}\n")
+            if paper.doi:
+                lines.append(f"   - DOI: {paper.doi}\n")
+            if paper.url:
+                lines.append(f"   - URL: {paper.url}\n")
+            lines.append("\n")
 
-        return result_text
-    except ValueError as e:
-        return f"Error: Invalid year format. Please provide valid integers for year_low and year_high."
+        return "".join(lines)
     except Exception as e:
-        return f"Error searching Google Scholar: {str(e)}"
+        return _error(f"Error searching papers: {e!s}", output_format)
 
 
 def main():
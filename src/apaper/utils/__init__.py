@@ -1,3 +1,29 @@
 """APaper utilities module."""
 
-__all__ = []
+from .cache import CacheEntry, PersistentCache, default_cache_dir
+from .pdf_store import PDFStore
+from .rate_limit import TokenBucket
+from .transport import (
+    HTTPCache,
+    RequestTiming,
+    RetryPolicy,
+    add_timing_hook,
+    create_async_client,
+    create_client,
+    remove_timing_hook,
+)
+
+__all__ = [
+    "CacheEntry",
+    "HTTPCache",
+    "PDFStore",
+    "PersistentCache",
+    "RequestTiming",
+    "RetryPolicy",
+    "TokenBucket",
+    "add_timing_hook",
+    "create_async_client",
+    "create_client",
+    "default_cache_dir",
+    "remove_timing_hook",
+]
@@ -0,0 +1,234 @@
+# apaper/utils/cache.py
+"""On-disk key/value cache shared by the APaper platforms.
+
+Entries are JSON values stored in a single SQLite file and grouped by
+namespace, so several platforms can share one cache file. Every entry keeps
+the HTTP validators (ETag / Last-Modified) it was fetched with, which lets
+callers revalidate stale entries with conditional GET requests instead of
+downloading and parsing the page again.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV = "APAPER_CACHE_DIR"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (namespace, accessed_at);
+"""
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory ($APAPER_CACHE_DIR or ~/.cache/apaper)"""
+    configured = os.getenv(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".cache" / "apaper"
+
+
+@dataclass
+class CacheEntry:
+    """A cached value together with its HTTP validators"""
+
+    value: Any
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was stored or last revalidated"""
+        return time.time() - self.stored_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PersistentCache:
+    """SQLite-backed cache with a TTL and size-bounded LRU eviction"""
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        namespace: str = "default",
+        ttl: float = 86400,
+        max_entries: int = 10000,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite file path (default: <cache dir>/cache.sqlite3)
+            namespace: Key namespace, so several caches can share one file
+            ttl: Seconds an entry stays fresh before it must be revalidated
+            max_entries: Maximum number of entries kept in this namespace
+        """
+        self.path = Path(path) if path else default_cache_dir() / "cache.sqlite3"
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path), check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether the entry can be served without revalidation"""
+        return entry.age < self.ttl
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for key (fresh or stale), or None if missing"""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, etag, last_modified, stored_at FROM entries "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (time.time(), self.namespace, key),
+            )
+
+        try:
+            value = json.loads(row[0])
+        except ValueError:
+            logger.warning(f"Dropping corrupt cache entry {self.namespace}/{key}")
+            self.delete(key)
+            return None
+        return CacheEntry(
+            value=value, etag=row[1], last_modified=row[2], stored_at=row[3]
+        )
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a JSON-serializable value and evict least recently used entries"""
+        now = time.time()
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(namespace, key, value, etag, last_modified, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, payload, etag, last_modified, now, now),
+            )
+            self._evict(conn)
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        """Store several values in one transaction, evicting once at the end"""
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (self.namespace, key, json.dumps(value, separators=(",", ":")), now, now)
+            for key, value in items.items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries "
+                    "(namespace, key, value, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete the least recently used entries beyond max_entries"""
+        conn.execute(
+            "DELETE FROM entries WHERE namespace = ? AND key IN ("
+            "SELECT key FROM entries WHERE namespace = ? "
+            "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.max_entries),
+        )
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as revalidated, restarting its TTL"""
+        now = time.time()
+        with self._lock:
+            self._connect().execute(
+                "UPDATE entries SET stored_at = ?, accessed_at = ? "
+                "WHERE namespace = ? AND key = ?",
+                (now, now, self.namespace, key),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry"""
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+
+    def clear(self) -> None:
+        """Remove every entry in this namespace"""
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM entries WHERE namespace = ?", (self.namespace,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT COUNT(*) FROM entries WHERE namespace = ?",
+                    (self.namespace,),
+                )
+                .fetchone()
+            )
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,40 @@
+# apaper/utils/html.py
+"""HTML parsing helpers shared by the scraping platforms.
+
+The scrapers support two parsing backends:
+
+- ``"full"`` builds a complete BeautifulSoup tree with ``html.parser`` and
+  looks fields up with ``find``/``find_all``.
+- ``"fast"`` only builds the elements matched by a ``SoupStrainer`` (using
+  lxml when it is installed) and extracts all fields of an entry in a single
+  walk over its tags.
+
+Both backends produce the same ``Paper`` records.
+"""
+
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+FAST_PARSER = "lxml" if find_spec("lxml") else "html.parser"
+
+HTML_BACKENDS = ("full", "fast")
+
+
+def check_backend(backend: str) -> str:
+    """Validate an HTML backend name"""
+    if backend not in HTML_BACKENDS:
+        raise ValueError(
+            f"Unknown HTML backend {backend!r}, expected one of {HTML_BACKENDS}"
+        )
+    return backend
+
+
+def parse_only(html: str, strainer: SoupStrainer) -> BeautifulSoup:
+    """Parse only the parts of a document matched by strainer"""
+    return BeautifulSoup(html, FAST_PARSER, parse_only=strainer)
+
+
+def has_class(tag: Tag, name: str) -> bool:
+    """Whether tag carries the CSS class name"""
+    return name in (tag.get("class") or ())
@@ -0,0 +1,152 @@
+# apaper/utils/pdf_store.py
+"""Content-addressed store for downloaded PDFs.
+
+Each PDF is stored once as a read-only blob named after its SHA-256 digest.
+An index maps source IDs (e.g. "iacr:2025/1014") to digests, so a paper that
+is already present is linked into the requested directory instead of being
+downloaded again.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from .cache import PersistentCache, default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class PDFStore:
+    """Hash-named PDF blobs plus an ID to hash index"""
+
+    def __init__(
+        self,
+        root: str | os.PathLike | None = None,
+        ttl: float = 30 * 86400,
+        max_entries: int = 100000,
+    ):
+        """
+        Initialize the store
+
+        Args:
+            root: Store directory (default: <cache dir>/pdfs)
+            ttl: Seconds a stored PDF is served before it is downloaded again
+            max_entries: Maximum number of IDs kept in the index
+        """
+        self.root = Path(root) if root else default_cache_dir() / "pdfs"
+        self.index = PersistentCache(
+            self.root / "index.sqlite3",
+            namespace="pdfs",
+            ttl=ttl,
+            max_entries=max_entries,
+        )
+
+    def blob_path(self, digest: str) -> Path:
+        """Location of the blob with the given SHA-256 digest"""
+        return self.root / "blobs" / digest[:2] / f"{digest}.pdf"
+
+    def partial_path(self, key: str) -> Path:
+        """Location for the in-progress download of key"""
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        path = self.root / "partial" / f"{name}.part"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def get(self, key: str, sha256: str | None = None) -> Path | None:
+        """
+        Return the blob stored for key if it is fresh and present
+
+        Args:
+            key: Source ID of the PDF
+            sha256: If given, only a blob with this digest is returned
+        """
+        entry = self.index.get(key)
+        if entry is None or not self.index.is_fresh(entry):
+            return None
+        digest = entry.value.get("sha256", "")
+        if sha256 and digest != sha256.lower():
+            return None
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            self.index.delete(key)
+            return None
+        return blob
+
+    def add(self, key: str, path: str | os.PathLike) -> Path:
+        """
+        Move a downloaded file into the store and index it under key
+
+        Returns:
+            Path: The blob now holding the content
+        """
+        digest_obj = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest_obj.update(chunk)
+        digest = digest_obj.hexdigest()
+
+        blob = self.blob_path(digest)
+        if blob.exists():
+            # Same content is already stored, e.g. under another ID
+            os.remove(path)
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(os.fspath(path), blob)
+            os.chmod(blob, 0o444)
+
+        self.index.set(key, {"sha256": digest, "size": blob.stat().st_size})
+        return blob
+
+    def link(self, blob: Path, destination: str | os.PathLike) -> None:
+        """
+        Place blob at destination without copying when possible
+
+        A hard link is tried first, then a copy_file_range clone (which
+        reflinks on filesystems that support it), then a plain copy.
+        """
+        destination = Path(destination)
+        try:
+            if destination.exists() and os.path.samefile(blob, destination):
+                return
+        except OSError:
+            pass
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=destination.parent, prefix=f".{destination.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        os.remove(tmp)
+        try:
+            try:
+                os.link(blob, tmp)
+            except OSError:
+                _clone_file(blob, tmp)
+            os.replace(tmp, destination)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+
+def _clone_file(source: Path, destination: str) -> None:
+    """Copy a file, letting the kernel share extents where it can"""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+        except OSError as e:
+            logger.debug(f"copy_file_range failed, falling back to a copy: {e}")
+    shutil.copyfile(source, destination)
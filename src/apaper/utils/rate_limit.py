@@ -0,0 +1,152 @@
+# apaper/utils/rate_limit.py
+"""Token-bucket rate limiting with exponential backoff.
+
+A bucket holds up to ``capacity`` tokens and refills at ``rate`` tokens per
+second, so idle time is banked and a request after a quiet period goes out
+immediately. When the remote side throttles, ``penalize`` blocks the bucket
+for an exponentially growing delay and halves its rate; every successful
+request afterwards raises the rate again by ``recovery`` until it is back at
+the base rate.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by all requests to one service"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        backoff: float = 10.0,
+        max_backoff: float = 300.0,
+        min_rate: float | None = None,
+        recovery: float = 1.25,
+    ):
+        """
+        Initialize the bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of banked tokens (burst size)
+            backoff: Seconds blocked after the first throttled request
+            max_backoff: Upper bound for the blocking delay
+            min_rate: Lowest rate reached by repeated throttling
+                (default: rate / 16)
+            recovery: Factor the rate grows by per successful request
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.recovery = max(1.0, recovery)
+        self.failures = 0
+        self.tokens = self.capacity
+        # Tokens accrue from this instant on; it lies in the future while blocked
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+    def delay(self) -> float:
+        """Seconds until the next token is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._delay(now)
+
+    def _delay(self, now: float) -> float:
+        return max(0.0, self._updated - now) + max(0.0, 1.0 - self.tokens) / self.rate
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """
+        Take one token, sleeping until it is available
+
+        Args:
+            timeout: Give up instead of waiting longer than this many seconds
+
+        Returns:
+            bool: False if the wait would exceed timeout (no token is taken)
+        """
+        wait = self._reserve(timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, timeout: float | None = None) -> bool:
+        """
+        Take one token without blocking the event loop
+
+        Sync and async callers share the same budget.
+
+        Args:
+            timeout: Give up instead of waiting longer than this many seconds
+
+        Returns:
+            bool: False if the wait would exceed timeout (no token is taken)
+        """
+        wait = self._reserve(timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def _reserve(self, timeout: float | None) -> float | None:
+        """Take a token now and return the wait for it, or None past timeout"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = self._delay(now)
+            if timeout is not None and wait > timeout:
+                return None
+            # Reserve the token now so concurrent callers queue up behind it
+            self.tokens -= 1.0
+        return wait
+
+    def penalize(self, retry_after: float | None = None) -> float:
+        """
+        Back off after a throttled request
+
+        Args:
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            float: Seconds the bucket is blocked for
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.failures += 1
+            delay = min(self.max_backoff, self.backoff * 2.0 ** (self.failures - 1))
+            if retry_after:
+                delay = max(delay, min(retry_after, self.max_backoff))
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            self._updated = max(self._updated, now + delay)
+        logger.warning(f"Rate limited, backing off for {delay:.1f} seconds")
+        return delay
+
+    def reward(self) -> None:
+        """Record a successful request, recovering the rate step by step"""
+        with self._lock:
+            if self.rate < self.base_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.base_rate, self.rate * self.recovery)
+            if self.rate >= self.base_rate:
+                self.failures = 0
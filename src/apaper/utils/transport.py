@@ -0,0 +1,809 @@
+# apaper/utils/transport.py
+"""Shared HTTP transport for all paper sources.
+
+Clients made by ``create_client`` and ``create_async_client`` are httpx
+clients on a pooled transport that adds:
+
+- per-host timeouts: requests without an explicit timeout use the timeout
+  configured for their host, or the client default;
+- retries with jittered exponential backoff: connection failures, and for
+  idempotent methods read failures and 502/503/504 responses, are retried,
+  honouring Retry-After;
+- an RFC 9111 private response cache: fresh responses are served from memory
+  and stale ones are revalidated with If-None-Match / If-Modified-Since;
+  bodies are recorded while the caller streams them, so streaming is kept;
+- timing hooks: every attempt and cache hit is reported as a RequestTiming,
+  to the hooks of the client and to those registered with add_timing_hook.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Default seconds for a request, per phase (connect, read, write, pool)
+DEFAULT_TIMEOUT = 30.0
+
+# Default connection pool limits of every client
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 30.0  # seconds
+
+# Default retry policy
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.5  # seconds before the first retry, doubled for each further one
+MAX_RETRY_BACKOFF = 10.0
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+# Methods that may be repeated without changing the result (RFC 9110 9.2.2)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+# Methods that do not change server state; others invalidate cached responses
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
+
+# Default response cache limits
+HTTP_CACHE_SIZE = 32 * 1024 * 1024  # bytes of cached bodies
+MAX_CACHED_BODY = 1024 * 1024  # larger bodies are not cached
+
+# Heuristic freshness: a fraction of the time since Last-Modified, capped
+HEURISTIC_FRACTION = 0.1
+MAX_HEURISTIC_LIFETIME = 86400.0
+
+# Status codes cacheable by default (RFC 9110 15.1); 206 is never stored
+HEURISTIC_STATUSES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+
+# Request headers that make a request conditional or partial; such requests
+# bypass the cache and their responses are returned to the caller unchanged
+BYPASS_HEADERS = (
+    "range",
+    "if-match",
+    "if-none-match",
+    "if-modified-since",
+    "if-unmodified-since",
+    "if-range",
+)
+
+# Stored headers a 304 response must not replace (RFC 9111 3.2)
+KEEP_ON_UPDATE = frozenset(
+    {"content-length", "content-encoding", "transfer-encoding", "content-range"}
+)
+
+
+@dataclass
+class RequestTiming:
+    """One request attempt or cache hit, as reported to timing hooks"""
+
+    method: str
+    url: str
+    host: str
+    status: int | None  # None if the attempt failed
+    elapsed: float  # seconds until the response headers arrived
+    attempt: int  # 1 for the first try, 0 for a cache hit
+    cache: str  # "hit", "revalidated", "miss" or "bypass"
+    error: str | None = None
+
+
+TimingHook = Callable[[RequestTiming], None]
+
+# Hooks called for the requests of every client
+TIMING_HOOKS: list[TimingHook] = []
+
+
+def add_timing_hook(hook: TimingHook) -> None:
+    """Report the requests of every client to hook"""
+    TIMING_HOOKS.append(hook)
+
+
+def remove_timing_hook(hook: TimingHook) -> None:
+    """Stop reporting requests to a hook added with add_timing_hook"""
+    if hook in TIMING_HOOKS:
+        TIMING_HOOKS.remove(hook)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before repeating a failed request"""
+
+    retries: int = MAX_RETRIES
+    backoff: float = RETRY_BACKOFF
+    max_backoff: float = MAX_RETRY_BACKOFF
+    statuses: frozenset[int] = RETRY_STATUSES
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Seconds to wait before retry number attempt (1-based)
+
+        Full jitter: a random delay up to the exponential backoff, so clients
+        that failed together do not retry together. A Retry-After value is
+        waited out exactly.
+        """
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        )
+
+    def retry_error(self, request: httpx.Request, error: httpx.TransportError) -> bool:
+        """Whether a request that failed with error may be sent again"""
+        if isinstance(
+            error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+        ):
+            # The request never reached the server
+            return True
+        return request.method in IDEMPOTENT_METHODS and isinstance(
+            error, (httpx.ReadError, httpx.ReadTimeout, httpx.RemoteProtocolError)
+        )
+
+    def retry_response(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> float | None:
+        """Retry-After seconds (0 if none) if response is worth retrying, else None"""
+        if request.method not in IDEMPOTENT_METHODS:
+            return None
+        if response.status_code not in self.statuses:
+            return None
+        retry_after = _retry_after(response.headers)
+        if retry_after is None:
+            return 0.0
+        # Do not retry if the server asks for a longer pause than we allow
+        return retry_after if retry_after <= self.max_backoff else None
+
+
+def _retry_after(headers: httpx.Headers) -> float | None:
+    """Seconds requested by a Retry-After header (delta or HTTP date)"""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    date = _parse_date(value)
+    return max(0.0, date - time.time()) if date is not None else None
+
+
+def _parse_date(value: str | None) -> float | None:
+    """Timestamp of an HTTP date, or None if it is missing or invalid"""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def _directives(headers: httpx.Headers) -> dict[str, str | None]:
+    """Cache-Control directives, lower-cased, with unquoted arguments"""
+    directives: dict[str, str | None] = {}
+    for value in headers.get_list("Cache-Control", split_commas=True):
+        name, _, argument = value.partition("=")
+        name = name.strip().lower()
+        if name:
+            directives[name] = argument.strip().strip('"') if argument else None
+    return directives
+
+
+def _seconds(value: str | None) -> float | None:
+    """Delta-seconds argument of a directive, or None if it is invalid"""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(int(value)))
+    except ValueError:
+        return None
+
+
+@dataclass
+class CachedResponse:
+    """A stored response plus the times needed to compute its age"""
+
+    url: str
+    status_code: int
+    headers: httpx.Headers
+    body: bytes
+    vary: dict[str, str | None]
+    request_time: float
+    response_time: float
+
+    def age(self, now: float) -> float:
+        """Current age (RFC 9111 4.2.3)"""
+        date = _parse_date(self.headers.get("Date"))
+        apparent_age = max(0.0, self.response_time - date) if date is not None else 0.0
+        age_value = _seconds(self.headers.get("Age")) or 0.0
+        corrected_age = age_value + (self.response_time - self.request_time)
+        return max(apparent_age, corrected_age) + (now - self.response_time)
+
+    def lifetime(self) -> float:
+        """Freshness lifetime (RFC 9111 4.2.1), 0 if it must be revalidated"""
+        directives = _directives(self.headers)
+        if "no-cache" in directives:
+            return 0.0
+        if "max-age" in directives:
+            return _seconds(directives["max-age"]) or 0.0
+        date = _parse_date(self.headers.get("Date")) or self.response_time
+        if "Expires" in self.headers:
+            expires = _parse_date(self.headers["Expires"])
+            return max(0.0, expires - date) if expires is not None else 0.0
+        last_modified = _parse_date(self.headers.get("Last-Modified"))
+        if last_modified is not None and self.status_code in HEURISTIC_STATUSES:
+            return min(
+                MAX_HEURISTIC_LIFETIME,
+                max(0.0, (date - last_modified) * HEURISTIC_FRACTION),
+            )
+        return 0.0
+
+    def is_fresh(self, request_directives: dict[str, str | None], now: float) -> bool:
+        """Whether the response may be served without revalidation"""
+        if "no-cache" in request_directives:
+            return False
+        age = self.age(now)
+        if "max-age" in request_directives:
+            max_age = _seconds(request_directives["max-age"])
+            if max_age is None or age > max_age:
+                return False
+        return age < self.lifetime()
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers revalidating this response"""
+        headers = {}
+        if "ETag" in self.headers:
+            headers["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def to_response(self, now: float) -> httpx.Response:
+        """Build a response serving the stored body"""
+        headers = self.headers.copy()
+        headers["Age"] = str(int(self.age(now)))
+        return httpx.Response(
+            self.status_code, headers=headers, stream=httpx.ByteStream(self.body)
+        )
+
+
+class HTTPCache:
+    """
+    Thread-safe in-memory private HTTP cache (RFC 9111)
+
+    One response is stored per URL, with the values of the request headers
+    named by its Vary header; entries are evicted least recently used first
+    once their bodies exceed max_size bytes.
+    """
+
+    def __init__(
+        self, max_size: int = HTTP_CACHE_SIZE, max_body_size: int = MAX_CACHED_BODY
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum total size of the cached bodies in bytes
+            max_body_size: Bodies larger than this many bytes are not cached
+        """
+        self.max_size = max_size
+        self.max_body_size = min(max_body_size, max_size)
+        self.size = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, request: httpx.Request) -> CachedResponse | None:
+        """The stored response matching request, if any"""
+        key = str(request.url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        if any(
+            request.headers.get(name) != value for name, value in entry.vary.items()
+        ):
+            return None
+        return entry
+
+    def storable(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Whether response may be stored and is worth storing (RFC 9111 3)"""
+        if request.method != "GET" or response.status_code not in HEURISTIC_STATUSES:
+            return False
+        if "no-store" in _directives(request.headers):
+            return False
+        if "no-store" in _directives(response.headers):
+            return False
+        if response.headers.get("Vary", "").strip() == "*":
+            return False
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit() and int(length) > self.max_body_size:
+            return False
+        # Responses that are neither fresh nor revalidatable would never be used
+        return bool(
+            {"cache-control", "expires", "etag", "last-modified"}
+            & {name.lower() for name in response.headers}
+        )
+
+    def store(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        body: bytes,
+        request_time: float,
+        response_time: float,
+    ) -> None:
+        """Store a complete response received for request"""
+        if len(body) > self.max_body_size:
+            return
+        vary = {
+            name.strip().lower(): request.headers.get(name.strip())
+            for name in response.headers.get_list("Vary", split_commas=True)
+            if name.strip()
+        }
+        self._put(
+            CachedResponse(
+                url=str(request.url),
+                status_code=response.status_code,
+                headers=response.headers.copy(),
+                body=body,
+                vary=vary,
+                request_time=request_time,
+                response_time=response_time,
+            )
+        )
+
+    def update(
+        self,
+        entry: CachedResponse,
+        response: httpx.Response,
+        request_time: float,
+        response_time: float,
+    ) -> CachedResponse:
+        """Freshen a stored response with the headers of a 304 (RFC 9111 4.3.4)"""
+        headers = entry.headers.copy()
+        for name, value in response.headers.items():
+            if name.lower() not in KEEP_ON_UPDATE:
+                headers[name] = value
+        updated = CachedResponse(
+            url=entry.url,
+            status_code=entry.status_code,
+            headers=headers,
+            body=entry.body,
+            vary=entry.vary,
+            request_time=request_time,
+            response_time=response_time,
+        )
+        self._put(updated)
+        return updated
+
+    def invalidate(self, url: httpx.URL | str) -> None:
+        """Drop the response stored for url"""
+        with self._lock:
+            entry = self._entries.pop(str(url), None)
+            if entry is not None:
+                self.size -= len(entry.body)
+
+    def clear(self) -> None:
+        """Drop every stored response"""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _put(self, entry: CachedResponse) -> None:
+        with self._lock:
+            old = self._entries.pop(entry.url, None)
+            if old is not None:
+                self.size -= len(old.body)
+            self._entries[entry.url] = entry
+            self.size += len(entry.body)
+            while self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.body)
+
+
+class _RecordingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Pass a response body through, keeping a copy until it is too large"""
+
+    def __init__(self, stream: Any, limit: int, on_complete: Callable[[bytes], None]):
+        self._stream = stream
+        self._limit = limit
+        self._on_complete = on_complete
+        self._chunks: list[bytes] | None = []
+        self._size = 0
+
+    def _record(self, chunk: bytes) -> None:
+        if self._chunks is None:
+            return
+        self._size += len(chunk)
+        if self._size > self._limit:
+            self._chunks = None
+        else:
+            self._chunks.append(chunk)
+
+    def _complete(self) -> None:
+        if self._chunks is not None:
+            self._on_complete(b"".join(self._chunks))
+            self._chunks = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._record(chunk)
+            yield chunk
+        self._complete()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._record(chunk)
+            yield chunk
+        self._complete()
+
+    def close(self) -> None:
+        self._stream.close()
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class _Policy:
+    """Timeouts, caching and reporting shared by the sync and async transports"""
+
+    def _setup(
+        self,
+        timeout: float | httpx.Timeout,
+        host_timeouts: dict[str, float | httpx.Timeout] | None,
+        retry: RetryPolicy | None,
+        cache: HTTPCache | None,
+        hooks: Iterable[TimingHook],
+    ) -> None:
+        self.timeout = httpx.Timeout(timeout)
+        self.host_timeouts = {
+            host.lower(): httpx.Timeout(value)
+            for host, value in (host_timeouts or {}).items()
+        }
+        self.retry = retry or RetryPolicy()
+        self.cache = cache
+        self.hooks = list(hooks)
+
+    def _prepare(self, request: httpx.Request) -> None:
+        """Apply the host timeout unless the request set its own"""
+        timeout = request.extensions.get("timeout")
+        if not timeout or all(value is None for value in timeout.values()):
+            host = request.url.host.lower()
+            request.extensions["timeout"] = self.host_timeouts.get(
+                host, self.timeout
+            ).as_dict()
+
+    def _lookup(
+        self, request: httpx.Request
+    ) -> tuple[str, CachedResponse | None, dict[str, str | None]]:
+        """Cache status of request ("bypass" or "miss") and any stored response"""
+        if self.cache is None:
+            return "bypass", None, {}
+        if request.method != "GET":
+            return "bypass", None, {}
+        if any(name in request.headers for name in BYPASS_HEADERS):
+            return "bypass", None, {}
+        directives = _directives(request.headers)
+        if "no-store" in directives:
+            return "bypass", None, directives
+        return "miss", self.cache.lookup(request), directives
+
+    def _finish(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        status: str,
+        entry: CachedResponse | None,
+        request_time: float,
+    ) -> httpx.Response:
+        """Store or invalidate after a response arrived from the network"""
+        response_time = time.time()
+        cache = self.cache
+        if status == "bypass" or cache is None:
+            # Unsafe methods invalidate the stored response (RFC 9111 4.4)
+            if (
+                cache is not None
+                and request.method not in SAFE_METHODS
+                and response.status_code < 400
+            ):
+                cache.invalidate(request.url)
+            return response
+        if entry is not None and response.status_code == 304:
+            return cache.update(
+                entry, response, request_time, response_time
+            ).to_response(time.time())
+        if not cache.storable(request, response):
+            if entry is not None:
+                cache.invalidate(request.url)
+            return response
+
+        def store(body: bytes) -> None:
+            cache.store(request, response, body, request_time, response_time)
+
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_RecordingStream(response.stream, cache.max_body_size, store),
+            extensions=response.extensions,
+        )
+
+    def _report(
+        self,
+        request: httpx.Request,
+        response: httpx.Response | None,
+        elapsed: float,
+        attempt: int,
+        cache: str,
+        error: Exception | None = None,
+    ) -> None:
+        """Pass the timing of an attempt to the hooks"""
+        timing = RequestTiming(
+            method=request.method,
+            url=str(request.url),
+            host=request.url.host,
+            status=response.status_code if response is not None else None,
+            elapsed=elapsed,
+            attempt=attempt,
+            cache=cache,
+            error=repr(error) if error is not None else None,
+        )
+        logger.debug(
+            f"{timing.method} {timing.url} -> {timing.status or timing.error} "
+            f"in {elapsed:.3f}s (attempt {attempt}, cache {cache})"
+        )
+        for hook in (*TIMING_HOOKS, *self.hooks):
+            try:
+                hook(timing)
+            except Exception as e:
+                logger.warning(f"Timing hook failed: {e}")
+
+
+class Transport(_Policy, httpx.HTTPTransport):
+    """Pooled sync transport with timeouts, retries, caching and timing hooks"""
+
+    def __init__(
+        self,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        host_timeouts: dict[str, float | httpx.Timeout] | None = None,
+        retry: RetryPolicy | None = None,
+        cache: HTTPCache | None = None,
+        hooks: Iterable[TimingHook] = (),
+        **kwargs: Any,
+    ):
+        """
+        Initialize the transport
+
+        Args:
+            timeout: Timeout of requests to hosts without their own
+            host_timeouts: Host name -> timeout for requests to it
+            retry: Retry policy (default: RetryPolicy())
+            cache: Response cache (default: none)
+            hooks: Callables receiving a RequestTiming per attempt
+            **kwargs: Passed to httpx.HTTPTransport (limits, http2, ...)
+        """
+        super().__init__(**kwargs)
+        self._setup(timeout, host_timeouts, retry, cache, hooks)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._prepare(request)
+        status, entry, directives = self._lookup(request)
+        if entry is not None:
+            if entry.is_fresh(directives, time.time()):
+                self._report(request, None, 0.0, 0, "hit")
+                return entry.to_response(time.time())
+            request.headers.update(entry.validators())
+
+        request_time = time.time()
+        response = self._send(request, "revalidated" if entry else status)
+        return self._finish(request, response, status, entry, request_time)
+
+    def _send(self, request: httpx.Request, cache: str) -> httpx.Response:
+        """Send request, retrying failures as the policy allows"""
+        attempt = 0
+        while True:
+            attempt += 1
+            start = time.monotonic()
+            try:
+                response = super().handle_request(request)
+            except httpx.TransportError as e:
+                self._report(request, None, time.monotonic() - start, attempt, cache, e)
+                if attempt > self.retry.retries or not self.retry.retry_error(
+                    request, e
+                ):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                continue
+
+            self._report(request, response, time.monotonic() - start, attempt, cache)
+            retry_after = self.retry.retry_response(request, response)
+            if attempt > self.retry.retries or retry_after is None:
+                return response
+            response.close()
+            time.sleep(self.retry.delay(attempt, retry_after or None))
+
+
+class AsyncTransport(_Policy, httpx.AsyncHTTPTransport):
+    """Async counterpart of Transport"""
+
+    def __init__(
+        self,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        host_timeouts: dict[str, float | httpx.Timeout] | None = None,
+        retry: RetryPolicy | None = None,
+        cache: HTTPCache | None = None,
+        hooks: Iterable[TimingHook] = (),
+        **kwargs: Any,
+    ):
+        """Initialize the transport; see Transport for the arguments"""
+        super().__init__(**kwargs)
+        self._setup(timeout, host_timeouts, retry, cache, hooks)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._prepare(request)
+        status, entry, directives = self._lookup(request)
+        if entry is not None:
+            if entry.is_fresh(directives, time.time()):
+                self._report(request, None, 0.0, 0, "hit")
+                return entry.to_response(time.time())
+            request.headers.update(entry.validators())
+
+        request_time = time.time()
+        response = await self._send(request, "revalidated" if entry else status)
+        return self._finish(request, response, status, entry, request_time)
+
+    async def _send(self, request: httpx.Request, cache: str) -> httpx.Response:
+        """Send request, retrying failures as the policy allows"""
+        attempt = 0
+        while True:
+            attempt += 1
+            start = time.monotonic()
+            try:
+                response = await super().handle_async_request(request)
+            except httpx.TransportError as e:
+                self._report(request, None, time.monotonic() - start, attempt, cache, e)
+                if attempt > self.retry.retries or not self.retry.retry_error(
+                    request, e
+                ):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+                continue
+
+            self._report(request, response, time.monotonic() - start, attempt, cache)
+            retry_after = self.retry.retry_response(request, response)
+            if attempt > self.retry.retries or retry_after is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(self.retry.delay(attempt, retry_after or None))
+
+
+def _transport_options(
+    timeout: float | httpx.Timeout,
+    host_timeouts: dict[str, float | httpx.Timeout] | None,
+    retry: RetryPolicy | None,
+    cache: HTTPCache | bool,
+    hooks: Iterable[TimingHook],
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+    http2: bool,
+) -> dict:
+    if cache is True:
+        cache = HTTPCache()
+    return {
+        "timeout": timeout,
+        "host_timeouts": host_timeouts,
+        "retry": retry,
+        "cache": None if cache is False else cache,
+        "hooks": hooks,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        "http2": http2,
+    }
+
+
+def create_client(
+    headers: dict[str, str] | None = None,
+    timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+    host_timeouts: dict[str, float | httpx.Timeout] | None = None,
+    retry: RetryPolicy | None = None,
+    cache: HTTPCache | bool = True,
+    hooks: Iterable[TimingHook] = (),
+    max_connections: int = MAX_CONNECTIONS,
+    max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    follow_redirects: bool = True,
+) -> httpx.Client:
+    """
+    Create a pooled HTTP client on the shared transport
+
+    Args:
+        headers: Headers sent with every request
+        timeout: Timeout of requests to hosts without their own
+        host_timeouts: Host name -> timeout for requests to it
+        retry: Retry policy (default: RetryPolicy())
+        cache: True for a private response cache, an HTTPCache to share one,
+            or False for none
+        hooks: Callables receiving a RequestTiming per attempt
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept open
+        http2: Use HTTP/2 (requires the h2 package)
+        follow_redirects: Follow redirects like requests does
+
+    Returns:
+        httpx.Client
+    """
+    transport = Transport(
+        **_transport_options(
+            timeout,
+            host_timeouts,
+            retry,
+            cache,
+            hooks,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            http2,
+        )
+    )
+    # The transport applies the timeouts, so the client must not set its own
+    return httpx.Client(
+        headers=headers,
+        timeout=None,
+        transport=transport,
+        follow_redirects=follow_redirects,
+    )
+
+
+def create_async_client(
+    headers: dict[str, str] | None = None,
+    timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+    host_timeouts: dict[str, float | httpx.Timeout] | None = None,
+    retry: RetryPolicy | None = None,
+    cache: HTTPCache | bool = True,
+    hooks: Iterable[TimingHook] = (),
+    max_connections: int = MAX_CONNECTIONS,
+    max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    follow_redirects: bool = True,
+) -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client on the shared transport
+
+    Takes the same arguments as create_client.
+
+    Returns:
+        httpx.AsyncClient
+    """
+    transport = AsyncTransport(
+        **_transport_options(
+            timeout,
+            host_timeouts,
+            retry,
+            cache,
+            hooks,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            http2,
+        )
+    )
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=None,
+        transport=transport,
+        follow_redirects=follow_redirects,
+    )
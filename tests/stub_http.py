@@ -0,0 +1,60 @@
+# tests/stub_http.py
+"""
+Threaded local HTTP server that the platform and transport tests build their stubs on
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Request handler passing every request to the stub server owning it"""
+
+    protocol_version = "HTTP/1.1"
+    stub = None  # set per server by StubHTTPServer
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.stub.handle(self)
+
+    def do_POST(self):
+        self.stub.handle(self)
+
+    def reply(self, status, body=b"", content_type=None, headers=None):
+        """Send a complete response with its Content-Length"""
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubHTTPServer:
+    """
+    Local HTTP server on a free port, serving from a daemon thread
+
+    Subclasses set up their state before calling __init__ and answer each
+    request in handle(). The server listens at url, which ends in path.
+    """
+
+    path = ""
+
+    def __init__(self):
+        handler = type("Handler", (StubHandler,), {"stub": self})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}{self.path}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def handle(self, request):
+        """Answer one request through its StubHandler"""
+        raise NotImplementedError
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,131 @@
+# tests/test_apaper_cache.py
+"""
+Unit tests for the APaper persistent cache
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from apaper.models.paper import Paper
+from apaper.utils.cache import PersistentCache
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite3")
+        self.cache = PersistentCache(self.path, namespace="test", ttl=60)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_set_and_get(self):
+        """Values round-trip together with their validators"""
+        self.cache.set("a", {"title": "A"}, etag='"v1"', last_modified="Mon")
+        entry = self.cache.get("a")
+        self.assertEqual(entry.value, {"title": "A"})
+        self.assertTrue(self.cache.is_fresh(entry))
+        self.assertEqual(
+            entry.validators(), {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+        )
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_persists_across_instances(self):
+        """A new cache instance on the same file sees earlier entries"""
+        self.cache.set("a", [1, 2, 3])
+        other = PersistentCache(self.path, namespace="test")
+        try:
+            self.assertEqual(other.get("a").value, [1, 2, 3])
+        finally:
+            other.close()
+
+    def test_namespaces_are_isolated(self):
+        """Caches sharing a file do not see each other's keys"""
+        other = PersistentCache(self.path, namespace="other")
+        try:
+            self.cache.set("a", 1)
+            self.assertIsNone(other.get("a"))
+        finally:
+            other.close()
+
+    def test_ttl_and_touch(self):
+        """Entries go stale after the TTL and touch() revalidates them"""
+        cache = PersistentCache(self.path, namespace="ttl", ttl=0.05)
+        try:
+            cache.set("a", 1)
+            time.sleep(0.1)
+            self.assertFalse(cache.is_fresh(cache.get("a")))
+            cache.touch("a")
+            self.assertTrue(cache.is_fresh(cache.get("a")))
+        finally:
+            cache.close()
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when the cache is full"""
+        cache = PersistentCache(self.path, namespace="lru", max_entries=2)
+        try:
+            cache.set("a", 1)
+            time.sleep(0.01)
+            cache.set("b", 2)
+            time.sleep(0.01)
+            cache.get("a")
+            time.sleep(0.01)
+            cache.set("c", 3)
+            self.assertEqual(len(cache), 2)
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("a").value, 1)
+            self.assertEqual(cache.get("c").value, 3)
+        finally:
+            cache.close()
+
+    def test_set_many(self):
+        """Batched writes store every value and respect max_entries"""
+        cache = PersistentCache(self.path, namespace="batch", max_entries=3)
+        try:
+            cache.set("old", 0)
+            time.sleep(0.01)
+            cache.set_many({"a": 1, "b": [2], "c": {"v": 3}})
+            self.assertEqual(len(cache), 3)
+            self.assertIsNone(cache.get("old"))
+            self.assertEqual(cache.get("b").value, [2])
+            self.assertIsNone(cache.get("c").etag)
+            cache.set_many({})
+            self.assertEqual(len(cache), 3)
+        finally:
+            cache.close()
+
+
+class TestPaperSerialization(unittest.TestCase):
+    def test_round_trip(self):
+        """Papers stored as dictionaries are restored unchanged"""
+        paper = Paper(
+            paper_id="2024/001",
+            title="A",
+            authors=["Alice"],
+            abstract="",
+            doi="",
+            published_date=datetime(2024, 1, 2),
+            pdf_url="",
+            url="",
+            source="iacr",
+            extra={"venue": "CRYPTO"},
+        )
+        self.assertEqual(Paper.from_dict(paper.to_dict()), paper)
+
+    def test_missing_published_date(self):
+        """A missing publication date becomes the 1900 placeholder"""
+        paper = Paper.from_dict({"paper_id": "x", "published_date": None})
+        self.assertEqual(paper.published_date, datetime(1900, 1, 1))
+        self.assertIsNone(paper.updated_date)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,915 @@
+# tests/test_apaper_dblp.py
+"""
+Unit tests for APaper DBLP functionality
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+# Add the src directory and the repository root to the path so we can import
+# our modules and the shared test helpers
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from apaper.models.paper import Paper
+from apaper.platforms.dblp import (
+    HTTP2_AVAILABLE,
+    STREAM_MIN_HITS,
+    DBLPSearcher,
+    HitStream,
+)
+from apaper.utils.cache import PersistentCache
+from tests.stub_http import StubHTTPServer
+
+
+def make_hit(key, title, year, venue="CRYPTO", authors=("Alice", "Bob")):
+    """Build a DBLP search API hit"""
+    return {
+        "info": {
+            "authors": {"author": [{"text": a} for a in authors]},
+            "title": title,
+            "venue": venue,
+            "year": str(year),
+            "type": "Conference and Workshop Papers",
+            "doi": f"10.1000/{key.replace('/', '.')}",
+            "ee": f"https://doi.org/10.1000/{key}",
+            "url": f"https://dblp.org/rec/{key}",
+        }
+    }
+
+
+def make_response(hits):
+    """Wrap hits in a DBLP search API response"""
+    return make_json_response(
+        {"result": {"hits": {"@total": str(len(hits)), "hit": hits}}}
+    )
+
+
+def make_json_response(data):
+    """Response carrying data as a JSON body"""
+    return httpx.Response(200, json=data)
+
+
+def route(client, handler):
+    """Answer the requests of client with handler(url, params=...)"""
+
+    def send(request, **kwargs):
+        url = str(request.url.copy_with(query=None))
+        response = handler(url, params=dict(request.url.params))
+        response.request = request
+        return response
+
+    return mock.patch.object(client, "send", side_effect=send)
+
+
+class TestAPaperDBLPIterSearch(unittest.TestCase):
+    """iter_search yields Paper objects lazily from a mocked API"""
+
+    def setUp(self):
+        self.searcher = DBLPSearcher()
+        self.responses = {
+            "lattice": make_response(
+                [
+                    make_hit("conf/crypto/A24", "Lattice Signatures", 2024),
+                    make_hit("conf/crypto/B20", "Lattice Encryption", 2020),
+                ]
+            ),
+            "isogeny": make_response(
+                [
+                    make_hit("conf/crypto/A24", "Lattice Signatures", 2024),
+                    make_hit("conf/eurocrypt/C23", "Isogeny Walks", 2023, "EUROCRYPT"),
+                ]
+            ),
+        }
+
+    def _get(self, url, params=None, **kwargs):
+        return self.responses[params["q"].split()[0]]
+
+    def test_papers_match_search_to_papers(self):
+        """iter_search yields the same papers as search_to_papers"""
+        with route(self.searcher.client, self._get):
+            expected = self.searcher.search_to_papers("lattice", max_results=5)
+            papers = list(self.searcher.iter_search("lattice", max_results=5))
+
+        self.assertEqual(papers, expected)
+        self.assertIsInstance(papers[0], Paper)
+        self.assertEqual(papers[0].paper_id, "conf/crypto/A24")
+        self.assertEqual(papers[0].authors, ["Alice", "Bob"])
+        self.assertEqual(papers[0].extra["venue"], "CRYPTO")
+
+    def test_or_subqueries_keep_rank_order(self):
+        """OR results follow sub-query order with duplicates dropped"""
+        with route(self.searcher.client, self._get):
+            papers = list(self.searcher.iter_search("lattice or isogeny"))
+
+        self.assertEqual(
+            [p.title for p in papers],
+            ["Lattice Signatures", "Lattice Encryption", "Isogeny Walks"],
+        )
+
+    def test_filters_applied_while_iterating(self):
+        """Year and venue filters skip non-matching hits"""
+        with route(self.searcher.client, self._get):
+            papers = list(
+                self.searcher.iter_search(
+                    "lattice or isogeny", year_from=2023, venue_filter="crypt"
+                )
+            )
+
+        self.assertEqual(
+            [p.paper_id for p in papers], ["conf/crypto/A24", "conf/eurocrypt/C23"]
+        )
+
+    def test_asearch_returns_search_results(self):
+        """asearch returns the same dictionaries as search"""
+        with route(self.searcher.client, self._get):
+            expected = self.searcher.search("lattice", max_results=5)
+            results = asyncio.run(self.searcher.asearch("lattice", max_results=5))
+
+        self.assertEqual(results, expected)
+        self.assertEqual(results[0]["dblp_key"], "conf/crypto/A24")
+
+    def test_errors_are_skipped(self):
+        """Request failures produce no papers"""
+        with mock.patch.object(
+            self.searcher.client, "send", side_effect=ValueError("boom")
+        ):
+            self.assertEqual(list(self.searcher.iter_search("lattice")), [])
+            results = self.searcher.search("lattice")
+        self.assertEqual(results[0]["venue"], "Error")
+
+
+class TestAPaperDBLPParallelSubqueries(unittest.TestCase):
+    """OR sub-queries run concurrently against a slow mocked API"""
+
+    TERMS = ("alpha", "beta", "gamma", "delta", "epsilon", "zeta")
+
+    def _fake_get(self, delay):
+        active = {"now": 0, "peak": 0, "calls": []}
+        lock = threading.Lock()
+
+        def get(url, params=None, **kwargs):
+            term = params["q"]
+            with lock:
+                active["calls"].append(term)
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            # Later sub-queries answer first to exercise rank-order merging
+            time.sleep(delay * (len(self.TERMS) - self.TERMS.index(term)))
+            with lock:
+                active["now"] -= 1
+            return make_response(
+                [
+                    make_hit(f"conf/x/{term}1", f"{term} one", 2024),
+                    make_hit("conf/x/shared", "Shared Paper", 2024),
+                ]
+            )
+
+        return get, active
+
+    def test_subqueries_run_concurrently(self):
+        """Latency is close to the slowest sub-query, not the sum"""
+        searcher = DBLPSearcher()
+        get, active = self._fake_get(delay=0.05)
+        with route(searcher.client, get):
+            start = time.monotonic()
+            results = searcher.search(" or ".join(self.TERMS), max_results=20)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(active["peak"], len(self.TERMS))
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(
+            [r["title"] for r in results[:3]],
+            ["alpha one", "Shared Paper", "beta one"],
+        )
+        self.assertEqual(len(results), len(self.TERMS) + 1)
+
+    def test_early_stop_cancels_queued_subqueries(self):
+        """Sub-queries that have not started are skipped once enough results exist"""
+        searcher = DBLPSearcher(max_workers=2)
+        get, active = self._fake_get(delay=0.02)
+        with route(searcher.client, get):
+            results = searcher.search(" or ".join(self.TERMS), max_results=2)
+
+        self.assertEqual([r["title"] for r in results], ["alpha one", "Shared Paper"])
+        self.assertLessEqual(active["peak"], 2)
+        self.assertLess(len(active["calls"]), len(self.TERMS))
+
+
+class StubDBLPServer(StubHTTPServer):
+    """Local stand-in for dblp.org that records the connection of every request"""
+
+    def __init__(self, hits, delay=0.0, status=200):
+        self.hits = hits
+        self.delay = delay
+        self.status = status
+        self.connections = []
+        self.paths = []
+        self.redirects = {}
+        super().__init__()
+
+    def handle(self, request):
+        self.connections.append(request.client_address)
+        self.paths.append(request.path)
+        time.sleep(self.delay)
+        if request.path in self.redirects:
+            request.reply(301, headers={"Location": self.redirects[request.path]})
+            return
+        if self.status != 200:
+            request.reply(self.status)
+            return
+        if request.path.startswith("/search/publ/api"):
+            params = parse_qs(urlsplit(request.path).query)
+            first = int(params.get("f", ["0"])[0])
+            count = int(params.get("h", ["30"])[0])
+            body = json.dumps(
+                {
+                    "result": {
+                        "hits": {
+                            "@total": str(len(self.hits)),
+                            "hit": self.hits[first : first + count],
+                        }
+                    }
+                }
+            ).encode()
+            request.reply(200, body, "application/json")
+        else:
+            key = request.path[len("/rec/") : -len(".bib")]
+            body = f"@inproceedings{{DBLP:{key},\n}}\n".encode()
+            request.reply(200, body, "text/plain")
+
+
+class TestAPaperDBLPConnectionPool(unittest.TestCase):
+    """Searches and BibTeX fetches share pooled keep-alive connections"""
+
+    def setUp(self):
+        hits = [make_hit(f"conf/crypto/P{i}", f"Paper {i}", 2020 + i) for i in range(5)]
+        self.server = StubDBLPServer(hits)
+        self.searcher = DBLPSearcher(
+            http2=False, max_workers=1, mirrors=[self.server.url]
+        )
+
+    def tearDown(self):
+        self.searcher.close()
+        self.server.close()
+
+    def test_bibtex_search_reuses_one_connection(self):
+        """A search with BibTeX makes 6 requests over a single connection"""
+        results = self.searcher.search("paper", max_results=5, include_bibtex=True)
+
+        self.assertEqual(len(results), 5)
+        self.assertIn("DBLP:conf/crypto/P0", results[0]["bibtex"])
+        self.assertEqual(len(self.server.connections), 6)
+        self.assertEqual(len(set(self.server.connections)), 1)
+
+    def test_redirects_are_followed(self):
+        """A moved record is fetched from where DBLP redirects to"""
+        self.server.redirects["/rec/conf/old/P1.bib"] = "/rec/conf/crypto/P1.bib"
+        bibtex = self.searcher.fetch_bibtex_entry("conf/old/P1")
+        self.assertIn("DBLP:conf/crypto/P1", bibtex)
+
+    def test_pool_limits_are_configurable(self):
+        """Pool limits are passed through to the client"""
+        searcher = DBLPSearcher(max_connections=2, max_keepalive_connections=1)
+        try:
+            pool = searcher.client._transport._pool
+            self.assertEqual(pool._max_connections, 2)
+            self.assertEqual(pool._max_keepalive_connections, 1)
+        finally:
+            searcher.close()
+
+    @unittest.skipUnless(HTTP2_AVAILABLE, "h2 is not installed")
+    def test_http2_client_searches(self):
+        """The default HTTP/2 client negotiates down to HTTP/1.1 on plain http"""
+        searcher = DBLPSearcher(mirrors=[self.server.url])
+        try:
+            self.assertTrue(searcher.client._transport._pool._http2)
+            results = searcher.search("paper", max_results=5, include_bibtex=True)
+            self.assertEqual(len(results), 5)
+            self.assertIn("DBLP:conf/crypto/P0", results[0]["bibtex"])
+        finally:
+            searcher.close()
+
+
+class TestAPaperDBLPBibtexCache(unittest.TestCase):
+    """BibTeX entries are cached in memory and on disk and fetched in bulk"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        hits = [make_hit(f"conf/crypto/P{i}", f"Paper {i}", 2020 + i) for i in range(4)]
+        self.server = StubDBLPServer(hits, delay=0.1)
+        self.searcher = self._make_searcher()
+
+    def tearDown(self):
+        self.searcher.close()
+        self.server.close()
+        self.tmpdir.cleanup()
+
+    def _make_searcher(self, **kwargs):
+        cache = PersistentCache(
+            os.path.join(self.tmpdir.name, "cache.sqlite3"), namespace="dblp_bibtex"
+        )
+        return DBLPSearcher(
+            http2=False, bibtex_cache=cache, mirrors=[self.server.url], **kwargs
+        )
+
+    def _bib_requests(self):
+        return [p for p in self.server.paths if p.endswith(".bib")]
+
+    def test_repeat_search_skips_bib_requests(self):
+        """A repeated search with BibTeX only hits the search API"""
+        first = self.searcher.search("paper", max_results=4, include_bibtex=True)
+        second = self.searcher.search("paper", max_results=4, include_bibtex=True)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(second), 4)
+        self.assertEqual(len(self._bib_requests()), 4)
+
+    def test_bulk_fetch_is_concurrent(self):
+        """Cache misses are fetched in parallel"""
+        keys = [f"conf/crypto/P{i}" for i in range(4)]
+        start = time.monotonic()
+        entries = self.searcher.fetch_bibtex_entries(keys)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(list(entries), keys)
+        self.assertIn("DBLP:conf/crypto/P2", entries["conf/crypto/P2"])
+        self.assertLess(elapsed, 0.3)
+
+    def test_keys_are_normalized(self):
+        """Different spellings of one key share a cache entry"""
+        bibtex = self.searcher.fetch_bibtex_entry("conf/crypto/P1")
+        for spelling in (
+            "DBLP:conf/crypto/P1",
+            "https://dblp.org/rec/conf/crypto/P1",
+            " conf/crypto/P1.bib ",
+        ):
+            self.assertEqual(self.searcher.fetch_bibtex_entry(spelling), bibtex)
+        self.assertEqual(len(self._bib_requests()), 1)
+
+    def test_disk_cache_survives_restart(self):
+        """A new searcher reads entries persisted by a previous one"""
+        self.searcher.fetch_bibtex_entry("conf/crypto/P0")
+        other = self._make_searcher()
+        try:
+            self.assertIn(
+                "DBLP:conf/crypto/P0", other.fetch_bibtex_entry("conf/crypto/P0")
+            )
+        finally:
+            other.close()
+        self.assertEqual(len(self._bib_requests()), 1)
+
+    def test_memory_cache_is_bounded(self):
+        """The in-memory cache evicts least recently used entries"""
+        searcher = DBLPSearcher(
+            http2=False, bibtex_memory_size=2, mirrors=[self.server.url]
+        )
+        try:
+            for i in range(3):
+                searcher.fetch_bibtex_entry(f"conf/crypto/P{i}")
+            self.assertEqual(
+                list(searcher._bibtex_memory), ["conf/crypto/P1", "conf/crypto/P2"]
+            )
+        finally:
+            searcher.close()
+
+
+class TestAPaperDBLPPaging(unittest.TestCase):
+    """Large result sets are streamed page by page with f= offsets"""
+
+    def setUp(self):
+        hits = [make_hit(f"journals/x/P{i}", f"Paper {i}", 2000) for i in range(250)]
+        self.server = StubDBLPServer(hits)
+        self.searcher = DBLPSearcher(
+            http2=False, page_size=100, mirrors=[self.server.url]
+        )
+
+    def tearDown(self):
+        self.searcher.close()
+        self.server.close()
+
+    def _pages(self):
+        pages = []
+        for path in self.server.paths:
+            params = parse_qs(urlsplit(path).query)
+            pages.append((int(params["f"][0]), int(params["h"][0])))
+        return pages
+
+    def test_iterates_past_page_size(self):
+        """All hits are streamed across several pages in order"""
+        papers = list(self.searcher.iter_search("paper"))
+
+        self.assertEqual(len(papers), 250)
+        self.assertEqual(papers[0].paper_id, "journals/x/P0")
+        self.assertEqual(papers[-1].paper_id, "journals/x/P249")
+        self.assertEqual(self._pages(), [(0, 100), (100, 100), (200, 100)])
+
+    def test_global_limit_sizes_last_page(self):
+        """The last page only asks for the hits still needed"""
+        results = self.searcher.search("paper", max_results=150)
+
+        self.assertEqual(len(results), 150)
+        self.assertEqual(self._pages(), [(0, 100), (100, 50)])
+
+    def test_unbounded_or_query_pages_lazily(self):
+        """Sub-queries without a limit are paged as the consumer iterates"""
+        results = self.searcher.iter_search("paper or article")
+        self.assertEqual(len([next(results) for _ in range(5)]), 5)
+        results.close()
+        time.sleep(0.2)
+
+        queries = [parse_qs(urlsplit(path).query)["q"][0] for path in self.server.paths]
+        self.assertLessEqual(len(queries), 2)
+        self.assertEqual(set(queries), {"paper"})
+
+    def test_next_page_is_prefetched(self):
+        """The next page is requested while the current one is consumed"""
+        results = self.searcher.iter_search("paper")
+        next(results)
+        deadline = time.monotonic() + 2
+        while len(self.server.paths) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        results.close()
+
+        self.assertEqual(self._pages()[:2], [(0, 100), (100, 100)])
+
+    def test_offset_resumes_from_cursor(self):
+        """An offset starts paging directly at that hit"""
+        results = self.searcher.search("paper", max_results=10, offset=120)
+
+        self.assertEqual(results[0]["dblp_key"], "journals/x/P120")
+        self.assertEqual(len(results), 10)
+        self.assertEqual(self._pages(), [(120, 10)])
+
+    def test_offset_with_filters_skips_matches(self):
+        """With filters the offset counts filtered results"""
+        results = self.searcher.search(
+            "paper", max_results=5, offset=20, venue_filter="crypto"
+        )
+
+        self.assertEqual(
+            [r["dblp_key"] for r in results],
+            [f"journals/x/P{i}" for i in range(20, 25)],
+        )
+
+
+class TestAPaperDBLPFilterPushdown(unittest.TestCase):
+    """Filters are sent to DBLP and selective filters page adaptively"""
+
+    def setUp(self):
+        hits = [
+            make_hit(
+                f"journals/x/P{i}",
+                f"Paper {i}",
+                2000 + i % 20,
+                venue="CRYPTO" if i % 10 == 0 else "Other",
+            )
+            for i in range(1000)
+        ]
+        self.server = StubDBLPServer(hits)
+        self.searcher = DBLPSearcher(
+            http2=False, page_size=200, mirrors=[self.server.url]
+        )
+
+    def tearDown(self):
+        self.searcher.close()
+        self.server.close()
+
+    def _queries(self):
+        return [parse_qs(urlsplit(p).query) for p in self.server.paths]
+
+    def test_filters_become_query_terms(self):
+        """Bounded year ranges are added to the query, venues are not"""
+        query, exact = self.searcher._push_filters("lattice", 2019, 2021, None)
+        self.assertEqual(query, "lattice year:2019:|year:2020:|year:2021:")
+        self.assertTrue(exact)
+
+        query, exact = self.searcher._push_filters("lattice", None, None, "CRYPTO")
+        self.assertEqual(query, "lattice")
+        self.assertFalse(exact)
+
+        query, exact = self.searcher._push_filters("lattice", 1990, 2020, "ACM CCS")
+        self.assertEqual(query, "lattice")
+        self.assertFalse(exact)
+
+    def test_pushdown_can_be_disabled(self):
+        """push_filters=False keeps the query unchanged"""
+        searcher = DBLPSearcher(push_filters=False)
+        try:
+            self.assertEqual(
+                searcher._push_filters("lattice", 2019, 2021, "CRYPTO"),
+                ("lattice", False),
+            )
+        finally:
+            searcher.close()
+
+    def test_selective_filter_fills_quota(self):
+        """A filter matching 10% of hits still returns a full page in few requests"""
+        results = self.searcher.search("paper", max_results=10, venue_filter="crypto")
+
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(r["venue"] == "CRYPTO" for r in results))
+        queries = self._queries()
+        self.assertLessEqual(len(queries), 3)
+        self.assertEqual(queries[0]["q"], ["paper"])
+
+    def test_venue_filter_matches_substrings(self):
+        """A venue filter matches inside venue words, not just at their start"""
+        results = self.searcher.search("paper", max_results=5, venue_filter="rypt")
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r["venue"] == "CRYPTO" for r in results))
+
+    def test_budget_limits_examined_hits(self):
+        """Paging stops once the filter budget is spent"""
+        searcher = DBLPSearcher(
+            http2=False, page_size=200, filter_budget=300, mirrors=[self.server.url]
+        )
+        try:
+            results = searcher.search("paper", max_results=10, venue_filter="none")
+        finally:
+            searcher.close()
+
+        self.assertEqual(results, [])
+        examined = sum(int(q["h"][0]) for q in self._queries())
+        self.assertLessEqual(examined, 300)
+
+
+class TestAPaperDBLPMirrors(unittest.TestCase):
+    """Requests go to the fastest healthy mirror and fail over between mirrors"""
+
+    def setUp(self):
+        self.hits = [make_hit("conf/crypto/P0", "Paper 0", 2020)]
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.close()
+
+    def _server(self, **kwargs):
+        server = StubDBLPServer(self.hits, **kwargs)
+        self.servers.append(server)
+        return server
+
+    def test_routes_to_fastest_mirror(self):
+        """After measuring every mirror, requests go to the fastest one"""
+        slow = self._server(delay=0.2)
+        fast = self._server()
+        searcher = DBLPSearcher(http2=False, mirrors=[slow.url, fast.url])
+        try:
+            for _ in range(6):
+                self.assertEqual(len(searcher.search("paper")), 1)
+        finally:
+            searcher.close()
+
+        self.assertEqual(len(slow.paths), 1)
+        self.assertEqual(len(fast.paths), 5)
+        self.assertLess(searcher.mirrors[1].latency, searcher.mirrors[0].latency)
+
+    def test_timeout_fails_over(self):
+        """A timed-out mirror is skipped for later requests"""
+        hanging = self._server(delay=1.0)
+        backup = self._server()
+        searcher = DBLPSearcher(
+            http2=False, mirrors=[hanging.url, backup.url], timeout=0.2
+        )
+        try:
+            start = time.monotonic()
+            first = searcher.search("paper")
+            second = searcher.search("paper")
+            elapsed = time.monotonic() - start
+        finally:
+            searcher.close()
+
+        self.assertEqual(first[0]["dblp_key"], "conf/crypto/P0")
+        self.assertEqual(second, first)
+        self.assertEqual(len(hanging.paths), 1)
+        self.assertEqual(len(backup.paths), 2)
+        self.assertLess(elapsed, 0.8)
+        self.assertGreater(searcher.mirrors[0].down_until, time.monotonic())
+
+    def test_server_error_fails_over(self):
+        """5xx responses fail over, 4xx responses are returned as is"""
+        broken = self._server(status=503)
+        healthy = self._server()
+        searcher = DBLPSearcher(http2=False, mirrors=[broken.url, healthy.url])
+        try:
+            results = searcher.search("paper")
+            self.assertEqual(searcher.mirrors[0].failures, 1)
+            bibtex = searcher.fetch_bibtex_entry("conf/crypto/P0")
+            self.assertTrue(bibtex.startswith("@inproceedings"))
+        finally:
+            searcher.close()
+
+        self.assertEqual(results[0]["dblp_key"], "conf/crypto/P0")
+        self.assertEqual(len(broken.paths), 1)
+
+    def test_all_mirrors_failing_reports_error(self):
+        """When every mirror fails the error is reported as a result"""
+        servers = [self._server(status=500), self._server(status=502)]
+        searcher = DBLPSearcher(http2=False, mirrors=[s.url for s in servers])
+        try:
+            results = searcher.search("paper")
+        finally:
+            searcher.close()
+
+        self.assertEqual(results[0]["venue"], "Error")
+        self.assertEqual([len(s.paths) for s in servers], [1, 1])
+
+
+def make_payload(hits):
+    """Serialize a search API response the way DBLP lays it out"""
+    return json.dumps(
+        {
+            "result": {
+                "query": 'lattice "hit":[',
+                "status": {"@code": "200", "text": "OK"},
+                "completions": {"@total": "1", "c": {"@sc": "9", "text": "lattice"}},
+                "hits": {
+                    "@total": "12345",
+                    "@computed": "1000",
+                    "@sent": str(len(hits)),
+                    "@first": "0",
+                    "hit": hits,
+                },
+            }
+        },
+        indent=1,
+    )
+
+
+def chunked(text, size):
+    """Split text into chunks of size characters"""
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestAPaperDBLPStreamingDecode(unittest.TestCase):
+    """Search hits are decoded incrementally from the response stream"""
+
+    def setUp(self):
+        self.hits = [
+            make_hit(f"conf/crypto/S{i}", f"Streamed \u00e9 {{paper}} {i}", 2000 + i)
+            for i in range(50)
+        ]
+
+    def test_stream_matches_full_decode(self):
+        """Hits split at any chunk boundary decode like the whole document"""
+        payload = make_payload(self.hits)
+        for size in (1, 7, 4096):
+            with self.subTest(size=size):
+                stream = HitStream(chunked(payload, size))
+                self.assertEqual(list(stream), self.hits)
+                self.assertEqual(stream.total, 12345)
+
+    def test_empty_and_single_hit_responses(self):
+        """Responses without a hit array or with a single hit object decode"""
+        stream = HitStream(['{"result": {"hits": {"@total": "0"}}}'])
+        self.assertEqual(list(stream), [])
+        self.assertEqual(stream.total, 0)
+
+        payload = json.dumps({"result": {"hits": {"@total": "1", "hit": self.hits[0]}}})
+        stream = HitStream(chunked(payload, 5))
+        self.assertEqual(list(stream), [self.hits[0]])
+        self.assertEqual(stream.total, 1)
+
+    def test_truncated_response_raises(self):
+        """A body cut off inside the hit array is an error"""
+        payload = make_payload(self.hits)
+        with self.assertRaises(ValueError):
+            list(HitStream(chunked(payload[: len(payload) // 2], 64)))
+
+    def test_search_results_match_buffered_decode(self):
+        """Streamed and buffered decoding return the same search results"""
+        server = StubDBLPServer(self.hits)
+        streamed = DBLPSearcher(http2=False, mirrors=[server.url], stream_json=True)
+        buffered = DBLPSearcher(http2=False, mirrors=[server.url], stream_json=False)
+        try:
+            expected = buffered.search("paper", max_results=40)
+            self.assertEqual(streamed.search("paper", max_results=40), expected)
+            self.assertEqual(expected[3]["dblp_key"], "conf/crypto/S3")
+        finally:
+            streamed.close()
+            buffered.close()
+            server.close()
+
+    def test_only_large_pages_stream_by_default(self):
+        """Pages below STREAM_MIN_HITS are decoded with response.json()"""
+        server = StubDBLPServer(self.hits)
+        searcher = DBLPSearcher(http2=False, mirrors=[server.url])
+        request = searcher._request
+        streamed = []
+
+        def record(path, params=None, stream=False):
+            streamed.append((params["h"], stream))
+            return request(path, params, stream=stream)
+
+        try:
+            with mock.patch.object(searcher, "_request", side_effect=record):
+                searcher.search("paper", max_results=STREAM_MIN_HITS - 1)
+                searcher.search("paper", max_results=STREAM_MIN_HITS)
+        finally:
+            searcher.close()
+            server.close()
+
+        self.assertEqual(
+            streamed, [(STREAM_MIN_HITS - 1, False), (STREAM_MIN_HITS, True)]
+        )
+
+    def test_peak_memory_below_full_decode(self):
+        """Streaming 1000 hits never holds the whole response tree"""
+        hits = [
+            make_hit(f"conf/crypto/M{i}", f"Memory Paper {i}", 2000 + i % 25)
+            for i in range(1000)
+        ]
+        chunks = chunked(make_payload(hits), 64 * 1024)
+        searcher = DBLPSearcher()
+
+        def full_decode():
+            full = json.loads("".join(chunks))["result"]["hits"]["hit"]
+            return [searcher._parse_hit(hit) for hit in full]
+
+        def stream_decode():
+            return [searcher._parse_hit(hit) for hit in HitStream(chunks)]
+
+        def overhead(decode):
+            """Peak memory beyond the returned records"""
+            tracemalloc.start()
+            try:
+                records = decode()
+                current, peak = tracemalloc.get_traced_memory()
+                return records, peak - current
+            finally:
+                tracemalloc.stop()
+
+        try:
+            expected, full_overhead = overhead(full_decode)
+            records, stream_overhead = overhead(stream_decode)
+        finally:
+            searcher.close()
+
+        self.assertEqual(records, expected)
+        self.assertLess(stream_overhead, full_overhead / 4)
+
+
+PERSON_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<dblpperson name="Sarah Smith 0001" pid="12/3456" n="2">
+<person key="homepages/12/3456" mdate="2024-01-01"><author pid="12/3456">Sarah Smith 0001</author></person>
+<r><article key="journals/joc/SmithM23" mdate="2023-03-01">
+<author pid="12/3456">Sarah Smith 0001</author><author pid="78/9">J&#252;rgen M&#246;ller</author>
+<title>Lattice Signatures.</title><year>2023</year><journal>J. Cryptol.</journal>
+<ee>https://doi.org/10.1007/s1</ee></article></r>
+<r><inproceedings key="conf/crypto/Smith21" mdate="2021-08-01">
+<author pid="12/3456">Sarah Smith 0001</author>
+<title>Isogeny Walks.</title><year>2021</year><booktitle>CRYPTO (2)</booktitle></inproceedings></r>
+</dblpperson>
+"""
+
+
+class TestAPaperDBLPListings(unittest.TestCase):
+    """Author profiles and venue listings are cached and refreshed incrementally"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = PersistentCache(
+            os.path.join(self.tmpdir.name, "cache.sqlite3"), namespace="dblp_listings"
+        )
+        self.searcher = DBLPSearcher(page_size=2, listing_cache=self.cache)
+        self.venue_hits = [
+            make_hit(f"conf/crypto/V{i}", f"Venue Paper {i}", 2020 + i // 2)
+            for i in range(5)
+        ]
+        self.new_hits = []
+        self.requests = []
+
+    def tearDown(self):
+        self.searcher.close()
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def _get(self, url, params=None, **kwargs):
+        path = urlsplit(url).path
+        self.requests.append((path, dict(params or {})))
+        if path == "/search/author/api":
+            hits = [
+                {
+                    "info": {
+                        "author": "Sarah Smith 0002",
+                        "url": "https://dblp.org/pid/99/1",
+                    }
+                },
+                {
+                    "info": {
+                        "author": "Sarah Smith 0001",
+                        "url": "https://dblp.org/pid/12/3456",
+                    }
+                },
+            ]
+            return make_json_response({"result": {"hits": {"hit": hits}}})
+        if path == "/search/venue/api":
+            hits = [
+                {
+                    "info": {
+                        "venue": "Annual International Cryptology Conference",
+                        "acronym": "CRYPTO",
+                        "url": "https://dblp.org/db/conf/crypto/",
+                    }
+                }
+            ]
+            return make_json_response({"result": {"hits": {"hit": hits}}})
+        if path == "/pid/12/3456.xml":
+            return httpx.Response(200, content=PERSON_XML)
+        if path == "/search/publ/api":
+            hits = self.new_hits if "year:" in params["q"] else self.venue_hits
+            first, count = int(params["f"]), int(params["h"])
+            return make_json_response(
+                {
+                    "result": {
+                        "hits": {
+                            "@total": str(len(hits)),
+                            "hit": hits[first : first + count],
+                        }
+                    }
+                }
+            )
+        raise AssertionError(f"unexpected request {url}")
+
+    def test_author_profile_cached(self):
+        """An author profile is downloaded once and then served from the cache"""
+        with route(self.searcher.client, self._get):
+            first = self.searcher.get_author_publications("Sarah Smith 0001")
+            second = self.searcher.get_author_publications("sarah smith 0001")
+
+        self.assertEqual(
+            [r["dblp_key"] for r in first],
+            ["journals/joc/SmithM23", "conf/crypto/Smith21"],
+        )
+        self.assertEqual(first[0]["authors"], ["Sarah Smith 0001", "Jürgen Möller"])
+        self.assertEqual(second, first)
+        self.assertEqual(
+            [path for path, _ in self.requests],
+            ["/search/author/api", "/pid/12/3456.xml"],
+        )
+
+    def test_author_refresh_fetches_only_new_records(self):
+        """A refresh queries records since the newest cached year and merges them"""
+        with route(self.searcher.client, self._get):
+            self.searcher.get_author_publications("12/3456")
+            self.new_hits = [
+                make_hit("journals/joc/SmithM23", "Lattice Signatures.", 2023),
+                make_hit("conf/crypto/Smith25", "New Result.", 2025),
+            ]
+            self.requests.clear()
+            results = self.searcher.get_author_publications("12/3456", refresh=True)
+
+        self.assertEqual(
+            [r["dblp_key"] for r in results],
+            ["conf/crypto/Smith25", "journals/joc/SmithM23", "conf/crypto/Smith21"],
+        )
+        ((path, params),) = self.requests
+        self.assertEqual(path, "/search/publ/api")
+        self.assertTrue(
+            params["q"].startswith("author:Sarah_Smith_0001: year:2023:|year:2024:")
+        )
+
+    def test_venue_listing_pages_and_caches(self):
+        """A venue stream is paged through once and sliced from the cache"""
+        with route(self.searcher.client, self._get):
+            page = self.searcher.get_venue_publications("CRYPTO", max_results=2)
+            next_page = self.searcher.get_venue_publications(
+                "CRYPTO", max_results=2, offset=2
+            )
+
+        self.assertEqual(
+            [r["dblp_key"] for r in page + next_page],
+            ["conf/crypto/V4", "conf/crypto/V2", "conf/crypto/V3", "conf/crypto/V0"],
+        )
+        publ = [params for path, params in self.requests if path == "/search/publ/api"]
+        self.assertEqual([p["q"] for p in publ], ["stream:streams/conf/crypto:"] * 3)
+        self.assertEqual([p["f"] for p in publ], ["0", "2", "4"])
+
+    def test_venue_refresh_merges_new_year(self):
+        """Refreshing a venue only asks for the newest years"""
+        with route(self.searcher.client, self._get):
+            self.searcher.get_venue_publications("conf/crypto")
+            self.new_hits = [make_hit("conf/crypto/V9", "Fresh Paper", 2023)]
+            self.requests.clear()
+            results = self.searcher.get_venue_publications("conf/crypto", refresh=True)
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results[0]["dblp_key"], "conf/crypto/V9")
+        self.assertTrue(all("year:2022:" in params["q"] for _, params in self.requests))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,308 @@
+# tests/test_apaper_dblp_index.py
+"""
+Unit tests for the offline DBLP index, built from a small synthetic dblp.xml dump
+"""
+
+import gzip
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+
+import httpx
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from apaper.platforms.dblp import DBLPSearcher
+from apaper.platforms.dblp_index import DBLPIndex, iter_records
+
+DUMP_HEAD = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<!DOCTYPE dblp SYSTEM "dblp.dtd">
+<dblp>
+"""
+
+SAMPLE_RECORDS = """
+<article mdate="2023-01-10" key="journals/joc/MollerS23">
+<author>J&uuml;rgen M&ouml;ller</author>
+<author>Sarah Smith 0001</author>
+<title>Lattice-Based <i>Threshold</i> Signatures.</title>
+<pages>1-42</pages>
+<year>2023</year>
+<volume>36</volume>
+<journal>J. Cryptol.</journal>
+<number>2</number>
+<ee>https://doi.org/10.1007/s00145-023-09001-1</ee>
+<url>db/journals/joc/joc36.html#MollerS23</url>
+</article>
+<inproceedings mdate="2021-08-01" key="conf/crypto/SmithL21">
+<author>Sarah Smith 0001</author>
+<author>Li Lei</author>
+<title>Isogeny Walks Revisited.</title>
+<pages>100-130</pages>
+<year>2021</year>
+<booktitle>CRYPTO (2)</booktitle>
+<ee>https://doi.org/10.1007/978-3-030-84245-1_4</ee>
+<crossref>conf/crypto/2021-2</crossref>
+<url>db/conf/crypto/crypto2021-2.html#SmithL21</url>
+</inproceedings>
+<inproceedings mdate="2019-05-01" key="conf/eurocrypt/Lei19">
+<author>Li Lei</author>
+<title>Lattice Trapdoors in Practice.</title>
+<pages>1-20</pages>
+<year>2019</year>
+<booktitle>EUROCRYPT (1)</booktitle>
+<ee>https://eprint.iacr.org/2019/001</ee>
+</inproceedings>
+<proceedings mdate="2021-08-01" key="conf/crypto/2021-2">
+<editor>Tal Malkin</editor>
+<editor>Chris Peikert</editor>
+<title>Advances in Cryptology - CRYPTO 2021, Part II.</title>
+<booktitle>CRYPTO (2)</booktitle>
+<publisher>Springer</publisher>
+<series>Lecture Notes in Computer Science</series>
+<volume>12826</volume>
+<year>2021</year>
+<isbn>978-3-030-84244-4</isbn>
+</proceedings>
+<www mdate="2020-01-01" key="homepages/00/0001">
+<author>Sarah Smith 0001</author>
+<title>Home Page</title>
+</www>
+"""
+
+
+def write_dump(path, records=SAMPLE_RECORDS, compress=False):
+    """Write a synthetic dblp.xml dump"""
+    data = (DUMP_HEAD + records + "</dblp>\n").encode("iso-8859-1")
+    opener = gzip.open if compress else open
+    with opener(path, "wb") as f:
+        f.write(data)
+
+
+class TestDBLPIndex(unittest.TestCase):
+    """Ingestion, search and BibTeX rendering of the local index"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dump = os.path.join(self.tmpdir.name, "dblp.xml.gz")
+        write_dump(self.dump, compress=True)
+        self.index = DBLPIndex(os.path.join(self.tmpdir.name, "dblp.sqlite3"))
+
+    def tearDown(self):
+        self.index.close()
+        self.tmpdir.cleanup()
+
+    def test_build_from_compressed_dump(self):
+        """Publication records are indexed, person pages are skipped"""
+        self.assertFalse(self.index.is_populated())
+        self.assertEqual(self.index.build(self.dump), 4)
+        self.assertTrue(self.index.is_populated())
+        self.assertEqual(len(self.index), 4)
+
+        record = self.index.get("journals/joc/MollerS23")
+        self.assertEqual(record["title"], "Lattice-Based Threshold Signatures.")
+        self.assertEqual(record["authors"], ["Jürgen Möller", "Sarah Smith 0001"])
+        self.assertEqual(record["venue"], "J. Cryptol.")
+        self.assertEqual(record["doi"], "10.1007/s00145-023-09001-1")
+
+    def test_rebuild_replaces_index(self):
+        """Building again swaps in the new contents"""
+        self.index.build(self.dump)
+        smaller = os.path.join(self.tmpdir.name, "small.xml")
+        write_dump(smaller, SAMPLE_RECORDS.split("<inproceedings")[0])
+        self.assertEqual(self.index.build(smaller), 1)
+        self.assertEqual(len(self.index), 1)
+
+    def test_search_title_terms_and_filters(self):
+        """Title search supports OR alternatives and year/venue/author filters"""
+        self.index.build(self.dump)
+
+        keys = [r["dblp_key"] for r in self.index.search("lattice")]
+        self.assertCountEqual(keys, ["journals/joc/MollerS23", "conf/eurocrypt/Lei19"])
+        results = self.index.search("lattice or isogeny", year_from=2020)
+        self.assertCountEqual(
+            [r["dblp_key"] for r in results],
+            ["journals/joc/MollerS23", "conf/crypto/SmithL21"],
+        )
+        results = self.index.search("lattice", venue_filter="eurocrypt")
+        self.assertEqual([r["dblp_key"] for r in results], ["conf/eurocrypt/Lei19"])
+        results = self.index.search("", author="sarah smith 0001")
+        self.assertEqual(
+            [r["dblp_key"] for r in results],
+            ["journals/joc/MollerS23", "conf/crypto/SmithL21"],
+        )
+        self.assertEqual(results[1]["type"], "Conference and Workshop Papers")
+        self.assertEqual(results[1]["url"], "https://dblp.org/rec/conf/crypto/SmithL21")
+
+    def test_search_matches_authors_and_venues(self):
+        """Query terms match author names and venues like the DBLP API"""
+        self.index.build(self.dump)
+
+        results = self.index.search("smith")
+        self.assertCountEqual(
+            [r["dblp_key"] for r in results],
+            ["journals/joc/MollerS23", "conf/crypto/SmithL21"],
+        )
+        results = self.index.search("moller lattice")
+        self.assertEqual([r["dblp_key"] for r in results], ["journals/joc/MollerS23"])
+        results = self.index.search("eurocrypt")
+        self.assertEqual([r["dblp_key"] for r in results], ["conf/eurocrypt/Lei19"])
+
+    def test_venue_filter_is_literal(self):
+        """LIKE wildcards in a venue filter match only themselves"""
+        self.index.build(self.dump)
+
+        self.assertEqual(self.index.search("", venue_filter="%"), [])
+        self.assertEqual(self.index.search("", venue_filter="J_ Cryptol"), [])
+        results = self.index.search("", venue_filter="J. Cryptol")
+        self.assertEqual([r["dblp_key"] for r in results], ["journals/joc/MollerS23"])
+
+    def test_title_only_index_is_upgraded(self):
+        """An index built before authors and venues were indexed is rebuilt"""
+        self.index.build(self.dump)
+        self.index.close()
+        conn = sqlite3.connect(self.index.path)
+        with conn:
+            conn.execute("DROP TABLE publications_fts")
+            conn.execute(
+                "CREATE VIRTUAL TABLE publications_fts USING fts5(key UNINDEXED, title)"
+            )
+            conn.execute(
+                "INSERT INTO publications_fts SELECT key, title FROM publications"
+            )
+        conn.close()
+
+        results = self.index.search("lei")
+        self.assertCountEqual(
+            [r["dblp_key"] for r in results],
+            ["conf/crypto/SmithL21", "conf/eurocrypt/Lei19"],
+        )
+
+    def test_render_bibtex(self):
+        """BibTeX entries are rendered locally in DBLP's layout"""
+        self.index.build(self.dump)
+        bibtex = self.index.render_bibtex("conf/crypto/SmithL21")
+
+        self.assertTrue(bibtex.startswith("@inproceedings{DBLP:conf/crypto/SmithL21,"))
+        self.assertIn(
+            "  author       = {Sarah Smith 0001 and\n                  Li Lei},", bibtex
+        )
+        self.assertIn("  title        = {Isogeny Walks Revisited},", bibtex)
+        self.assertIn("  booktitle    = {CRYPTO (2)},", bibtex)
+        self.assertIn("  doi          = {10.1007/978-3-030-84245-1_4},", bibtex)
+        self.assertTrue(bibtex.endswith("}\n"))
+
+        editors = self.index.render_bibtex("conf/crypto/2021-2")
+        self.assertIn("  editor       = {Tal Malkin and", editors)
+        self.assertIn("  publisher    = {Springer},", editors)
+        self.assertEqual(self.index.render_bibtex("conf/missing/X"), "")
+
+    def test_parsing_memory_is_bounded(self):
+        """Streaming a large dump keeps only the current record in memory"""
+        record = (
+            '<article key="journals/x/P{i}"><author>Author {i}</author>'
+            "<title>Paper number {i} about lattices.</title><year>2020</year>"
+            "<journal>X</journal></article>\n"
+        )
+        records = "".join(record.format(i=i) for i in range(20000))
+        data = (DUMP_HEAD + records + "</dblp>\n").encode("iso-8859-1")
+
+        tracemalloc.start()
+        count = sum(1 for _ in iter_records(io.BytesIO(data)))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(count, 20000)
+        self.assertLess(peak, len(data) // 4)
+
+
+class TestDBLPSearcherLocalIndex(unittest.TestCase):
+    """DBLPSearcher serves searches and BibTeX from a populated index"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        dump = os.path.join(self.tmpdir.name, "dblp.xml")
+        write_dump(dump)
+        self.index = DBLPIndex(os.path.join(self.tmpdir.name, "dblp.sqlite3"))
+        self.index.build(dump)
+        self.searcher = DBLPSearcher(index=self.index)
+
+    def tearDown(self):
+        self.searcher.close()
+        self.index.close()
+        self.tmpdir.cleanup()
+
+    def test_search_without_network(self):
+        """search, search_to_papers and BibTeX never touch the network"""
+        with mock.patch.object(
+            self.searcher.client, "send", side_effect=AssertionError("network used")
+        ):
+            results = self.searcher.search("isogeny", include_bibtex=True)
+            papers = self.searcher.search_to_papers("lattice", year_to=2020)
+
+        self.assertEqual(results[0]["dblp_key"], "conf/crypto/SmithL21")
+        self.assertIn("Isogeny Walks Revisited", results[0]["bibtex"])
+        self.assertEqual([p.paper_id for p in papers], ["conf/eurocrypt/Lei19"])
+        self.assertEqual(papers[0].extra["venue"], "EUROCRYPT (1)")
+
+    def test_author_query_matches_api(self):
+        """An author query finds the same records offline as online"""
+        hits = [
+            {
+                "info": {
+                    "title": "Lattice-Based Threshold Signatures.",
+                    "url": "https://dblp.org/rec/journals/joc/MollerS23",
+                }
+            },
+            {
+                "info": {
+                    "title": "Isogeny Walks Revisited.",
+                    "url": "https://dblp.org/rec/conf/crypto/SmithL21",
+                }
+            },
+        ]
+        response = httpx.Response(
+            200,
+            json={"result": {"hits": {"@total": "2", "hit": hits}}},
+            request=httpx.Request("GET", "https://dblp.org/search/publ/api"),
+        )
+        online = DBLPSearcher()
+        try:
+            with mock.patch.object(online.client, "send", return_value=response):
+                api_results = online.search("sarah smith")
+        finally:
+            online.close()
+        local_results = self.searcher.search("sarah smith")
+
+        self.assertCountEqual(
+            [r["dblp_key"] for r in local_results],
+            [r["dblp_key"] for r in api_results],
+        )
+
+    def test_empty_index_searches_online(self):
+        """An index that was never built falls back to the API"""
+        searcher = DBLPSearcher(
+            index=DBLPIndex(os.path.join(self.tmpdir.name, "missing.sqlite3"))
+        )
+        response = httpx.Response(
+            200,
+            json={"result": {"hits": {"@total": "0"}}},
+            request=httpx.Request("GET", "https://dblp.org/search/publ/api"),
+        )
+        try:
+            with mock.patch.object(
+                searcher.client, "send", return_value=response
+            ) as send:
+                self.assertEqual(searcher.search("lattice"), [])
+            send.assert_called_once()
+        finally:
+            searcher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+# tests/test_apaper_federated.py
+"""
+Unit tests for concurrent multi-source search
+"""
+import os
+import sys
+import time
+import unittest
+from datetime import datetime
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from apaper.models.paper import Paper
+from apaper.platforms.federated import FederatedSearcher, merge_ranked
+
+
+def make_paper(source, title, doi="", citations=0, abstract=""):
+    """Build a minimal Paper"""
+    return Paper(
+        paper_id=f"{source}:{title}",
+        title=title,
+        authors=["Alice"],
+        abstract=abstract,
+        doi=doi,
+        published_date=datetime(2024, 1, 1),
+        pdf_url="",
+        url=f"https://{source}.example/{title}",
+        source=source,
+        citations=citations,
+    )
+
+
+def slow_source(papers, delay=0.0, error=None):
+    """Source function returning papers after delay"""
+
+    def search(query, max_results, year_from, year_to):
+        time.sleep(delay)
+        if error:
+            raise error
+        return papers[:max_results]
+
+    return search
+
+
+class TestFederatedSearch(unittest.TestCase):
+    """Sources run concurrently, each bounded by its own deadline"""
+
+    def test_latency_bounded_by_slowest_source(self):
+        """Three sources cost about as much as the slowest one"""
+        searcher = FederatedSearcher(
+            {
+                "a": slow_source([make_paper("a", "One")], 0.2),
+                "b": slow_source([make_paper("b", "Two")], 0.2),
+                "c": slow_source([make_paper("c", "Three")], 0.2),
+            }
+        )
+        try:
+            start = time.monotonic()
+            result = searcher.search("query")
+            elapsed = time.monotonic() - start
+        finally:
+            searcher.close()
+
+        self.assertLess(elapsed, 0.45)
+        self.assertEqual([p.title for p in result.papers], ["One", "Two", "Three"])
+        self.assertEqual(result.counts, {"a": 1, "b": 1, "c": 1})
+        self.assertEqual(result.missing, {})
+
+    def test_slow_and_failing_sources_are_reported(self):
+        """A source past its deadline is named and the others are returned"""
+        searcher = FederatedSearcher(
+            {
+                "fast": slow_source([make_paper("fast", "Quick")]),
+                "slow": slow_source([make_paper("slow", "Late")], 1.0),
+                "broken": slow_source([], error=RuntimeError("boom")),
+            },
+            deadlines={"fast": 1.0, "slow": 0.1},
+        )
+        try:
+            start = time.monotonic()
+            result = searcher.search("query")
+            elapsed = time.monotonic() - start
+        finally:
+            searcher.close()
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual([p.title for p in result.papers], ["Quick"])
+        self.assertEqual(
+            result.missing,
+            {"slow": "timed out after 0.1 seconds", "broken": "failed: boom"},
+        )
+        self.assertEqual(result.counts, {"fast": 1})
+
+    def test_stragglers_do_not_starve_other_sources(self):
+        """Threads held by a slow source leave the others their own workers"""
+        searcher = FederatedSearcher(
+            {
+                "slow": slow_source([make_paper("slow", "Late")], 1.0),
+                "fast": slow_source([make_paper("fast", "Quick")]),
+            },
+            deadlines={"slow": 0.05, "fast": 0.5},
+            max_workers=1,
+        )
+        try:
+            results = [searcher.search("query") for _ in range(3)]
+        finally:
+            searcher.close()
+
+        for result in results:
+            self.assertEqual([p.title for p in result.papers], ["Quick"])
+            self.assertIn("slow", result.missing)
+
+
+class TestMergeRanked(unittest.TestCase):
+    """Results are deduplicated and ranked by reciprocal rank fusion"""
+
+    def test_duplicates_merge_and_rank_first(self):
+        """A paper found by several sources outranks single-source hits"""
+        results = {
+            "dblp": [
+                make_paper("dblp", "Only DBLP"),
+                make_paper("dblp", "Shared Paper.", doi="10.1/X"),
+            ],
+            "scholar": [
+                make_paper("scholar", "Only Scholar", citations=5),
+                make_paper("scholar", "shared paper", citations=42, abstract="Text"),
+            ],
+        }
+        papers = merge_ranked(results, ["dblp", "scholar"], 10)
+
+        self.assertEqual(
+            [p.title for p in papers], ["Shared Paper.", "Only DBLP", "Only Scholar"]
+        )
+        shared = papers[0]
+        self.assertEqual(shared.source, "dblp")
+        self.assertEqual(shared.extra["sources"], ["dblp", "scholar"])
+        self.assertEqual(shared.doi, "10.1/X")
+        self.assertEqual(shared.citations, 42)
+        self.assertEqual(shared.abstract, "Text")
+
+    def test_doi_match_and_limit(self):
+        """Same DOI under different titles is one paper; the list is truncated"""
+        results = {
+            "a": [make_paper("a", "Title A", doi="10.1/Y"), make_paper("a", "Other")],
+            "b": [make_paper("b", "Title B", doi="10.1/y")],
+        }
+        papers = merge_ranked(results, ["a", "b"], 1)
+        self.assertEqual(len(papers), 1)
+        self.assertEqual(papers[0].extra["sources"], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,677 @@
+# tests/test_apaper_google_scholar.py
+"""
+Unit tests for APaper Google Scholar functionality
+"""
+
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from typing import ClassVar
+from unittest import mock
+
+# Add the src directory and the repository root to the path so we can import
+# our modules and the shared test helpers
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import apaper.utils.html as html_utils
+from apaper.platforms.google_scholar import GoogleScholarSearcher
+from apaper.utils.cache import PersistentCache
+from apaper.utils.rate_limit import TokenBucket
+from tests.stub_http import StubHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(name):
+    """Read an HTML fixture from tests/fixtures"""
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def make_result_page(entries):
+    """Build a Scholar result page from (title, cluster ID or None) pairs"""
+    items = []
+    for title, cluster in entries:
+        links = ""
+        if cluster:
+            links = (
+                f'<a href="/scholar?cites={cluster}&amp;hl=en">Cited by 3</a> '
+                f'<a href="/scholar?cluster={cluster}&amp;hl=en">All 2 versions</a>'
+            )
+        items.append(
+            '<div class="gs_r gs_or gs_scl"><div class="gs_ri">'
+            f'<h3 class="gs_rt"><a href="https://example.org/{title}">{title}</a></h3>'
+            '<div class="gs_a">A Author - Some Venue, 2022 - example.org</div>'
+            f'<div class="gs_fl gs_flb">{links}</div>'
+            "</div></div>"
+        )
+    return f"<html><body>{''.join(items)}</body></html>"
+
+
+class TestGoogleScholarParsingBackends(unittest.TestCase):
+    """The fast HTML backend returns the same papers as the full one"""
+
+    PARSERS = (
+        ("html.parser", "lxml")
+        if html_utils.FAST_PARSER == "lxml"
+        else ("html.parser",)
+    )
+
+    def setUp(self):
+        self.html = load_fixture("scholar_search.html")
+        self.full = GoogleScholarSearcher(html_backend="full")
+        self.fast = GoogleScholarSearcher(html_backend="fast")
+
+    def test_result_page_parity(self):
+        """Result entries parse identically with both backends"""
+        expected = list(self.full._iter_results(self.html))
+        self.assertEqual(len(expected), 4)
+        self.assertIsNone(expected[3])
+        self.assertEqual(expected[0].citations, 150000)
+        for parser in self.PARSERS:
+            with (
+                self.subTest(parser=parser),
+                mock.patch.object(html_utils, "FAST_PARSER", parser),
+            ):
+                self.assertEqual(list(self.fast._iter_results(self.html)), expected)
+
+    def test_fast_search_end_to_end(self):
+        """search() works unchanged with the fast backend"""
+        response = mock.Mock(status_code=200, text=self.html)
+        with (
+            mock.patch.object(self.fast.session, "get", return_value=response),
+            mock.patch("time.sleep"),
+        ):
+            papers = self.fast.search("attention transformer", max_results=2)
+
+        self.assertEqual(len(papers), 2)
+        self.assertEqual(papers[0].title, "Attention is all you need")
+        self.assertEqual(papers[0].authors[:2], ["A Vaswani", "N Shazeer"])
+        self.assertEqual(papers[1].citations, 42)
+
+    def test_iter_search_fetches_pages_lazily(self):
+        """Only the first result page is requested when the consumer stops early"""
+        response = mock.Mock(status_code=200, text=self.html)
+        with (
+            mock.patch.object(
+                self.fast.session, "get", return_value=response
+            ) as session_get,
+            mock.patch("time.sleep"),
+        ):
+            results = self.fast.iter_search("attention transformer")
+            first = next(results)
+            second = next(results)
+            results.close()
+
+        self.assertEqual(first.title, "Attention is all you need")
+        self.assertEqual(second.citations, 42)
+        self.assertEqual(session_get.call_count, 1)
+
+
+class TestGoogleScholarRateLimiting(unittest.TestCase):
+    """Requests are paced by a token bucket that backs off when throttled"""
+
+    def setUp(self):
+        self.html = load_fixture("scholar_search.html")
+        self.limiter = TokenBucket(rate=100, capacity=2, backoff=0.01)
+        self.searcher = GoogleScholarSearcher(
+            html_backend="fast", rate_limiter=self.limiter
+        )
+
+    def test_shared_limiter_by_default(self):
+        """Searchers without their own limiter share the process-wide one"""
+        other = GoogleScholarSearcher()
+        self.assertIs(other.rate_limiter, GoogleScholarSearcher().rate_limiter)
+
+    def test_first_request_not_delayed(self):
+        """An idle limiter lets the first request go out without sleeping"""
+        response = mock.Mock(status_code=200, text=self.html)
+        with (
+            mock.patch.object(self.searcher.session, "get", return_value=response),
+            mock.patch("time.sleep") as sleep,
+        ):
+            papers = self.searcher.search("attention transformer", max_results=2)
+
+        self.assertEqual(len(papers), 2)
+        sleep.assert_not_called()
+
+    def test_retries_after_429_and_captcha(self):
+        """Throttled responses back off and retry instead of ending the search"""
+        throttled = mock.Mock(status_code=429, text="", headers={"Retry-After": "0"})
+        captcha = mock.Mock(
+            status_code=200,
+            url="https://scholar.google.com/scholar?q=x",
+            text='<form id="gs_captcha_f">unusual traffic</form>',
+        )
+        ok = mock.Mock(status_code=200, text=self.html)
+        with mock.patch.object(
+            self.searcher.session, "get", side_effect=[throttled, captcha, ok]
+        ) as session_get:
+            papers = self.searcher.search("attention transformer", max_results=2)
+
+        self.assertEqual(len(papers), 2)
+        self.assertEqual(session_get.call_count, 3)
+        self.assertEqual(self.limiter.failures, 2)
+        self.assertEqual(self.limiter.rate, 100 / 4 * 1.25)
+
+    def test_gives_up_after_max_retries(self):
+        """Persistent throttling stops the search after max_retries"""
+        throttled = mock.Mock(status_code=429, text="", headers={})
+        with mock.patch.object(
+            self.searcher.session, "get", return_value=throttled
+        ) as session_get:
+            self.assertEqual(self.searcher.search("attention"), [])
+
+        self.assertEqual(session_get.call_count, self.searcher.max_retries + 1)
+
+    def test_gives_up_when_backoff_exceeds_max_wait(self):
+        """A long backoff fails fast instead of blocking the caller"""
+        searcher = GoogleScholarSearcher(
+            rate_limiter=TokenBucket(rate=1, backoff=60), max_wait=0.1
+        )
+        searcher.rate_limiter.penalize()
+        with mock.patch.object(searcher.session, "get") as session_get:
+            self.assertEqual(searcher.search("attention"), [])
+        session_get.assert_not_called()
+
+
+class TestGoogleScholarResultCache(unittest.TestCase):
+    """Search results are cached with stale-while-revalidate"""
+
+    EMPTY_PAGE = "<html><body><div id='gs_res_ccl'></div></body></html>"
+
+    def setUp(self):
+        self.html = load_fixture("scholar_search.html")
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = PersistentCache(
+            os.path.join(self.tmpdir.name, "cache.sqlite3"), namespace="scholar"
+        )
+        self.searcher = self._searcher(self.cache)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def _searcher(self, cache, **kwargs):
+        return GoogleScholarSearcher(
+            html_backend="fast",
+            rate_limiter=TokenBucket(rate=1000, capacity=10),
+            cache=cache,
+            **kwargs,
+        )
+
+    def _wait_for_refreshes(self, searcher):
+        for thread in list(searcher._refreshing.values()):
+            thread.join()
+
+    def test_repeat_query_served_from_cache(self):
+        """A repeated, differently spaced query makes no request"""
+        response = mock.Mock(status_code=200, text=self.html)
+        with mock.patch.object(
+            self.searcher.session, "get", return_value=response
+        ) as session_get:
+            first = self.searcher.search("Attention Transformer", max_results=2)
+            start = time.monotonic()
+            second = self.searcher.search("  attention   transformer ", max_results=2)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(session_get.call_count, 1)
+        self.assertEqual(second, first)
+        self.assertLess(elapsed, 0.05)
+
+    def test_smaller_limit_reuses_superset(self):
+        """Fewer results are sliced from a cached larger search"""
+        response = mock.Mock(status_code=200, text=self.html)
+        with mock.patch.object(
+            self.searcher.session, "get", return_value=response
+        ) as session_get:
+            superset = self.searcher.search("attention", max_results=3)
+            subset = self.searcher.search("attention", max_results=1)
+            self.searcher.search("attention", max_results=3, year_low=2020)
+
+        self.assertEqual(subset, superset[:1])
+        self.assertEqual(session_get.call_count, 2)
+
+    def test_stale_entry_served_then_refreshed(self):
+        """Stale results return at once while a refresh runs in the background"""
+        cache = PersistentCache(
+            os.path.join(self.tmpdir.name, "stale.sqlite3"), namespace="scholar", ttl=0
+        )
+        searcher = self._searcher(cache)
+        old = mock.Mock(status_code=200, text=self.html)
+        new = mock.Mock(status_code=200, text=self.EMPTY_PAGE)
+        try:
+            with mock.patch.object(
+                searcher.session, "get", side_effect=[old, new]
+            ) as session_get:
+                first = searcher.search("attention", max_results=2)
+                stale = searcher.search("attention", max_results=2)
+                self._wait_for_refreshes(searcher)
+
+            self.assertEqual(stale, first)
+            self.assertEqual(session_get.call_count, 2)
+            self.assertEqual(cache.get("attention||").value["papers"], [])
+        finally:
+            cache.close()
+
+    def test_empty_results_cached_briefly(self):
+        """Empty results are cached, but go stale after the negative TTL"""
+        empty = mock.Mock(status_code=200, text=self.EMPTY_PAGE)
+        with mock.patch.object(
+            self.searcher.session, "get", return_value=empty
+        ) as session_get:
+            self.assertEqual(self.searcher.search("no such paper"), [])
+            self.assertEqual(self.searcher.search("no such paper"), [])
+        self.assertEqual(session_get.call_count, 1)
+
+        searcher = self._searcher(self.cache, negative_ttl=0)
+        with mock.patch.object(
+            searcher.session, "get", return_value=empty
+        ) as session_get:
+            self.assertEqual(searcher.search("no such paper"), [])
+            self._wait_for_refreshes(searcher)
+        self.assertEqual(session_get.call_count, 1)
+
+    def test_entries_past_max_stale_are_misses(self):
+        """Entries older than max_stale are searched again, not served"""
+        cache = PersistentCache(
+            os.path.join(self.tmpdir.name, "old.sqlite3"), namespace="scholar", ttl=0
+        )
+        searcher = self._searcher(cache, max_stale=0)
+        old = mock.Mock(status_code=200, text=self.html)
+        new = mock.Mock(status_code=200, text=self.EMPTY_PAGE)
+        try:
+            with mock.patch.object(
+                searcher.session, "get", side_effect=[old, new]
+            ) as session_get:
+                self.assertEqual(len(searcher.search("attention", max_results=2)), 2)
+                self.assertEqual(searcher.search("attention", max_results=2), [])
+
+            self.assertEqual(session_get.call_count, 2)
+            self.assertEqual(searcher._refreshing, {})
+        finally:
+            cache.close()
+
+    def test_stale_empty_results_are_misses(self):
+        """An empty result list past the negative TTL is searched again"""
+        searcher = self._searcher(self.cache, negative_ttl=0)
+        empty = mock.Mock(status_code=200, text=self.EMPTY_PAGE)
+        found = mock.Mock(status_code=200, text=self.html)
+        with mock.patch.object(
+            searcher.session, "get", side_effect=[empty, found]
+        ) as session_get:
+            self.assertEqual(searcher.search("attention", max_results=2), [])
+            self.assertEqual(len(searcher.search("attention", max_results=2)), 2)
+
+        self.assertEqual(session_get.call_count, 2)
+        self.assertEqual(searcher._refreshing, {})
+
+    def test_background_refreshes_are_capped(self):
+        """No more than max_refreshes refresh threads run at once"""
+        cache = PersistentCache(
+            os.path.join(self.tmpdir.name, "cap.sqlite3"), namespace="scholar", ttl=0
+        )
+        searcher = self._searcher(cache, max_refreshes=2)
+        response = mock.Mock(status_code=200, text=self.html)
+        release = threading.Event()
+
+        def blocked_get(*args, **kwargs):
+            release.wait(5)
+            return response
+
+        try:
+            with mock.patch.object(searcher.session, "get", return_value=response):
+                for i in range(4):
+                    searcher.search(f"query {i}", max_results=2)
+            with mock.patch.object(
+                searcher.session, "get", side_effect=blocked_get
+            ) as session_get:
+                for i in range(4):
+                    self.assertEqual(
+                        len(searcher.search(f"query {i}", max_results=2)), 2
+                    )
+                self.assertEqual(len(searcher._refreshing), 2)
+                release.set()
+                self._wait_for_refreshes(searcher)
+            self.assertEqual(session_get.call_count, 2)
+        finally:
+            release.set()
+            cache.close()
+
+    def test_failed_searches_not_cached(self):
+        """A failed request leaves nothing in the cache"""
+        failed = mock.Mock(status_code=500, text="")
+        with mock.patch.object(
+            self.searcher.session, "get", return_value=failed
+        ) as session_get:
+            self.assertEqual(self.searcher.search("attention"), [])
+            self.assertEqual(self.searcher.search("attention"), [])
+
+        self.assertEqual(session_get.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestGoogleScholarPaperIds(unittest.TestCase):
+    """Paper IDs are stable and index previously seen records"""
+
+    def setUp(self):
+        self.html = load_fixture("scholar_search.html")
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.index = PersistentCache(
+            os.path.join(self.tmpdir.name, "cache.sqlite3"), namespace="records"
+        )
+
+    def tearDown(self):
+        self.index.close()
+        self.tmpdir.cleanup()
+
+    def _search(self, searcher):
+        response = mock.Mock(status_code=200, text=self.html)
+        with mock.patch.object(searcher.session, "get", return_value=response):
+            return searcher.search("attention transformer", max_results=3)
+
+    def test_cluster_and_content_ids(self):
+        """Cluster IDs come from the result links, other IDs from a digest"""
+        for backend in ("full", "fast"):
+            with self.subTest(backend=backend):
+                searcher = GoogleScholarSearcher(
+                    html_backend=backend,
+                    rate_limiter=TokenBucket(rate=1000, capacity=10),
+                )
+                papers = self._search(searcher)
+                digest = hashlib.sha256(papers[2].title.lower().encode())
+                self.assertEqual(
+                    [p.paper_id for p in papers],
+                    [
+                        "gs_2960712678066186980",
+                        "gs_1234567890123456789",
+                        f"gs_{digest.hexdigest()[:16]}",
+                    ],
+                )
+                self.assertEqual(papers[0].extra["cluster_id"], "2960712678066186980")
+                self.assertNotIn("cluster_id", papers[2].extra)
+
+    def test_seen_records_are_looked_up_by_id(self):
+        """Search results can be fetched again by ID, across searcher instances"""
+        searcher = GoogleScholarSearcher(
+            html_backend="fast",
+            rate_limiter=TokenBucket(rate=1000, capacity=10),
+            record_index=self.index,
+        )
+        papers = self._search(searcher)
+        self.assertEqual(searcher.get_paper(papers[1].paper_id), papers[1])
+        self.assertIsNone(searcher.get_paper("gs_0"))
+
+        fresh = GoogleScholarSearcher(record_index=self.index)
+        with mock.patch.object(fresh.session, "get") as session_get:
+            self.assertEqual(fresh.get_paper("gs_2960712678066186980"), papers[0])
+        session_get.assert_not_called()
+
+    def test_records_of_a_page_are_written_together(self):
+        """Each result page is stored in the record index with one batched write"""
+        searcher = GoogleScholarSearcher(
+            html_backend="fast",
+            rate_limiter=TokenBucket(rate=1000, capacity=10),
+            record_index=self.index,
+        )
+        with (
+            mock.patch.object(
+                self.index, "set_many", wraps=self.index.set_many
+            ) as set_many,
+            mock.patch.object(self.index, "set") as set_one,
+        ):
+            papers = self._search(searcher)
+
+        set_many.assert_called_once()
+        set_one.assert_not_called()
+        self.assertEqual(len(self.index), len(papers))
+
+    def test_memory_index_is_bounded(self):
+        """Only the most recently seen records stay in memory"""
+        searcher = GoogleScholarSearcher(
+            rate_limiter=TokenBucket(rate=1000, capacity=10), record_memory_size=2
+        )
+        papers = self._search(searcher)
+        self.assertIsNone(searcher.get_paper(papers[0].paper_id))
+        self.assertEqual(searcher.get_paper(papers[2].paper_id), papers[2])
+
+
+class TestGoogleScholarCitationCrawl(unittest.TestCase):
+    """Cited-by expansion follows cites links and caches citation edges"""
+
+    # cited cluster -> citing papers
+    GRAPH: ClassVar[dict[str, list[tuple[str, str | None]]]] = {
+        "1": [("B", "2"), ("C", "3")],
+        "2": [("C", "3"), ("D", None)],
+        "3": [("E", "5")],
+        "5": [],
+    }
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = PersistentCache(
+            os.path.join(self.tmpdir.name, "cache.sqlite3"), namespace="citations"
+        )
+        self.requests = []
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def _searcher(self, cache=None):
+        return GoogleScholarSearcher(
+            html_backend="fast",
+            rate_limiter=TokenBucket(rate=1000, capacity=10),
+            citation_cache=cache,
+        )
+
+    def _get(self, url, params=None, **kwargs):
+        self.requests.append(params["cites"])
+        self.assertNotIn("q", params)
+        entries = self.GRAPH[params["cites"]][params["start"] :]
+        return mock.Mock(status_code=200, text=make_result_page(entries))
+
+    def test_citing_papers_listing(self):
+        """The cites listing of a cluster is parsed into papers"""
+        searcher = self._searcher()
+        with mock.patch.object(searcher.session, "get", side_effect=self._get):
+            papers = searcher.get_citing_papers("gs_1")
+            self.assertEqual(searcher.get_citing_papers("gs_0123abcd"), [])
+
+        self.assertEqual([p.title for p in papers], ["B", "C"])
+        self.assertEqual([p.paper_id for p in papers], ["gs_2", "gs_3"])
+        self.assertEqual(self.requests, ["1"])
+
+    def test_expand_to_depth(self):
+        """The crawl follows cited-by links level by level without revisiting"""
+        searcher = self._searcher()
+        with mock.patch.object(searcher.session, "get", side_effect=self._get):
+            graph = searcher.expand_citations(["gs_1"], depth=2)
+
+        ids = {p.title: p.paper_id for p in graph["papers"].values()}
+        self.assertEqual(graph["seeds"], ["gs_1"])
+        self.assertEqual(sorted(ids), ["B", "C", "D", "E"])
+        self.assertEqual(
+            graph["edges"],
+            [
+                ("gs_2", "gs_1"),
+                ("gs_3", "gs_1"),
+                ("gs_3", "gs_2"),
+                (ids["D"], "gs_2"),
+                ("gs_5", "gs_3"),
+            ],
+        )
+        self.assertEqual(self.requests, ["1", "2", "3"])
+        self.assertFalse(graph["truncated"])
+
+    def test_fan_out_and_max_papers_bound_the_crawl(self):
+        """fan_out limits each listing and max_papers stops the expansion"""
+        searcher = self._searcher()
+        with mock.patch.object(searcher.session, "get", side_effect=self._get):
+            graph = searcher.expand_citations(["1"], depth=3, fan_out=1)
+        self.assertEqual([p.title for p in graph["papers"].values()], ["B", "C", "E"])
+
+        self.requests.clear()
+        with mock.patch.object(searcher.session, "get", side_effect=self._get):
+            graph = searcher.expand_citations(["1"], depth=3, max_papers=2)
+        self.assertTrue(graph["truncated"])
+        self.assertEqual(self.requests, ["1"])
+
+        with mock.patch.object(searcher.session, "get", side_effect=self._get):
+            graph = searcher.expand_citations(["1"], depth=3, max_papers=1)
+        self.assertTrue(graph["truncated"])
+        self.assertEqual([p.title for p in graph["papers"].values()], ["B"])
+        self.assertEqual(graph["edges"], [("gs_2", "gs_1")])
+
+    def test_overlapping_expansions_reuse_cached_edges(self):
+        """A second crawl over the same neighborhood makes only new requests"""
+        searcher = self._searcher(self.cache)
+        with mock.patch.object(searcher.session, "get", side_effect=self._get):
+            first = searcher.expand_citations(["gs_2"], depth=2)
+
+        other = self._searcher(self.cache)
+        self.requests.clear()
+        with mock.patch.object(other.session, "get", side_effect=self._get):
+            second = other.expand_citations(["gs_1"], depth=3)
+
+        self.assertEqual(self.requests, ["1", "5"])
+        self.assertTrue(set(first["edges"]) <= set(second["edges"]))
+        self.assertEqual(len(second["papers"]), 4)
+
+
+class StubScholarServer(StubHTTPServer):
+    """Local stand-in for Scholar that answers every page after a delay"""
+
+    path = "/scholar"
+
+    def __init__(self, html, delay):
+        self.body = html.encode()
+        self.delay = delay
+        super().__init__()
+
+    def handle(self, request):
+        time.sleep(self.delay)
+        request.reply(200, self.body, "text/html; charset=utf-8")
+
+
+class TestGoogleScholarAsync(unittest.TestCase):
+    """asearch() fetches pages without blocking the event loop"""
+
+    DELAY = 0.3
+
+    def setUp(self):
+        self.html = load_fixture("scholar_search.html")
+        self.server = StubScholarServer(self.html, self.DELAY)
+        self.addCleanup(self.server.close)
+
+    def _searcher(self, **kwargs):
+        searcher = GoogleScholarSearcher(
+            html_backend="fast",
+            rate_limiter=TokenBucket(rate=1000, capacity=10),
+            **kwargs,
+        )
+        searcher.SCHOLAR_URL = self.server.url
+        return searcher
+
+    def test_matches_sync_search(self):
+        """Async and sync searches return the same papers"""
+        searcher = self._searcher()
+
+        async def run():
+            try:
+                return await searcher.asearch("attention", max_results=3)
+            finally:
+                await searcher.aclose()
+
+        self.assertEqual(
+            asyncio.run(run()), searcher.search("attention", max_results=3)
+        )
+
+    def test_concurrent_searches_overlap(self):
+        """N concurrent searches finish in about the time of one"""
+        searcher = self._searcher()
+
+        async def run(count):
+            try:
+                return await asyncio.gather(
+                    *(
+                        searcher.asearch(f"query {i}", max_results=3)
+                        for i in range(count)
+                    )
+                )
+            finally:
+                await searcher.aclose()
+
+        start = time.monotonic()
+        results = asyncio.run(run(5))
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([len(papers) for papers in results], [3] * 5)
+        self.assertLess(elapsed, 2 * self.DELAY)
+
+    def test_results_are_cached(self):
+        """asearch() shares the result cache with search()"""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        cache = PersistentCache(
+            os.path.join(tmpdir.name, "cache.sqlite3"), namespace="scholar"
+        )
+        self.addCleanup(cache.close)
+        searcher = self._searcher(cache=cache)
+
+        async def run():
+            try:
+                return await searcher.asearch("attention", max_results=3)
+            finally:
+                await searcher.aclose()
+
+        papers = asyncio.run(run())
+        with mock.patch.object(searcher.session, "get") as get:
+            self.assertEqual(searcher.search("attention", max_results=2), papers[:2])
+        get.assert_not_called()
+
+    def test_cache_is_accessed_off_the_loop(self):
+        """Result cache lookups and writes run in worker threads"""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        cache = PersistentCache(
+            os.path.join(tmpdir.name, "cache.sqlite3"), namespace="scholar"
+        )
+        self.addCleanup(cache.close)
+        searcher = self._searcher(cache=cache)
+        threads = []
+
+        def record(method):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return method(*args, **kwargs)
+
+            return wrapper
+
+        searcher._cached = record(searcher._cached)
+        searcher._store = record(searcher._store)
+        asyncio.run(searcher.asearch("attention", max_results=3))
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_client_closed_with_its_loop(self):
+        """The client of a finished event loop is closed, not leaked"""
+        searcher = self._searcher()
+        asyncio.run(searcher.asearch("attention", max_results=1))
+        first = searcher._async_client
+        asyncio.run(searcher.asearch("attention", max_results=1))
+
+        self.assertTrue(first.is_closed)
+        self.assertIsNot(searcher._async_client, first)
+        self.assertTrue(searcher._async_client.is_closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
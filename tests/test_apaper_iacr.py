@@ -2,29 +2,51 @@
 """
 Unit tests for APaper IACR functionality
 """
-import unittest
-import sys
+
+import hashlib
 import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-# Add the src directory to the path so we can import our modules  
+# Add the src directory and the repository root to the path so we can import
+# our modules and the shared test helpers
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from apaper.platforms.iacr import IACRSearcher
+import apaper.utils.html as html_utils
 from apaper.models.paper import Paper
+from apaper.platforms.iacr import IACRSearcher
+from apaper.utils.cache import PersistentCache
+from apaper.utils.pdf_store import PDFStore
+from tests.stub_http import StubHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(name):
+    """Read an HTML fixture from tests/fixtures"""
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
 
 
 class TestAPaperIACRSearcher(unittest.TestCase):
-    
     def setUp(self):
         """Set up test fixtures"""
         self.searcher = IACRSearcher()
-    
+
     def test_search_basic(self):
         """Test basic search functionality"""
-        papers = self.searcher.search("cryptography", max_results=3, fetch_details=False)
+        papers = self.searcher.search(
+            "cryptography", max_results=3, fetch_details=False
+        )
         self.assertIsInstance(papers, list)
         self.assertLessEqual(len(papers), 3)
-        
+
         if papers:
             paper = papers[0]
             self.assertIsInstance(paper, Paper)
@@ -32,21 +54,23 @@ class TestAPaperIACRSearcher(unittest.TestCase):
             self.assertIsNotNone(paper.paper_id)
             self.assertIsInstance(paper.authors, list)
             self.assertEqual(paper.source, "iacr")
-    
+
     def test_search_empty_query(self):
         """Test search with empty query"""
         papers = self.searcher.search("", max_results=2, fetch_details=False)
         self.assertIsInstance(papers, list)
-    
+
     def test_search_max_results(self):
         """Test search respects max_results parameter"""
-        papers = self.searcher.search("zero knowledge", max_results=2, fetch_details=False)
+        papers = self.searcher.search(
+            "zero knowledge", max_results=2, fetch_details=False
+        )
         self.assertLessEqual(len(papers), 2)
-    
+
     def test_paper_model(self):
         """Test Paper model functionality"""
         from datetime import datetime
-        
+
         paper = Paper(
             paper_id="test/123",
             title="Test Paper",
@@ -56,14 +80,14 @@ class TestAPaperIACRSearcher(unittest.TestCase):
             published_date=datetime.now(),
             pdf_url="https://example.com/test.pdf",
             url="https://example.com/paper",
-            source="iacr"
+            source="iacr",
         )
-        
+
         self.assertEqual(paper.paper_id, "test/123")
         self.assertEqual(paper.title, "Test Paper")
         self.assertEqual(len(paper.authors), 2)
         self.assertEqual(paper.source, "iacr")
-        
+
         # Test to_dict method
         paper_dict = paper.to_dict()
         self.assertIsInstance(paper_dict, dict)
@@ -71,5 +95,498 @@ class TestAPaperIACRSearcher(unittest.TestCase):
         self.assertEqual(paper_dict["title"], "Test Paper")
 
 
+class TestAPaperIACRConcurrentDetails(unittest.TestCase):
+    """Detail pages are fetched in parallel against a mocked session"""
+
+    def setUp(self):
+        self.searcher = IACRSearcher(max_workers=4)
+        self.search_html = load_fixture("iacr_search.html")
+        self.detail_html = load_fixture("iacr_detail.html")
+
+    def _fake_get(self, delay=0.0, failing=()):
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def get(url, params=None, **kwargs):
+            if url == IACRSearcher.IACR_SEARCH_URL:
+                return mock.Mock(status_code=200, text=self.search_html)
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(delay)
+            with lock:
+                active["now"] -= 1
+            paper_id = url.replace(IACRSearcher.IACR_BASE_URL + "/", "")
+            if paper_id in failing:
+                return mock.Mock(status_code=500, text="")
+            html = self.detail_html.replace("Paper 2025/1014", f"Paper {paper_id}")
+            html = html.replace(
+                "Threshold Secret Sharing with Short Shares", f"Details of {paper_id}"
+            )
+            return mock.Mock(status_code=200, text=html)
+
+        return get, active
+
+    def test_details_keep_result_order(self):
+        """Detailed papers come back in search result order"""
+        get, _ = self._fake_get(delay=0.05)
+        with mock.patch.object(self.searcher.session, "get", side_effect=get):
+            papers = self.searcher.search("secret sharing", max_results=3)
+
+        self.assertEqual(
+            [p.paper_id for p in papers], ["2025/1014", "2024/0777", "2023/0042"]
+        )
+        self.assertEqual(papers[1].title, "Details of 2024/0777")
+        self.assertEqual(papers[2].keywords, ["secret sharing", "threshold"])
+
+    def test_details_fetched_concurrently(self):
+        """Latency is close to a single detail request, not the sum"""
+        get, active = self._fake_get(delay=0.3)
+        with mock.patch.object(self.searcher.session, "get", side_effect=get):
+            start = time.monotonic()
+            papers = self.searcher.search("secret sharing", max_results=3)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(len(papers), 3)
+        self.assertEqual(active["peak"], 3)
+        self.assertLess(elapsed, 0.8)
+
+    def test_failed_detail_falls_back_to_search_row(self):
+        """A failing detail page falls back to the search result entry"""
+        get, _ = self._fake_get(failing=("2024/0777",))
+        with mock.patch.object(self.searcher.session, "get", side_effect=get):
+            papers = self.searcher.search("secret sharing", max_results=3)
+
+        self.assertEqual(
+            [p.paper_id for p in papers], ["2025/1014", "2024/0777", "2023/0042"]
+        )
+        self.assertEqual(papers[0].title, "Details of 2025/1014")
+        self.assertEqual(papers[1].title, "Verifiable Secret Sharing Revisited")
+        self.assertEqual(papers[1].categories, ["Foundations"])
+
+    def test_single_worker_is_sequential(self):
+        """max_workers=1 keeps the sequential behaviour"""
+        searcher = IACRSearcher(max_workers=1)
+        get, active = self._fake_get(delay=0.01)
+        with mock.patch.object(searcher.session, "get", side_effect=get):
+            papers = searcher.search("secret sharing", max_results=2)
+
+        self.assertEqual([p.paper_id for p in papers], ["2025/1014", "2024/0777"])
+        self.assertEqual(active["peak"], 1)
+
+    def test_iter_search_stops_with_consumer(self):
+        """Closing iter_search early leaves later detail pages unfetched"""
+        searcher = IACRSearcher(max_workers=1)
+        get, _ = self._fake_get()
+        with mock.patch.object(searcher.session, "get", side_effect=get) as session_get:
+            results = searcher.iter_search("secret sharing")
+            first = next(results)
+            results.close()
+
+        self.assertEqual(first.paper_id, "2025/1014")
+        detail_urls = [
+            c.args[0]
+            for c in session_get.call_args_list
+            if c.args[0] != IACRSearcher.IACR_SEARCH_URL
+        ]
+        self.assertLess(len(detail_urls), 3)
+
+
+class TestAPaperIACRDetailCache(unittest.TestCase):
+    """Paper details are served from and revalidated against the cache"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = PersistentCache(
+            os.path.join(self.tmpdir.name, "cache.sqlite3"), namespace="iacr"
+        )
+        self.searcher = IACRSearcher(cache=self.cache)
+        self.detail_html = load_fixture("iacr_detail.html")
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def _response(self, status_code=200, text="", headers=None):
+        return mock.Mock(status_code=status_code, text=text, headers=headers or {})
+
+    def test_fresh_entry_skips_network(self):
+        """A fresh cached paper is returned without an HTTP request"""
+        first = self._response(text=self.detail_html, headers={"ETag": '"abc"'})
+        with mock.patch.object(self.searcher.session, "get", return_value=first):
+            paper = self.searcher.get_paper_details("2025/1014")
+
+        with mock.patch.object(self.searcher.session, "get") as get:
+            cached = self.searcher.get_paper_details("2025/1014")
+            get.assert_not_called()
+
+        self.assertEqual(cached, paper)
+        self.assertEqual(cached.keywords, ["secret sharing", "threshold"])
+
+    def test_stale_entry_is_revalidated(self):
+        """A stale entry sends validators and is reused on 304"""
+        self.cache.ttl = 0
+        first = self._response(
+            text=self.detail_html,
+            headers={"ETag": '"abc"', "Last-Modified": "Mon, 02 Jun 2025 00:00:00 GMT"},
+        )
+        with mock.patch.object(self.searcher.session, "get", return_value=first):
+            paper = self.searcher.get_paper_details("2025/1014")
+
+        with mock.patch.object(
+            self.searcher.session, "get", return_value=self._response(304)
+        ) as get:
+            revalidated = self.searcher.get_paper_details("2025/1014")
+
+        headers = get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"abc"')
+        self.assertEqual(headers["If-Modified-Since"], "Mon, 02 Jun 2025 00:00:00 GMT")
+        self.assertEqual(revalidated, paper)
+
+    def test_changed_page_replaces_entry(self):
+        """A 200 response to revalidation replaces the cached paper"""
+        self.cache.ttl = 0
+        first = self._response(text=self.detail_html, headers={"ETag": '"v1"'})
+        with mock.patch.object(self.searcher.session, "get", return_value=first):
+            self.searcher.get_paper_details("2025/1014")
+
+        changed = self._response(
+            text=self.detail_html.replace("Short Shares", "Shorter Shares"),
+            headers={"ETag": '"v2"'},
+        )
+        with mock.patch.object(self.searcher.session, "get", return_value=changed):
+            paper = self.searcher.get_paper_details("2025/1014")
+
+        self.assertEqual(paper.title, "Threshold Secret Sharing with Shorter Shares")
+        self.assertEqual(self.cache.get("2025/1014").etag, '"v2"')
+
+
+class TestAPaperIACRParsingBackends(unittest.TestCase):
+    """The fast HTML backend returns the same papers as the full one"""
+
+    PARSERS = (
+        ("html.parser", "lxml")
+        if html_utils.FAST_PARSER == "lxml"
+        else ("html.parser",)
+    )
+
+    def setUp(self):
+        self.full = IACRSearcher(html_backend="full")
+        self.fast = IACRSearcher(html_backend="fast")
+
+    def test_unknown_backend(self):
+        """Unknown backends are rejected"""
+        with self.assertRaises(ValueError):
+            IACRSearcher(html_backend="regex")
+
+    def test_search_page_parity(self):
+        """Search rows parse identically with both backends"""
+        html = load_fixture("iacr_search.html")
+        expected = list(self.full._iter_search_results(html))
+        self.assertEqual(len(expected), 3)
+        for parser in self.PARSERS:
+            with (
+                self.subTest(parser=parser),
+                mock.patch.object(html_utils, "FAST_PARSER", parser),
+            ):
+                self.assertEqual(list(self.fast._iter_search_results(html)), expected)
+
+    def test_detail_page_parity(self):
+        """Paper pages parse identically with both backends"""
+        html = load_fixture("iacr_detail.html")
+        expected = self.full._parse_paper_details(html, "2025/1014", "url")
+        self.assertEqual(expected.extra["publication_info"], "Preprint.")
+        for parser in self.PARSERS:
+            with (
+                self.subTest(parser=parser),
+                mock.patch.object(html_utils, "FAST_PARSER", parser),
+            ):
+                self.assertEqual(
+                    self.fast._parse_paper_details(html, "2025/1014", "url"),
+                    expected,
+                )
+
+    def test_fast_search_end_to_end(self):
+        """search() works unchanged with the fast backend"""
+        response = mock.Mock(status_code=200, text=load_fixture("iacr_search.html"))
+        with mock.patch.object(self.fast.session, "get", return_value=response):
+            papers = self.fast.search(
+                "secret sharing", max_results=2, fetch_details=False
+            )
+        self.assertEqual([p.paper_id for p in papers], ["2025/1014", "2024/0777"])
+
+
+class StubPDFServer(StubHTTPServer):
+    """Local PDF server supporting Range requests and dropped connections"""
+
+    def __init__(self, body):
+        self.body = body
+        self.cut_after = None  # bytes sent before dropping the connection
+        self.delay = 0.0
+        self.missing = set()
+        self.range_headers = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        super().__init__()
+
+    def handle(self, request):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            self._serve(request)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def _serve(self, request):
+        if request.path in self.missing:
+            request.reply(404)
+            return
+        range_header = request.headers.get("Range")
+        self.range_headers.append(range_header)
+        start = 0
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(self.body):
+                request.reply(416)
+                return
+            request.send_response(206)
+            request.send_header(
+                "Content-Range",
+                f"bytes {start}-{len(self.body) - 1}/{len(self.body)}",
+            )
+        else:
+            request.send_response(200)
+        payload = self.body[start:]
+        request.send_header("Content-Type", "application/pdf")
+        request.send_header("Content-Length", str(len(payload)))
+        request.end_headers()
+        if self.cut_after is not None:
+            request.wfile.write(payload[: self.cut_after])
+            request.wfile.flush()
+            request.close_connection = True
+            return
+        request.wfile.write(payload)
+
+
+class TestAPaperIACRDownload(unittest.TestCase):
+    """PDFs are streamed to a partial file, resumed and verified"""
+
+    def setUp(self):
+        self.body = b"%PDF-1.7\n" + os.urandom(300 * 1024) + b"\n%%EOF"
+        self.pdf_server = StubPDFServer(self.body)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.searcher = IACRSearcher()
+        self.searcher.IACR_BASE_URL = self.pdf_server.url
+        self.target = os.path.join(self.tmpdir.name, "iacr_2025_1014.pdf")
+
+    def tearDown(self):
+        self.pdf_server.close()
+        self.tmpdir.cleanup()
+
+    def test_streams_to_final_file(self):
+        """A complete download is renamed into place"""
+        result = self.searcher.download_pdf(
+            "2025/1014",
+            self.tmpdir.name,
+            expected_size=len(self.body),
+            sha256=hashlib.sha256(self.body).hexdigest(),
+        )
+        self.assertEqual(result, self.target)
+        with open(result, "rb") as f:
+            self.assertEqual(f.read(), self.body)
+        self.assertFalse(os.path.exists(self.target + ".part"))
+
+    def test_interrupted_download_resumes_with_range(self):
+        """An interrupted download keeps its partial file and is resumed"""
+        self.pdf_server.cut_after = 100 * 1024
+        result = self.searcher.download_pdf("2025/1014", self.tmpdir.name)
+        self.assertTrue(result.startswith("Error"))
+        self.assertFalse(os.path.exists(self.target))
+        partial_size = os.path.getsize(self.target + ".part")
+        self.assertGreater(partial_size, 0)
+        self.assertLessEqual(partial_size, 100 * 1024)
+
+        self.pdf_server.cut_after = None
+        result = self.searcher.download_pdf(
+            "2025/1014",
+            self.tmpdir.name,
+            sha256=hashlib.sha256(self.body).hexdigest(),
+        )
+        self.assertEqual(result, self.target)
+        self.assertEqual(self.pdf_server.range_headers[-1], f"bytes={partial_size}-")
+        with open(result, "rb") as f:
+            self.assertEqual(f.read(), self.body)
+
+    def test_checksum_mismatch_discards_file(self):
+        """A checksum mismatch leaves neither a final nor a partial file"""
+        result = self.searcher.download_pdf(
+            "2025/1014", self.tmpdir.name, sha256="0" * 64
+        )
+        self.assertTrue(result.startswith("Error"))
+        self.assertFalse(os.path.exists(self.target))
+        self.assertFalse(os.path.exists(self.target + ".part"))
+
+    def test_unsatisfiable_range_restarts(self):
+        """A partial file longer than the remote file is downloaded again"""
+        with open(self.target + ".part", "wb") as f:
+            f.write(b"x" * (len(self.body) + 10))
+        result = self.searcher.download_pdf("2025/1014", self.tmpdir.name)
+        self.assertEqual(result, self.target)
+        with open(result, "rb") as f:
+            self.assertEqual(f.read(), self.body)
+
+    def test_restart_releases_host_slot(self):
+        """A 416 restart does not wait for the slot it is still holding"""
+        with open(self.target + ".part", "wb") as f:
+            f.write(b"x" * (len(self.body) + 10))
+        searcher = IACRSearcher(max_per_host=1)
+        searcher.IACR_BASE_URL = self.pdf_server.url
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                searcher.download_pdf("2025/1014", self.tmpdir.name)
+            ),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [self.target])
+
+    def test_hanging_server_times_out(self):
+        """Requests to an unresponsive server fail instead of hanging"""
+        self.pdf_server.delay = 5.0
+        with mock.patch.object(IACRSearcher, "REQUEST_TIMEOUT", 0.2):
+            searcher = IACRSearcher()
+        searcher.IACR_SEARCH_URL = f"{self.pdf_server.url}/search"
+        start = time.monotonic()
+        self.assertEqual(searcher.search("lattice", fetch_details=False), [])
+        self.assertLess(time.monotonic() - start, 4.0)
+
+
+class TestAPaperIACRBatchDownload(unittest.TestCase):
+    """Several PDFs are downloaded concurrently under a per-host cap"""
+
+    def setUp(self):
+        self.body = b"%PDF-1.7\n" + os.urandom(1024) + b"\n%%EOF"
+        self.pdf_server = StubPDFServer(self.body)
+        self.pdf_server.delay = 0.2
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.searcher = IACRSearcher(max_per_host=3)
+        self.searcher.IACR_BASE_URL = self.pdf_server.url
+
+    def tearDown(self):
+        self.pdf_server.close()
+        self.tmpdir.cleanup()
+
+    def test_batch_reports_per_item_results(self):
+        """Results keep input order, skip duplicates and report failures"""
+        self.pdf_server.missing.add("/2024/0002.pdf")
+        ids = ["2024/0001", "2024/0002", "2024/0003", "2024/0001"]
+        results = self.searcher.download_pdfs(ids, self.tmpdir.name)
+
+        self.assertEqual(
+            [r["paper_id"] for r in results], ["2024/0001", "2024/0002", "2024/0003"]
+        )
+        self.assertEqual([r["success"] for r in results], [True, False, True])
+        self.assertIn("HTTP 404", results[1]["error"])
+        with open(results[2]["path"], "rb") as f:
+            self.assertEqual(f.read(), self.body)
+
+    def test_concurrency_is_capped_per_host(self):
+        """Downloads overlap, but never exceed max_per_host"""
+        ids = [f"2024/{i:04d}" for i in range(9)]
+        start = time.monotonic()
+        results = self.searcher.download_pdfs(ids, self.tmpdir.name)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(self.pdf_server.peak, 3)
+        self.assertLess(elapsed, 9 * 0.2)
+
+    def test_download_locks_are_released(self):
+        """Per-paper locks are dropped once their downloads finish"""
+        ids = ["2024/0001", "2024/0002", "2024/0001", "2024/0001"]
+        with ThreadPoolExecutor(max_workers=len(ids)) as executor:
+            paths = list(
+                executor.map(
+                    lambda paper_id: self.searcher.download_pdf(
+                        paper_id, self.tmpdir.name
+                    ),
+                    ids,
+                )
+            )
+
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+        self.assertEqual(self.searcher._download_locks, {})
+
+
+class TestAPaperIACRPDFStore(unittest.TestCase):
+    """Stored PDFs are linked into place instead of downloaded again"""
+
+    def setUp(self):
+        self.body = b"%PDF-1.7\n" + os.urandom(4096) + b"\n%%EOF"
+        self.pdf_server = StubPDFServer(self.body)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = PDFStore(os.path.join(self.tmpdir.name, "store"))
+        self.searcher = IACRSearcher(pdf_store=self.store)
+        self.searcher.IACR_BASE_URL = self.pdf_server.url
+
+    def tearDown(self):
+        self.store.index.close()
+        self.pdf_server.close()
+        self.tmpdir.cleanup()
+
+    def _save_path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_repeat_download_skips_network(self):
+        """A second save path gets a hard link to the stored blob"""
+        first = self.searcher.download_pdf("2025/1014", self._save_path("a"))
+        second = self.searcher.download_pdf("2025/1014", self._save_path("b"))
+
+        self.assertEqual(len(self.pdf_server.range_headers), 1)
+        self.assertTrue(os.path.samefile(first, second))
+        with open(second, "rb") as f:
+            self.assertEqual(f.read(), self.body)
+
+        # The same save path again is a no-op
+        self.assertEqual(
+            self.searcher.download_pdf("2025/1014", self._save_path("a")), first
+        )
+        self.assertEqual(len(self.pdf_server.range_headers), 1)
+
+    def test_identical_content_is_stored_once(self):
+        """Different IDs with identical bytes share one blob"""
+        self.searcher.download_pdf("2025/0001", self._save_path("a"))
+        self.searcher.download_pdf("2025/0002", self._save_path("a"))
+        blobs = [
+            name
+            for _, _, files in os.walk(os.path.join(self.store.root, "blobs"))
+            for name in files
+        ]
+        self.assertEqual(len(blobs), 1)
+
+    def test_stale_entry_is_downloaded_again(self):
+        """Entries older than the TTL are refreshed from the network"""
+        self.store.index.ttl = 0
+        self.searcher.download_pdf("2025/1014", self._save_path("a"))
+        self.searcher.download_pdf("2025/1014", self._save_path("b"))
+        self.assertEqual(len(self.pdf_server.range_headers), 2)
+
+    def test_copy_fallback_when_links_fail(self):
+        """Cross-device stores fall back to copying the blob"""
+        self.searcher.download_pdf("2025/1014", self._save_path("a"))
+        with mock.patch("os.link", side_effect=OSError("cross-device link")):
+            second = self.searcher.download_pdf("2025/1014", self._save_path("b"))
+        with open(second, "rb") as f:
+            self.assertEqual(f.read(), self.body)
+        self.assertEqual(len(self.pdf_server.range_headers), 1)
+
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
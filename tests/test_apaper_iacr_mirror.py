@@ -0,0 +1,304 @@
+# tests/test_apaper_iacr_mirror.py
+"""
+Unit tests for the offline IACR ePrint mirror, harvested from a local OAI feed
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+# Add the src directory and the repository root to the path so we can import
+# our modules and the shared test helpers
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from apaper.platforms.iacr import IACRSearcher
+from apaper.platforms.iacr_mirror import IACRMirror
+from tests.stub_http import StubHTTPServer
+
+OAI_HEAD = """<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+  <responseDate>2025-06-03T00:00:00Z</responseDate>
+"""
+
+
+def oai_record(paper_id, datestamp, title, creators, description, subjects, dates):
+    """Render one Dublin Core record"""
+    dc = "".join(f"<dc:creator>{c}</dc:creator>" for c in creators)
+    dc += "".join(f"<dc:subject>{s}</dc:subject>" for s in subjects)
+    dc += "".join(f"<dc:date>{d}</dc:date>" for d in dates)
+    return f"""
+    <record>
+      <header>
+        <identifier>oai:eprint.iacr.org:{paper_id}</identifier>
+        <datestamp>{datestamp}</datestamp>
+      </header>
+      <metadata>
+        <oai_dc:dc xmlns:oai_dc="http://www.openarchives.org/OAI/2.0/oai_dc/"
+                   xmlns:dc="http://purl.org/dc/elements/1.1/">
+          <dc:title>{title}</dc:title>
+          {dc}
+          <dc:description>{description}</dc:description>
+        </oai_dc:dc>
+      </metadata>
+    </record>"""
+
+
+def list_records(records, token=None):
+    """Render a ListRecords page"""
+    resumption = f"<resumptionToken>{token}</resumptionToken>" if token else ""
+    return (
+        f"{OAI_HEAD}<ListRecords>{''.join(records)}{resumption}</ListRecords></OAI-PMH>"
+    )
+
+
+FIRST_PAGE = list_records(
+    [
+        oai_record(
+            "2023/0042",
+            "2023-01-12",
+            "Packed Secret Sharing for MPC",
+            ["Dave Example", "Erin Example"],
+            "Packed secret sharing makes MPC cheaper.",
+            ["secret sharing", "MPC"],
+            ["2023-01-10", "2023-01-12"],
+        ),
+        oai_record(
+            "2024/0777",
+            "2024-05-17",
+            "Verifiable Secret Sharing Revisited",
+            ["Carol Example"],
+            "We revisit verifiable secret sharing.",
+            ["VSS"],
+            ["2024-05-17"],
+        ),
+    ],
+    token="page2",
+)
+SECOND_PAGE = list_records(
+    [
+        oai_record(
+            "2025/1014",
+            "2025-06-02",
+            "Threshold Signatures from Lattices",
+            ["Alice Example"],
+            "Lattice-based threshold signatures.",
+            ["lattices"],
+            ["2025-05-30", "2025-06-02"],
+        ),
+    ]
+)
+INCREMENTAL_PAGE = list_records(
+    [
+        oai_record(
+            "2024/0777",
+            "2025-07-01",
+            "Verifiable Secret Sharing Revisited Again",
+            ["Carol Example"],
+            "We revisit verifiable secret sharing once more.",
+            ["VSS"],
+            ["2024-05-17", "2025-07-01"],
+        ),
+    ]
+)
+NO_RECORDS = (
+    f'{OAI_HEAD}<error code="noRecordsMatch">No matching records</error></OAI-PMH>'
+)
+
+
+class StubOAIFeed(StubHTTPServer):
+    """Local stand-in for the ePrint OAI-PMH endpoint"""
+
+    path = "/oai"
+
+    def __init__(self):
+        self.requests = []
+        self.incremental = INCREMENTAL_PAGE
+        self.second_page = SECOND_PAGE
+        self.fail_second_page = False
+        super().__init__()
+
+    def handle(self, request):
+        params = {k: v[0] for k, v in parse_qs(urlparse(request.path).query).items()}
+        self.requests.append(params)
+        if params.get("resumptionToken") == "page2":
+            if self.fail_second_page:
+                request.reply(500)
+                return
+            body = self.second_page
+        elif "from" in params:
+            body = self.incremental
+        else:
+            body = FIRST_PAGE
+        request.reply(200, body.encode("utf-8"), "text/xml")
+
+
+class TestIACRMirror(unittest.TestCase):
+    def setUp(self):
+        self.feed = StubOAIFeed()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.mirror = IACRMirror(
+            os.path.join(self.tmpdir.name, "mirror.sqlite3"), oai_url=self.feed.url
+        )
+
+    def tearDown(self):
+        self.mirror.close()
+        self.feed.close()
+        self.tmpdir.cleanup()
+
+    def test_full_harvest_follows_resumption_tokens(self):
+        """A full sync harvests every page of the feed"""
+        self.assertFalse(self.mirror.is_populated())
+        self.assertEqual(self.mirror.sync(), 3)
+        self.assertEqual(len(self.mirror), 3)
+        self.assertEqual(self.mirror.last_datestamp, "2025-06-02")
+        self.assertEqual(
+            self.feed.requests[1], {"verb": "ListRecords", "resumptionToken": "page2"}
+        )
+
+    def test_search_ranks_and_builds_papers(self):
+        """Full-text search returns complete Paper records"""
+        self.mirror.sync()
+        papers = self.mirror.search("secret sharing")
+        self.assertEqual({p.paper_id for p in papers}, {"2023/0042", "2024/0777"})
+
+        paper = self.mirror.search("packed MPC")[0]
+        self.assertEqual(paper.paper_id, "2023/0042")
+        self.assertEqual(paper.authors, ["Dave Example", "Erin Example"])
+        self.assertEqual(paper.keywords, ["secret sharing", "MPC"])
+        self.assertEqual(paper.pdf_url, "https://eprint.iacr.org/2023/0042.pdf")
+        self.assertEqual(paper.published_date.year, 2023)
+
+    def test_year_filters(self):
+        """year_min/year_max filter on the last revision date"""
+        self.mirror.sync()
+        self.assertEqual(
+            [p.paper_id for p in self.mirror.search("", year_min=2024)],
+            ["2025/1014", "2024/0777"],
+        )
+        self.assertEqual(
+            [p.paper_id for p in self.mirror.search("secret", year_max=2023)],
+            ["2023/0042"],
+        )
+
+    def test_incremental_sync(self):
+        """Later syncs request only changes since the last datestamp"""
+        self.mirror.sync()
+        self.assertEqual(self.mirror.sync(), 1)
+        self.assertEqual(self.feed.requests[-1]["from"], "2025-06-02")
+        self.assertEqual(len(self.mirror), 3)
+        self.assertEqual(
+            self.mirror.search("again")[0].title,
+            "Verifiable Secret Sharing Revisited Again",
+        )
+
+        self.feed.incremental = NO_RECORDS
+        self.assertEqual(self.mirror.sync(), 0)
+        self.assertEqual(self.mirror.last_datestamp, "2025-07-01")
+
+    def test_interrupted_harvest_keeps_previous_datestamp(self):
+        """A harvest that fails partway does not skip records of later pages"""
+        # The unharvested second page holds a record older than the first page
+        self.feed.second_page = list_records(
+            [
+                oai_record(
+                    "2022/0001",
+                    "2022-03-01",
+                    "Older Record",
+                    ["Frank Example"],
+                    "Harvested on the second page.",
+                    [],
+                    ["2022-03-01"],
+                ),
+            ]
+        )
+        self.feed.fail_second_page = True
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.mirror.sync()
+        self.assertEqual(len(self.mirror), 2)
+        self.assertIsNone(self.mirror.last_datestamp)
+
+        self.feed.fail_second_page = False
+        self.mirror.sync()
+        self.assertNotIn("from", self.feed.requests[-2])
+        self.assertEqual(len(self.mirror), 3)
+        self.assertEqual(self.mirror.search("older")[0].paper_id, "2022/0001")
+        self.assertEqual(self.mirror.last_datestamp, "2024-05-17")
+
+    def test_sync_records_completion_time(self):
+        """Every finished harvest, even one without changes, stamps the mirror"""
+        self.assertIsNone(self.mirror.last_synced)
+        self.mirror.sync()
+        synced = self.mirror.last_synced
+        self.assertLess(abs((datetime.now() - synced).total_seconds()), 60)
+
+        self.feed.incremental = NO_RECORDS
+        with mock.patch("apaper.platforms.iacr_mirror.datetime") as clock:
+            clock.now.return_value = datetime(2030, 1, 1)
+            self.mirror.sync()
+        self.assertEqual(self.mirror.last_synced, datetime(2030, 1, 1))
+
+    def test_searcher_uses_populated_mirror(self):
+        """IACRSearcher answers from the mirror without touching the network"""
+        self.mirror.sync()
+        searcher = IACRSearcher(mirror=self.mirror)
+        with mock.patch.object(searcher.session, "get") as get:
+            papers = searcher.search("lattices", max_results=5, fetch_details=False)
+            get.assert_not_called()
+        self.assertEqual([p.paper_id for p in papers], ["2025/1014"])
+
+    def test_searcher_fetches_details_for_mirror_hits(self):
+        """fetch_details=True completes mirror hits from their detail pages"""
+        self.mirror.sync()
+        searcher = IACRSearcher(mirror=self.mirror)
+        detailed = self.mirror.search("secret sharing")
+        for paper in detailed:
+            paper.extra = {"publication_info": "detail page"}
+        by_id = {paper.paper_id: paper for paper in detailed}
+        with mock.patch.object(
+            searcher, "get_paper_details", side_effect=by_id.get
+        ) as details:
+            papers = searcher.search("secret sharing")
+
+        self.assertCountEqual(
+            [call.args[0] for call in details.call_args_list], list(by_id)
+        )
+        self.assertEqual([p.paper_id for p in papers], [p.paper_id for p in detailed])
+        self.assertTrue(
+            all(p.extra == {"publication_info": "detail page"} for p in papers)
+        )
+
+    def test_searcher_bypasses_stale_mirror(self):
+        """A mirror not synced within mirror_max_age falls back to live search"""
+        self.mirror.sync()
+        searcher = IACRSearcher(mirror=self.mirror, mirror_max_age=3600)
+        response = httpx.Response(
+            200,
+            text="<html></html>",
+            request=httpx.Request("GET", IACRSearcher.IACR_SEARCH_URL),
+        )
+        with mock.patch.object(searcher.session, "get", return_value=response) as get:
+            self.assertEqual(len(searcher.search("lattices", fetch_details=False)), 1)
+            get.assert_not_called()
+
+            later = datetime.now() + timedelta(hours=2)
+            with mock.patch("apaper.platforms.iacr.datetime") as clock:
+                clock.now.return_value = later
+                self.assertEqual(searcher.search("lattices", fetch_details=False), [])
+            get.assert_called_once()
+
+        unbounded = IACRSearcher(mirror=self.mirror, mirror_max_age=None)
+        with mock.patch("apaper.platforms.iacr.datetime") as clock:
+            clock.now.return_value = later
+            papers = unbounded.search("lattices", fetch_details=False)
+        self.assertEqual([p.paper_id for p in papers], ["2025/1014"])
+
+
+if __name__ == "__main__":
+    unittest.main()
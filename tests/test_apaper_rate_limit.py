@@ -0,0 +1,129 @@
+# tests/test_apaper_rate_limit.py
+"""
+Unit tests for the token-bucket rate limiter
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from apaper.utils.rate_limit import TokenBucket
+
+
+def timed(func, *args, **kwargs):
+    """Run func and return its result and duration"""
+    start = time.monotonic()
+    result = func(*args, **kwargs)
+    return result, time.monotonic() - start
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Pacing, idle credit, backoff and recovery"""
+
+    def test_burst_then_steady_rate(self):
+        """Banked tokens go out at once, later requests are spaced by 1/rate"""
+        bucket = TokenBucket(rate=20, capacity=3)
+        _, burst = timed(lambda: [bucket.acquire() for _ in range(3)])
+        _, paced = timed(lambda: [bucket.acquire() for _ in range(3)])
+
+        self.assertLess(burst, 0.02)
+        self.assertGreater(paced, 0.12)
+        self.assertLess(paced, 0.3)
+
+    def test_idle_time_counts_toward_budget(self):
+        """A request after an idle period does not wait"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+        time.sleep(0.06)
+        _, elapsed = timed(bucket.acquire)
+        self.assertLess(elapsed, 0.02)
+
+    def test_penalize_backs_off_exponentially(self):
+        """Each throttle doubles the blocking delay and halves the rate"""
+        bucket = TokenBucket(rate=20, capacity=2, backoff=0.05, max_backoff=0.15)
+        self.assertAlmostEqual(bucket.penalize(), 0.05)
+        self.assertEqual(bucket.rate, 10)
+        self.assertAlmostEqual(bucket.penalize(), 0.1)
+        self.assertAlmostEqual(bucket.penalize(), 0.15)
+        self.assertAlmostEqual(bucket.penalize(retry_after=10), 0.15)
+        self.assertEqual(bucket.rate, 20 / 16)
+
+        ok, elapsed = timed(bucket.acquire, timeout=0.01)
+        self.assertFalse(ok)
+        self.assertLess(elapsed, 0.01)
+        self.assertGreater(bucket.delay(), 0.1)
+
+    def test_waits_out_backoff(self):
+        """acquire sleeps until the block expires"""
+        bucket = TokenBucket(rate=100, capacity=1, backoff=0.1)
+        bucket.penalize(retry_after=0.12)
+        ok, elapsed = timed(bucket.acquire)
+        self.assertTrue(ok)
+        self.assertGreater(elapsed, 0.11)
+
+    def test_rate_recovers_gradually(self):
+        """Successful requests restore the base rate step by step"""
+        bucket = TokenBucket(rate=8, backoff=0.0, recovery=2.0)
+        bucket.penalize()
+        bucket.penalize()
+        self.assertEqual(bucket.rate, 2)
+
+        bucket.reward()
+        self.assertEqual(bucket.rate, 4)
+        self.assertEqual(bucket.failures, 2)
+        bucket.reward()
+        self.assertEqual(bucket.rate, 8)
+        self.assertEqual(bucket.failures, 0)
+        bucket.reward()
+        self.assertEqual(bucket.rate, 8)
+
+    def test_concurrent_callers_share_budget(self):
+        """Threads queue up behind each other instead of bursting together"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        times = []
+        lock = threading.Lock()
+
+        def worker():
+            bucket.acquire()
+            with lock:
+                times.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertGreater(max(times) - start, 0.09)
+
+    def test_async_waits_do_not_block_loop(self):
+        """acquire_async paces callers while other tasks keep running"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            return await asyncio.gather(
+                *(bucket.acquire_async() for _ in range(3)), ticker()
+            )
+
+        results, elapsed = timed(asyncio.run, run())
+        self.assertEqual(results[:3], [True, True, True])
+        self.assertGreater(elapsed, 0.09)
+        self.assertLess(ticks[-1] - ticks[0], 0.09)
+        self.assertFalse(asyncio.run(bucket.acquire_async(timeout=0.0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,346 @@
+# tests/test_apaper_transport.py
+"""
+Unit tests for the shared HTTP transport
+"""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+from email.utils import formatdate
+
+import httpx
+
+# Add the src directory and the repository root to the path so we can import
+# our modules and the shared test helpers
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from apaper.utils.transport import (
+    HTTPCache,
+    RetryPolicy,
+    add_timing_hook,
+    create_async_client,
+    create_client,
+    remove_timing_hook,
+)
+from tests.stub_http import StubHTTPServer
+
+FAST_RETRY = RetryPolicy(backoff=0.01, max_backoff=0.05)
+
+
+class StubServer(StubHTTPServer):
+    """Local server answering each path with a list of scripted responses"""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        super().__init__()
+
+    def handle(self, request):
+        request.rfile.read(int(request.headers.get("Content-Length", 0)))
+        self.requests.append((request.command, request.path, dict(request.headers)))
+        script = self.routes[request.path]
+        status, headers, body, delay = script.pop(0) if len(script) > 1 else script[0]
+        if callable(status):
+            status, headers = status(request.headers)
+        time.sleep(delay)
+        request.reply(status, body, headers=headers)
+
+    def route(self, path, *responses):
+        """Answer path with responses in turn, repeating the last one"""
+        self.routes[path] = [
+            (status, headers, body, delay) for status, headers, body, delay in responses
+        ]
+
+    def count(self, path):
+        return sum(1 for _, p, _ in self.requests if p == path)
+
+
+def ok(body=b"payload", headers=None, delay=0.0):
+    return (200, headers or {}, body, delay)
+
+
+class TestTransportRetries(unittest.TestCase):
+    """Idempotent failures are retried with jittered backoff"""
+
+    def setUp(self):
+        self.stub = StubServer()
+        self.addCleanup(self.stub.close)
+        self.client = create_client(retry=FAST_RETRY, cache=False)
+        self.addCleanup(self.client.close)
+
+    def test_retries_5xx_until_success(self):
+        """502/503 responses are retried and the success is returned"""
+        self.stub.route("/a", (503, {}, b"", 0.0), (502, {}, b"", 0.0), ok())
+        response = self.client.get(f"{self.stub.url}/a")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.stub.count("/a"), 3)
+
+    def test_gives_up_after_retries(self):
+        """The last failed response is returned once retries are used up"""
+        self.stub.route("/a", (503, {}, b"busy", 0.0))
+        response = self.client.get(f"{self.stub.url}/a")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.stub.count("/a"), FAST_RETRY.retries + 1)
+
+    def test_non_idempotent_requests_not_retried(self):
+        """A POST answered with 503 is returned as is"""
+        self.stub.route("/a", (503, {}, b"", 0.0), ok())
+        response = self.client.post(f"{self.stub.url}/a", content=b"x")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.stub.count("/a"), 1)
+
+    def test_long_retry_after_not_waited(self):
+        """A Retry-After beyond max_backoff is passed to the caller"""
+        self.stub.route("/a", (503, {"Retry-After": "120"}, b"", 0.0), ok())
+        start = time.monotonic()
+        response = self.client.get(f"{self.stub.url}/a")
+        self.assertEqual(response.status_code, 503)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_connection_errors_retried(self):
+        """Connection failures are retried and finally raised"""
+        port = self.stub.server.server_port
+        self.stub.close()
+        timings = []
+        client = create_client(retry=FAST_RETRY, cache=False, hooks=[timings.append])
+        with self.assertRaises(httpx.ConnectError):
+            client.get(f"http://127.0.0.1:{port}/a")
+        self.assertEqual([t.attempt for t in timings], [1, 2, 3])
+        self.assertTrue(all(t.error and t.status is None for t in timings))
+
+    def test_backoff_is_jittered(self):
+        """Delays are random up to the exponential bound"""
+        policy = RetryPolicy(backoff=1.0, max_backoff=3.0)
+        delays = [policy.delay(3) for _ in range(50)]
+        self.assertTrue(all(0 <= d <= 3.0 for d in delays))
+        self.assertGreater(len(set(delays)), 1)
+        self.assertEqual(policy.delay(1, retry_after=2.5), 2.5)
+
+
+class TestTransportTimeouts(unittest.TestCase):
+    """Requests use their host's timeout unless they set their own"""
+
+    def setUp(self):
+        self.stub = StubServer()
+        self.addCleanup(self.stub.close)
+        self.stub.route("/slow", ok(delay=0.3))
+
+    def test_host_timeout(self):
+        """The host timeout overrides the client default"""
+        client = create_client(
+            timeout=5.0,
+            host_timeouts={"127.0.0.1": 0.1},
+            retry=RetryPolicy(retries=0),
+            cache=False,
+        )
+        self.addCleanup(client.close)
+        start = time.monotonic()
+        with self.assertRaises(httpx.ReadTimeout):
+            client.get(f"{self.stub.url}/slow")
+        self.assertLess(time.monotonic() - start, 0.25)
+
+    def test_explicit_timeout_wins(self):
+        """A per-request timeout overrides the host timeout"""
+        client = create_client(
+            host_timeouts={"127.0.0.1": 0.1}, retry=RetryPolicy(retries=0), cache=False
+        )
+        self.addCleanup(client.close)
+        response = client.get(f"{self.stub.url}/slow", timeout=2.0)
+        self.assertEqual(response.status_code, 200)
+
+
+class TestTransportCache(unittest.TestCase):
+    """Responses are cached and revalidated following RFC 9111"""
+
+    def setUp(self):
+        self.stub = StubServer()
+        self.addCleanup(self.stub.close)
+        self.timings = []
+        self.client = create_client(retry=FAST_RETRY, hooks=[self.timings.append])
+        self.addCleanup(self.client.close)
+
+    def get(self, path, **kwargs):
+        return self.client.get(f"{self.stub.url}{path}", **kwargs)
+
+    def test_fresh_response_served_from_cache(self):
+        """A response with max-age is reused without a request"""
+        self.stub.route("/a", ok(headers={"Cache-Control": "max-age=60"}))
+        first = self.get("/a")
+        second = self.get("/a")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(self.stub.count("/a"), 1)
+        self.assertEqual(second.headers["Age"], "0")
+        self.assertEqual([t.cache for t in self.timings], ["miss", "hit"])
+
+    def test_stale_response_revalidated(self):
+        """A stale response with an ETag is revalidated and reused on 304"""
+
+        def conditional(headers):
+            if headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"', "Cache-Control": "max-age=60"}
+            return 200, {"ETag": '"v1"', "Cache-Control": "no-cache"}
+
+        self.stub.route("/a", (conditional, None, b"body", 0.0))
+        self.assertEqual(self.get("/a").content, b"body")
+        second = self.get("/a")
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, b"body")
+        self.assertEqual(self.stub.requests[1][2].get("If-None-Match"), '"v1"')
+
+        # The 304 made it fresh for 60 seconds
+        self.assertEqual(self.get("/a").content, b"body")
+        self.assertEqual(self.stub.count("/a"), 2)
+        self.assertEqual(
+            [t.cache for t in self.timings], ["miss", "revalidated", "hit"]
+        )
+
+    def test_expires_and_heuristic_freshness(self):
+        """Expires and Last-Modified give a freshness lifetime"""
+        now = time.time()
+        self.stub.route(
+            "/expires",
+            ok(
+                headers={
+                    "Date": formatdate(now, usegmt=True),
+                    "Expires": formatdate(now + 60, usegmt=True),
+                }
+            ),
+        )
+        self.stub.route(
+            "/modified",
+            ok(headers={"Last-Modified": formatdate(now - 86400, usegmt=True)}),
+        )
+        for path in ("/expires", "/expires", "/modified", "/modified"):
+            self.get(path)
+        self.assertEqual(self.stub.count("/expires"), 1)
+        self.assertEqual(self.stub.count("/modified"), 1)
+
+    def test_uncacheable_responses(self):
+        """no-store, Vary: * and responses without cache headers are not kept"""
+        self.stub.route(
+            "/no-store", ok(headers={"Cache-Control": "no-store, max-age=60"})
+        )
+        self.stub.route(
+            "/vary", ok(headers={"Cache-Control": "max-age=60", "Vary": "*"})
+        )
+        self.stub.route("/plain", ok())
+        for path in ("/no-store", "/vary", "/plain"):
+            self.get(path)
+            self.get(path)
+            self.assertEqual(self.stub.count(path), 2)
+
+    def test_request_directives(self):
+        """Request no-cache revalidates and no-store bypasses the cache"""
+        self.stub.route("/a", ok(headers={"Cache-Control": "max-age=60"}))
+        self.get("/a")
+        self.get("/a", headers={"Cache-Control": "no-cache"})
+        self.get("/a", headers={"Cache-Control": "max-age=0"})
+        self.get("/a", headers={"Cache-Control": "no-store"})
+        self.assertEqual(self.stub.count("/a"), 4)
+
+    def test_vary_headers_must_match(self):
+        """A response varying on a header is only reused for the same value"""
+        self.stub.route(
+            "/a", ok(headers={"Cache-Control": "max-age=60", "Vary": "Accept-Language"})
+        )
+        self.get("/a", headers={"Accept-Language": "en"})
+        self.get("/a", headers={"Accept-Language": "en"})
+        self.get("/a", headers={"Accept-Language": "de"})
+        self.assertEqual(self.stub.count("/a"), 2)
+
+    def test_range_requests_bypass(self):
+        """Partial and caller-conditional requests are not served from cache"""
+        self.stub.route(
+            "/a", ok(headers={"Cache-Control": "max-age=60", "ETag": '"x"'})
+        )
+        self.get("/a")
+        self.get("/a", headers={"Range": "bytes=2-"})
+        self.get("/a", headers={"If-None-Match": '"x"'})
+        self.assertEqual(self.stub.count("/a"), 3)
+
+    def test_unsafe_method_invalidates(self):
+        """A successful POST drops the cached response for its URL"""
+        self.stub.route("/a", ok(headers={"Cache-Control": "max-age=60"}))
+        self.get("/a")
+        self.client.post(f"{self.stub.url}/a", content=b"x")
+        self.get("/a")
+        self.assertEqual(self.stub.count("/a"), 3)
+
+    def test_streamed_body_recorded(self):
+        """A body consumed through a stream is cached once complete"""
+        body = os.urandom(100 * 1024)
+        self.stub.route("/a", ok(body, headers={"Cache-Control": "max-age=60"}))
+        with self.client.stream("GET", f"{self.stub.url}/a") as response:
+            streamed = b"".join(response.iter_bytes(chunk_size=4096))
+        self.assertEqual(streamed, body)
+        self.assertEqual(self.get("/a").content, body)
+        self.assertEqual(self.stub.count("/a"), 1)
+
+    def test_size_limits(self):
+        """Large bodies are not cached and old entries are evicted"""
+        cache = HTTPCache(max_size=2500, max_body_size=1500)
+        client = create_client(cache=cache)
+        self.addCleanup(client.close)
+        headers = {"Cache-Control": "max-age=60"}
+        self.stub.route("/big", ok(b"x" * 2000, headers=headers))
+        for name in ("a", "b", "c"):
+            self.stub.route(f"/{name}", ok(b"y" * 1000, headers=headers))
+            client.get(f"{self.stub.url}/{name}")
+        client.get(f"{self.stub.url}/big")
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 2000)
+        client.get(f"{self.stub.url}/a")
+        self.assertEqual(self.stub.count("/a"), 2)
+
+
+class TestTransportHooks(unittest.TestCase):
+    """Every attempt is reported to global and per-client hooks"""
+
+    def test_global_hook(self):
+        stub = StubServer()
+        self.addCleanup(stub.close)
+        stub.route("/a", (503, {}, b"", 0.0), ok())
+        timings = []
+        add_timing_hook(timings.append)
+        self.addCleanup(remove_timing_hook, timings.append)
+
+        def broken_hook(timing):
+            raise RuntimeError("hook failed")
+
+        client = create_client(retry=FAST_RETRY, hooks=[broken_hook])
+        self.addCleanup(client.close)
+        self.assertEqual(client.get(f"{stub.url}/a").status_code, 200)
+
+        self.assertEqual([(t.status, t.attempt) for t in timings], [(503, 1), (200, 2)])
+        self.assertEqual(timings[0].host, "127.0.0.1")
+        self.assertTrue(all(t.elapsed >= 0 for t in timings))
+
+
+class TestAsyncTransport(unittest.TestCase):
+    """The async client retries and caches like the sync one"""
+
+    def test_retry_and_cache(self):
+        stub = StubServer()
+        self.addCleanup(stub.close)
+        stub.route(
+            "/a", (503, {}, b"", 0.0), ok(headers={"Cache-Control": "max-age=60"})
+        )
+
+        async def run():
+            async with create_async_client(retry=FAST_RETRY) as client:
+                first = await client.get(f"{stub.url}/a")
+                second = await client.get(f"{stub.url}/a")
+                return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.content, b"payload")
+        self.assertEqual(stub.count("/a"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,12 @@
 Unit tests for FastMCP server functionality
 """
 
+import asyncio
+import time
 import unittest
 import sys
 import os
+from unittest import mock
 
 # Add the src directory to the path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -86,5 +89,150 @@ class TestFastMCPServer(unittest.TestCase):
             self.fail(f"Failed to check FastMCP tools: {e}")
 
 
+def tool_function(tool):
+    """The coroutine behind a FastMCP tool"""
+    return getattr(tool, "fn", tool)
+
+
+class TestAPaperAsyncTools(unittest.TestCase):
+    """Concurrent tool calls overlap instead of queuing"""
+
+    DELAY = 0.3
+
+    def test_tools_are_coroutines(self):
+        """Every APaper tool handler is async"""
+        import apaper.server as server
+
+        for name in [
+            "search_iacr_papers",
+            "download_iacr_paper",
+            "download_iacr_papers",
+            "search_dblp_papers",
+            "get_dblp_author_publications",
+            "get_dblp_venue_publications",
+            "search_google_scholar_papers",
+            "expand_google_scholar_citations",
+            "search_all_papers",
+        ]:
+            with self.subTest(tool=name):
+                tool = asyncio.run(server.mcp.get_tool(name))
+                self.assertTrue(asyncio.iscoroutinefunction(tool_function(tool)))
+
+    def test_concurrent_calls_finish_in_time_of_one(self):
+        """Slow blocking and async upstreams do not stall other calls"""
+        import apaper.server as server
+
+        def slow_dblp(query, **kwargs):
+            time.sleep(self.DELAY)
+            return [{"title": query, "dblp_key": "conf/x/1", "authors": ["Alice"]}]
+
+        async def slow_scholar(query, **kwargs):
+            await asyncio.sleep(self.DELAY)
+            return []
+
+        search_dblp = tool_function(server.search_dblp_papers)
+        search_scholar = tool_function(server.search_google_scholar_papers)
+
+        async def run(count):
+            calls = [search_dblp(f"dblp {i}") for i in range(count)]
+            calls += [search_scholar(f"scholar {i}") for i in range(count)]
+            return await asyncio.gather(*calls)
+
+        with mock.patch.object(
+            server.dblp_searcher, "search", side_effect=slow_dblp
+        ), mock.patch.object(
+            server.google_scholar_searcher, "asearch", side_effect=slow_scholar
+        ):
+            start = time.monotonic()
+            results = asyncio.run(run(4))
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(len(results), 8)
+        self.assertIn("**dblp 3**", results[3])
+        self.assertIn("No papers found", results[7])
+        self.assertLess(elapsed, 2 * self.DELAY)
+
+
+class TestAPaperToolOutput(unittest.TestCase):
+    """Markdown by default, JSON on request"""
+
+    def setUp(self):
+        from datetime import datetime
+
+        from apaper.models.paper import Paper
+
+        self.paper = Paper(
+            paper_id="gs_1",
+            title="Zero Knowledge",
+            authors=["Alice", "Bob"],
+            abstract="Proofs",
+            doi="10.1/zk",
+            published_date=datetime(2020, 1, 1),
+            pdf_url="",
+            url="https://example.org/zk",
+            source="google_scholar",
+            citations=7,
+        )
+
+    def search_scholar(self, **kwargs):
+        import apaper.server as server
+
+        search = tool_function(server.search_google_scholar_papers)
+        with mock.patch.object(
+            server.google_scholar_searcher,
+            "asearch",
+            new=mock.AsyncMock(return_value=[self.paper]),
+        ):
+            return asyncio.run(search("zk", **kwargs))
+
+    def test_markdown_is_default(self):
+        """Without output_format the tool answers in Markdown"""
+        result = self.search_scholar()
+        self.assertTrue(
+            result.startswith("Found 1 Google Scholar papers for query 'zk':\n\n")
+        )
+        self.assertIn("1. **Zero Knowledge**\n   - Paper ID: gs_1\n", result)
+        self.assertIn("   - Citations: 7\n   - Year: 2020\n", result)
+
+    def test_json_holds_paper_records(self):
+        """output_format='json' returns Paper.to_dict records"""
+        import json
+
+        result = json.loads(self.search_scholar(year_low="2019", output_format="json"))
+        self.assertEqual(result["query"], "zk")
+        self.assertEqual(result["year_low"], 2019)
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["papers"], [self.paper.to_dict()])
+
+    def test_json_errors_and_paging(self):
+        """Errors and DBLP cursors are JSON fields too"""
+        import json
+
+        import apaper.server as server
+
+        search_dblp = tool_function(server.search_dblp_papers)
+        rows = [{"title": f"T{i}", "dblp_key": f"conf/x/{i}"} for i in range(2)]
+        with mock.patch.object(server.dblp_searcher, "search", return_value=rows):
+            page = json.loads(
+                asyncio.run(
+                    search_dblp("x", max_results=2, cursor="4", output_format="json")
+                )
+            )
+        self.assertEqual(page["results"], rows)
+        self.assertEqual(page["next_cursor"], "6")
+
+        error = json.loads(
+            asyncio.run(search_dblp("x", year_from="soon", output_format="json"))
+        )
+        self.assertIn("Invalid year format", error["error"])
+
+    def test_unknown_format_is_rejected(self):
+        """An unsupported output_format is reported instead of ignored"""
+        result = self.search_scholar(output_format="xml")
+        self.assertEqual(
+            result, "Error: Unknown output_format 'xml'. Use 'markdown' or 'json'."
+        )
+
+
 if __name__ == "__main__":
     unittest.main()